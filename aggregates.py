@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+예측 분포 스트리밍 집계
+
+참가자 시트를 한 장씩(또는 데이터셋 단위로) 더해 가며 분석에 필요한 값만 유지합니다.
+    - 슬롯별 팀 선택 수 (우승 예측 분포 포함)
+    - 선택 슬롯 시나리오 교차표 (예: R1 승자 조합별 GEN 선택)
+    - 팀별 전체 선택 수 (선택 슬롯 제외)
+    - 슬롯별 엔트로피/합의도
+집계끼리는 merge()로 합칠 수 있어 나눠서 파싱한 샤드나 날짜별 결과를 원본 없이 합산합니다.
+모든 Counter는 처음 등장한 순서를 유지하므로 동률 정렬이 원본을 순서대로 센 것과 같습니다.
+
+사용법:
+    python aggregates.py build predictions.jsonl --output day1.agg.json
+    python aggregates.py merge day1.agg.json day2.agg.json --output total.agg.json
+    python aggregates.py show total.agg.json
+"""
+
+import json
+import math
+import sys
+from collections import Counter
+
+from bracket import Bracket
+from jsonl_store import iter_records
+from model import as_dataset
+
+AGGREGATE_FORMAT = 1
+
+
+class PickAggregate:
+    """병합 가능한 예측 분포 집계"""
+
+    def __init__(self, bracket=None, slots=None):
+        bracket = bracket or Bracket()
+        self.slots = list(slots or bracket.slots)
+        # 선택 슬롯 → 시나리오를 결정하는 슬롯들 ('winner:슬롯' 옵션)
+        self.choices = {}
+        for choice, options in bracket.choices.items():
+            sources = [source.split(':', 1)[1] for source in options if source.startswith('winner:')]
+            if choice in self.slots and all(source in self.slots for source in sources):
+                self.choices[choice] = sources
+        self.participants = 0
+        self.slot_counts = {slot: Counter() for slot in self.slots}
+        self.team_totals = Counter()
+        self.scenarios = {choice: {} for choice in self.choices}
+
+    @property
+    def champion_slot(self):
+        return self.slots[-1]
+
+    @property
+    def champion_counts(self):
+        return self.slot_counts[self.champion_slot]
+
+    def add(self, prediction):
+        """시트 한 장 추가 (슬롯 → 팀 dict)"""
+        self.participants += 1
+        for slot in self.slots:
+            team = prediction.get(slot)
+            if not team:
+                continue
+            self.slot_counts[slot][team] += 1
+            if slot not in self.choices:
+                self.team_totals[team] += 1
+
+        for choice, sources in self.choices.items():
+            picks = [prediction.get(source) for source in sources]
+            team = prediction.get(choice)
+            if team and all(picks):
+                self.scenarios[choice].setdefault(tuple(picks), Counter())[team] += 1
+
+    def add_records(self, records):
+        """{'nickname', 'prediction'} 레코드를 순서대로 추가 (JSONL 순회 등)"""
+        for record in records:
+            self.add(record['prediction'])
+        return self
+
+    def add_dataset(self, dataset):
+        """데이터셋 전체를 열 단위로 추가 (시트를 하나씩 더한 것과 같은 결과)"""
+        dataset = as_dataset(dataset)
+        width = dataset.width
+        team_names = dataset.teams.names
+        self.participants += len(dataset)
+
+        first_seen = {}
+        totals = {}
+        for slot in self.slots:
+            if slot not in dataset.slot_index:
+                continue
+            counts = dataset.counts(slot)
+            self.slot_counts[slot].update(counts)
+            if slot in self.choices:
+                continue
+            position = dataset.slot_index[slot]
+            column = dataset.column(slot)
+            for team, count in counts.items():
+                # 행 단위로 셌을 때 처음 등장하는 위치 (팀 순서 유지용)
+                seen = column.find(bytes((dataset.teams.get(team),))) * width + position
+                totals[team] = totals.get(team, 0) + count
+                first_seen[team] = min(first_seen.get(team, seen), seen)
+        self.team_totals.update({team: totals[team] for team in sorted(totals, key=first_seen.get)})
+
+        for choice, sources in self.choices.items():
+            if choice not in dataset.slot_index or not all(source in dataset.slot_index for source in sources):
+                continue
+            columns = [dataset.column(source) for source in sources] + [dataset.column(choice)]
+            scenarios = self.scenarios[choice]
+            for ids, count in Counter(zip(*columns)).items():
+                if all(ids):
+                    picks = tuple(team_names[team_id] for team_id in ids[:-1])
+                    scenarios.setdefault(picks, Counter())[team_names[ids[-1]]] += count
+        return self
+
+    def merge(self, other):
+        """다른 집계를 더함 (슬롯 구성이 같아야 함)"""
+        if other.slots != self.slots:
+            raise ValueError("슬롯 구성이 다른 집계는 합칠 수 없습니다.")
+        self.participants += other.participants
+        for slot, counts in other.slot_counts.items():
+            self.slot_counts[slot].update(counts)
+        self.team_totals.update(other.team_totals)
+        for choice, scenarios in other.scenarios.items():
+            mine = self.scenarios.setdefault(choice, {})
+            for picks, counts in scenarios.items():
+                mine.setdefault(picks, Counter()).update(counts)
+        return self
+
+    def entropy(self, slot):
+        """슬롯 예측 분포의 엔트로피 (bit, 0이면 모두 같은 팀)"""
+        counts = self.slot_counts[slot]
+        total = sum(counts.values())
+        if not total:
+            return 0.0
+        return -sum(count / total * math.log2(count / total) for count in counts.values())
+
+    def consensus(self, slot):
+        """가장 많이 고른 팀의 비율 (0~1)"""
+        counts = self.slot_counts[slot]
+        total = sum(counts.values())
+        return max(counts.values()) / total if total else 0.0
+
+    def to_dict(self):
+        return {
+            'format': AGGREGATE_FORMAT,
+            'slots': self.slots,
+            'choices': self.choices,
+            'participants': self.participants,
+            'slot_counts': {slot: dict(counts) for slot, counts in self.slot_counts.items()},
+            'team_totals': dict(self.team_totals),
+            'scenarios': {
+                choice: [[list(picks), dict(counts)] for picks, counts in scenarios.items()]
+                for choice, scenarios in self.scenarios.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('format') != AGGREGATE_FORMAT:
+            raise ValueError(f"지원하지 않는 집계 형식입니다: {data.get('format')}")
+        aggregate = cls.__new__(cls)
+        aggregate.slots = list(data['slots'])
+        aggregate.choices = {choice: list(sources) for choice, sources in data['choices'].items()}
+        aggregate.participants = data['participants']
+        aggregate.slot_counts = {slot: Counter(counts) for slot, counts in data['slot_counts'].items()}
+        aggregate.team_totals = Counter(data['team_totals'])
+        aggregate.scenarios = {
+            choice: {tuple(picks): Counter(counts) for picks, counts in scenarios}
+            for choice, scenarios in data['scenarios'].items()
+        }
+        return aggregate
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def build_aggregate(predictions_file, bracket=None):
+    """예측 파일(.json/.jsonl/.jsonl.gz)을 한 번 순회하며 집계"""
+    return PickAggregate(bracket).add_records(iter_records(predictions_file))
+
+def print_summary(aggregate):
+    print(f"참가자: {aggregate.participants:,}명")
+    for slot in aggregate.slots:
+        counts = aggregate.slot_counts[slot]
+        top = ', '.join(f"{team} {count:,}" for team, count in counts.most_common(3))
+        print(f"  {slot:<15} 엔트로피 {aggregate.entropy(slot):.2f}bit  "
+              f"합의도 {aggregate.consensus(slot):.1%}  ({top})")
+
+def main():
+    args = sys.argv[1:]
+    output = None
+    if '--output' in args:
+        index = args.index('--output')
+        output = args[index + 1]
+        del args[index:index + 2]
+
+    command, paths = (args[0], args[1:]) if args else (None, [])
+    if command == 'build' and paths:
+        aggregate = PickAggregate()
+        for path in paths:
+            aggregate.add_records(iter_records(path))
+    elif command == 'merge' and paths:
+        aggregate = PickAggregate.load(paths[0])
+        for path in paths[1:]:
+            aggregate.merge(PickAggregate.load(path))
+    elif command == 'show' and paths:
+        aggregate = PickAggregate.load(paths[0])
+    else:
+        print(__doc__.split('사용법:')[1])
+        return
+
+    print_summary(aggregate)
+    if output:
+        aggregate.save(output)
+        print(f"✅ 집계 저장: {output}")
+
+if __name__ == "__main__":
+    main()
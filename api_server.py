@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+LCK 플레이오프 승부예측 JSON API 서버
+
+리더보드, 닉네임별 조회, 생존자 통계, 팀 선택 분포, 브라켓 상태를 JSON으로 제공합니다.
+응답은 결과 버전마다 한 번만 계산해 메모리에 두고, ETag/If-None-Match로
+변경이 없으면 304를 돌려주므로 반복 폴링 비용이 거의 없습니다.
+입력 파일이 바뀌면 작업 스레드에서 새 버전의 응답을 모두 만든 뒤 한 번에 교체하며,
+그동안 이벤트 루프는 이전 버전의 응답으로 계속 요청을 처리합니다.
+
+사용법:
+    python api_server.py [--host 127.0.0.1] [--port 8502] [--page-size 50]
+
+엔드포인트:
+    GET /version
+    GET /leaderboard?page=1          (항목마다 역배 적중/역배 점수 포함)
+    GET /participants/<닉네임>
+    GET /participants/<닉네임>/path[?sole=1]   (남은 결과로 1위가 되는 경로, 처음 요청 때 계산)
+    GET /survivors
+    GET /picks
+    GET /bracket
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from bracket import results_version
+from contrarian import contrarian_scores
+from events import default_event, event_from_argv
+from model import as_dataset
+from path_to_victory import VictorySearch
+from rank_predictors import calculate_scores
+from sqlite_store import is_store_path
+from tournament_tracker import TournamentTracker
+
+STATUS_TEXT = {
+    200: 'OK',
+    304: 'Not Modified',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+}
+
+
+class CachedResponse:
+    """직렬화된 응답 본문과 ETag"""
+    __slots__ = ('body', 'etag')
+
+    def __init__(self, payload):
+        self.body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest()[:16] + '"'
+
+
+class ResponseSet:
+    """결과 버전 하나의 응답 묶음 (만든 뒤 통째로 교체, 닉네임별 응답만 요청 때 채움)"""
+    __slots__ = ('version', 'responses', 'participants', 'participant_responses', 'victory', 'path_responses')
+
+    def __init__(self, version, responses, participants, victory):
+        self.version = version
+        self.responses = responses
+        self.participants = participants
+        self.participant_responses = {}
+        self.victory = victory
+        self.path_responses = {}
+
+
+class PredictionAPI:
+    def __init__(self, predictions_file='predictions.json', results_file='match_result.txt',
+                 page_size=50, check_interval=1.0, bracket=None, event=None):
+        """event를 주면 그 이벤트의 파일과 브라켓을 쓰고, predictions.sqlite가 있으면 대시보드처럼 DB를 읽음"""
+        self.event = event
+        if event is not None:
+            predictions_file, results_file, bracket = event.predictions_file, event.results_file, event.bracket
+        self.predictions_file = predictions_file
+        self.results_file = results_file
+        self.bracket = bracket
+        self.page_size = page_size
+        self.check_interval = check_interval
+        self.fingerprint = None
+        self.last_check = 0.0
+        self.current = None
+        self.rebuilding = None
+        self.refresh(force=True)
+
+    @property
+    def version(self):
+        return self.current.version
+
+    def source_files(self):
+        """(예측 경로, 변경 감지 대상 파일들) - DB가 있으면 DB 경로와 DB/WAL도 포함"""
+        if self.event is None:
+            return self.predictions_file, (self.predictions_file, self.results_file)
+        # 예측 파일 이름은 가장 최근 형식(.json/.jsonl)을 따라 바뀔 수 있음
+        self.predictions_file = self.event.predictions_file
+        store_file = self.event.store_file
+        paths = (self.predictions_file, self.results_file, store_file, f"{store_file}-wal")
+        return (store_file if os.path.exists(store_file) else self.predictions_file), paths
+
+    def file_fingerprint(self):
+        """입력 파일들의 변경 여부 판단용 (mtime, size)"""
+        fingerprint = []
+        for path in self.source_files()[1]:
+            try:
+                stat = os.stat(path)
+                fingerprint.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                fingerprint.append(None)
+        return tuple(fingerprint)
+
+    def changed(self, force=False):
+        """입력 파일이 바뀌었는지 (확인은 check_interval마다 한 번, 바뀌었으면 새 상태를 기억)"""
+        now = time.monotonic()
+        if not force and now - self.last_check < self.check_interval:
+            return False
+        self.last_check = now
+
+        fingerprint = self.file_fingerprint()
+        if not force and fingerprint == self.fingerprint:
+            return False
+        self.fingerprint = fingerprint
+        return True
+
+    def refresh(self, force=False):
+        """파일이 바뀌었으면 이 스레드에서 바로 다시 계산 (초기화/오프라인 사용)"""
+        if self.changed(force):
+            self.current = self.build()
+
+    def schedule_refresh(self):
+        """이벤트 루프용: 파일이 바뀌었으면 작업 스레드에서 다시 계산 (끝날 때까지 이전 응답 사용)"""
+        if self.rebuilding is not None or not self.changed():
+            return
+        self.rebuilding = asyncio.get_running_loop().create_task(self.rebuild())
+
+    async def rebuild(self):
+        try:
+            self.current = await asyncio.to_thread(self.build)
+        except Exception as e:
+            # 다음 확인 때 다시 시도
+            self.fingerprint = None
+            print(f"⚠️ API 응답 갱신 실패 (이전 버전 유지): {e}")
+        finally:
+            self.rebuilding = None
+
+    def build(self):
+        """현재 결과 버전의 모든 응답을 미리 계산한 ResponseSet (self는 바꾸지 않음)"""
+        source = self.source_files()[0]
+        if self.event is not None and is_store_path(source):
+            # 바뀐 파일을 DB에 다시 가져온 뒤 트래커가 DB를 읽음
+            self.event.open_store()
+        tracker = TournamentTracker(source, self.results_file, self.bracket)
+        match_results = tracker.match_results
+        completed_results = {key: value for key, value in match_results.items() if value}
+        dataset = as_dataset(tracker.predictions)
+
+        version = results_version(match_results)
+        ranked_scores = calculate_scores(dataset, completed_results)
+        contrarian, contrarian_hits = contrarian_scores(dataset, completed_results, tracker.bracket)
+        participant_stats, total = tracker.calculate_prediction_stats()
+        stats_by_nickname = {stats['nickname']: stats for stats in participant_stats}
+
+        responses = {}
+        responses['/version'] = CachedResponse({
+            'version': version,
+            'participants': total,
+            'completed_matches': len(completed_results),
+        })
+
+        # 리더보드 (같은 틀린 개수는 같은 순위)
+        entries = []
+        rank = 0
+        previous_wrong = None
+        for position, score in enumerate(ranked_scores, 1):
+            if score.wrong_predictions != previous_wrong:
+                rank = position
+                previous_wrong = score.wrong_predictions
+            entries.append({
+                'rank': rank,
+                'nickname': score.nickname,
+                'wrong_predictions': score.wrong_predictions,
+                'contrarian_hits': round(contrarian_hits[score.index], 3),
+                'contrarian': round(contrarian[score.index], 3),
+            })
+        page_count = max(1, -(-len(entries) // self.page_size))
+        for page in range(1, page_count + 1):
+            start = (page - 1) * self.page_size
+            responses[f'/leaderboard?page={page}'] = CachedResponse({
+                'version': version,
+                'page': page,
+                'page_count': page_count,
+                'page_size': self.page_size,
+                'total': len(entries),
+                'entries': entries[start:start + self.page_size],
+            })
+
+        # 생존자 통계
+        surviving, eliminated, survival_rate, color, status_emoji, status_text = \
+            tracker.create_survivor_display(participant_stats, total)
+        responses['/survivors'] = CachedResponse({
+            'version': version,
+            'total': total,
+            'surviving': surviving,
+            'eliminated': eliminated,
+            'survival_rate': round(survival_rate, 2),
+            'status': status_text,
+            'status_emoji': status_emoji,
+            'color': color,
+        })
+
+        # 슬롯별 팀 선택 분포
+        pick_counts = {
+            slot: dataset.counts(slot) if slot in dataset.slot_index else Counter()
+            for slot in tracker.bracket.slots
+        }
+        responses['/picks'] = CachedResponse({
+            'version': version,
+            'total': len(dataset),
+            'slots': {slot: dict(counter.most_common()) for slot, counter in pick_counts.items()},
+        })
+
+        # 브라켓 상태
+        responses['/bracket'] = CachedResponse({
+            'version': version,
+            'gen_choice': tracker.get_gen_choice_status(),
+            'results': match_results,
+            'matches': tracker.get_all_matches(),
+        })
+
+        # 닉네임별 조회는 요청이 올 때 직렬화 (버전 내에서는 재사용)
+        participants = {}
+        for entry, score in zip(entries, ranked_scores):
+            stats = stats_by_nickname.get(score.nickname, {})
+            participants[score.nickname] = {
+                'version': version,
+                'rank': entry['rank'],
+                'nickname': score.nickname,
+                'wrong_predictions': score.wrong_predictions,
+                'contrarian_hits': entry['contrarian_hits'],
+                'contrarian': entry['contrarian'],
+                'is_eliminated': stats.get('is_eliminated'),
+                'accuracy': stats.get('accuracy'),
+                'prediction': dict(score.prediction),
+            }
+
+        victory = VictorySearch(dataset, completed_results, tracker.bracket)
+        print(f"API 응답 갱신 완료: 버전 {version}, 참가자 {total}명")
+        return ResponseSet(version, responses, participants, victory)
+
+    def lookup(self, target, refresh=True):
+        """요청 경로(+쿼리)에 해당하는 캐시된 응답 반환 (없으면 None)
+
+        refresh=False면 파일 변경을 확인하지 않고 지금 응답 묶음만 봅니다 (이벤트 루프에서 사용).
+        """
+        if refresh:
+            self.refresh()
+        current = self.current
+        parts = urlsplit(target)
+        path = parts.path.rstrip('/') or '/'
+
+        if path == '/leaderboard':
+            page = parse_qs(parts.query).get('page', ['1'])[0]
+            return current.responses.get(f'/leaderboard?page={page}')
+
+        if path.startswith('/participants/') and path.endswith('/path'):
+            nickname = unquote(path[len('/participants/'):-len('/path')])
+            if nickname in current.participants:
+                sole = parse_qs(parts.query).get('sole', ['0'])[0] == '1'
+                return self.path_response(current, nickname, sole)
+
+        if path.startswith('/participants/'):
+            nickname = unquote(path[len('/participants/'):])
+            response = current.participant_responses.get(nickname)
+            if response is None and nickname in current.participants:
+                response = CachedResponse(current.participants[nickname])
+                current.participant_responses[nickname] = response
+            return response
+
+        return current.responses.get(path)
+
+    def path_response(self, current, nickname, sole):
+        """닉네임의 우승 경로 (결과 버전 내에서는 재사용)"""
+        key = (nickname, sole)
+        response = current.path_responses.get(key)
+        if response is None:
+            result = current.victory.find(nickname, sole)
+            response = current.path_responses[key] = CachedResponse({'version': current.version, **result})
+        return response
+
+
+async def handle_connection(api, reader, writer):
+    """HTTP/1.1 연결 처리 (keep-alive 지원, GET만 허용)"""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            try:
+                method, target, _ = request_line.decode('latin-1').split(' ', 2)
+            except ValueError:
+                await send_response(writer, 400, None)
+                break
+
+            if method not in ('GET', 'HEAD'):
+                await send_response(writer, 405, None)
+            else:
+                # 바뀐 파일은 작업 스레드에서 다시 계산하고 지금은 현재 응답으로 답함
+                api.schedule_refresh()
+                response = api.lookup(target, refresh=False)
+                if response is None:
+                    await send_response(writer, 404, None)
+                elif headers.get('if-none-match') == response.etag:
+                    await send_response(writer, 304, response, include_body=False)
+                else:
+                    await send_response(writer, 200, response, include_body=(method == 'GET'))
+
+            if headers.get('connection', '').lower() == 'close':
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def send_response(writer, status, response, include_body=True):
+    """응답 헤더와 본문 전송"""
+    if response is None:
+        body = json.dumps({'error': STATUS_TEXT[status]}).encode('utf-8')
+        etag = None
+    else:
+        body = response.body
+        etag = response.etag
+
+    header_lines = [
+        f"HTTP/1.1 {status} {STATUS_TEXT[status]}",
+        "Content-Type: application/json; charset=utf-8",
+        "Cache-Control: no-cache",
+    ]
+    if etag:
+        header_lines.append(f"ETag: {etag}")
+    if status == 304:
+        header_lines.append("Content-Length: 0")
+    else:
+        header_lines.append(f"Content-Length: {len(body)}")
+
+    writer.write(('\r\n'.join(header_lines) + '\r\n\r\n').encode('latin-1'))
+    if include_body and status != 304:
+        writer.write(body)
+    await writer.drain()
+
+
+async def serve(api, host, port):
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_connection(api, reader, writer), host, port)
+    print(f"API 서버 실행 중: http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LCK 플레이오프 승부예측 JSON API 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8502)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--predictions', default='predictions.json')
+    parser.add_argument('--results', default='match_result.txt')
+    parser.add_argument('--event', help="이벤트 ID (지정하면 해당 이벤트의 파일 사용)")
+    args = parser.parse_args()
+
+    if args.event:
+        api = PredictionAPI(page_size=args.page_size, event=event_from_argv(['--event', args.event]))
+    elif (args.predictions, args.results) == (parser.get_default('predictions'), parser.get_default('results')):
+        # 파일을 따로 지정하지 않으면 기본 이벤트 (대시보드와 같은 데이터, DB가 있으면 DB)
+        api = PredictionAPI(page_size=args.page_size, event=default_event())
+    else:
+        api = PredictionAPI(args.predictions, args.results, page_size=args.page_size)
+    try:
+        asyncio.run(serve(api, args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nAPI 서버를 종료합니다.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+지난 이벤트 아카이브
+
+끝난 이벤트의 예측, 결과, 파싱 실패 내역을 이벤트당 하나의 압축 열 단위 파일로 저장하고
+archive/catalog.json에 목록을 남깁니다. 시즌을 넘나드는 조회는 필요한 열만 읽습니다.
+
+파일 구조 (archive/<이벤트 ID>.lcka):
+    MAGIC
+    헤더 길이 (4바이트, little endian)
+    헤더 JSON   이벤트 정보, 슬롯/팀 목록, 결과, 열별 (오프셋, 압축 길이)
+    열 데이터   열마다 zlib 압축 블록
+        nickname              닉네임 ('\\n' 구분)
+        wrong                 참가자별 틀린 개수 (바이트)
+        pick:<슬롯>            참가자별 팀 ID (바이트, 0은 빈 값, 헤더 teams의 인덱스)
+        failed_nickname       파싱 실패 닉네임 ('\\n' 구분)
+        failed_reason         파싱 실패 사유 ('\\n' 구분)
+
+사용법:
+    python archive.py ingest [--event 이벤트ID]     # 이벤트를 아카이브에 추가 (같은 ID면 교체)
+    python archive.py list
+    python archive.py nickname 닉네임              # 이벤트별 정확도
+    python archive.py bias [T1 GEN]                # 시즌별 팀 쏠림
+    python archive.py repeat [--min 2]             # 여러 번 1위한 참가자
+"""
+
+import json
+import os
+import struct
+import sys
+import zlib
+from collections import defaultdict
+from datetime import datetime
+
+from events import event_from_argv, load_event_data
+from jsonl_store import iter_records
+
+ARCHIVE_DIR = 'archive'
+CATALOG_FILE = 'catalog.json'
+MAGIC = b'LCKARCH1'
+COMPRESSION_LEVEL = 6
+
+
+def archive_path(event_id, archive_dir=ARCHIVE_DIR):
+    return os.path.join(archive_dir, f"{event_id}.lcka")
+
+def _join_text(values):
+    return '\n'.join(value.replace('\n', ' ') for value in values).encode('utf-8')
+
+def _split_text(blob):
+    return blob.decode('utf-8').split('\n') if blob else []
+
+def write_archive(path, header, columns):
+    """헤더와 열을 압축 저장 (임시 파일에 쓴 뒤 교체)"""
+    blobs = []
+    offset = 0
+    layout = {}
+    for name, raw in columns.items():
+        blob = zlib.compress(raw, COMPRESSION_LEVEL)
+        layout[name] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = dict(header, columns=layout)
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<I', len(header_bytes)))
+        f.write(header_bytes)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+    return offset + len(header_bytes) + len(MAGIC) + 4
+
+
+class ArchiveReader:
+    """아카이브 파일 하나 (헤더만 먼저 읽고 열은 요청할 때 읽음)"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"아카이브 파일이 아닙니다: {path}")
+            (header_length,) = struct.unpack('<I', f.read(4))
+            self.header = json.loads(f.read(header_length).decode('utf-8'))
+        self.data_start = len(MAGIC) + 4 + header_length
+        self._columns = {}
+
+    @property
+    def event_id(self):
+        return self.header['event_id']
+
+    @property
+    def teams(self):
+        """팀 ID → 팀명 (0은 None)"""
+        return [None] + self.header['teams']
+
+    def column(self, name):
+        """열 하나를 읽어 압축 해제 (bytes, 없는 열이면 KeyError)"""
+        if name not in self._columns:
+            offset, length = self.header['columns'][name]
+            with open(self.path, 'rb') as f:
+                f.seek(self.data_start + offset)
+                self._columns[name] = zlib.decompress(f.read(length))
+        return self._columns[name]
+
+    def nicknames(self):
+        return _split_text(self.column('nickname'))
+
+    def wrong_counts(self):
+        return self.column('wrong')
+
+    def picks(self, slot):
+        return self.column(f"pick:{slot}")
+
+    def failures(self):
+        return list(zip(_split_text(self.column('failed_nickname')),
+                        _split_text(self.column('failed_reason'))))
+
+
+def load_catalog(archive_dir=ARCHIVE_DIR):
+    try:
+        with open(os.path.join(archive_dir, CATALOG_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'events': {}}
+
+def save_catalog(catalog, archive_dir=ARCHIVE_DIR):
+    path = os.path.join(archive_dir, CATALOG_FILE)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+def load_failures(event):
+    """이벤트의 파싱 실패 목록 (파일이 없으면 빈 목록)"""
+    try:
+        return list(iter_records(event.record_file('failed_predictions')))
+    except FileNotFoundError:
+        return []
+
+def ingest_event(event, archive_dir=ARCHIVE_DIR, season=None):
+    """이벤트 하나를 아카이브 파일로 저장하고 카탈로그 갱신"""
+    data = load_event_data(event)
+    dataset = data.dataset
+    bracket = event.bracket
+    failures = load_failures(event)
+
+    completed = sum(1 for match in bracket.match_keys if data.match_results.get(match))
+    columns = {
+        'nickname': _join_text(dataset.nicknames),
+        'wrong': bytes(data.wrong_counts),
+        'failed_nickname': _join_text(failure['nickname'] for failure in failures),
+        'failed_reason': _join_text(failure.get('reason', '') for failure in failures),
+    }
+    for slot in dataset.slots:
+        columns[f"pick:{slot}"] = dataset.column(slot)
+
+    champion_slot = bracket.slots[-1]
+    header = {
+        'event_id': event.id,
+        'title': event.title,
+        'season': season or event.season,
+        'archived_at': datetime.now().isoformat(timespec='seconds'),
+        'participants': len(dataset),
+        'failures': len(failures),
+        'slots': list(dataset.slots),
+        'match_keys': list(bracket.match_keys),
+        'champion_slot': champion_slot,
+        'teams': dataset.teams.names[1:],
+        'results': data.match_results,
+        'completed_matches': completed,
+    }
+
+    os.makedirs(archive_dir, exist_ok=True)
+    path = archive_path(event.id, archive_dir)
+    size = write_archive(path, header, columns)
+
+    catalog = load_catalog(archive_dir)
+    catalog['events'][event.id] = {
+        'title': event.title,
+        'season': header['season'],
+        'file': os.path.basename(path),
+        'participants': len(dataset),
+        'failures': len(failures),
+        'completed_matches': completed,
+        'champion': data.match_results.get(champion_slot),
+        'archived_at': header['archived_at'],
+        'bytes': size,
+    }
+    save_catalog(catalog, archive_dir)
+    return path, size
+
+def open_archives(archive_dir=ARCHIVE_DIR):
+    """카탈로그 순서(시즌, 이벤트 ID)대로 아카이브 리더 목록"""
+    catalog = load_catalog(archive_dir)
+    entries = sorted(catalog['events'].items(), key=lambda item: (item[1]['season'], item[0]))
+    return [ArchiveReader(os.path.join(archive_dir, entry['file'])) for _, entry in entries]
+
+def nickname_history(nickname, archive_dir=ARCHIVE_DIR):
+    """이벤트별 참가 기록 (닉네임, 틀린 개수 열만 읽음)"""
+    history = []
+    for reader in open_archives(archive_dir):
+        nicknames = reader.nicknames()
+        if nickname not in nicknames:
+            continue
+        wrong_counts = reader.wrong_counts()
+        wrong = wrong_counts[nicknames.index(nickname)]
+        completed = reader.header['completed_matches']
+        rank = 1 + sum(1 for other in wrong_counts if other < wrong)
+        history.append({
+            'event_id': reader.event_id,
+            'season': reader.header['season'],
+            'wrong': wrong,
+            'completed_matches': completed,
+            'accuracy': (completed - wrong) / completed if completed else None,
+            'rank': rank,
+            'participants': reader.header['participants'],
+        })
+    return history
+
+def crowd_bias(teams=('T1', 'GEN'), archive_dir=ARCHIVE_DIR):
+    """이벤트별 팀 선택 비율 (우승 예측 비율 + 전체 경기 예측 중 비율, 해당 pick 열만 읽음)"""
+    rows = []
+    for reader in open_archives(archive_dir):
+        team_ids = {name: team_id for team_id, name in enumerate(reader.teams) if name}
+        champion_column = reader.picks(reader.header['champion_slot'])
+        match_columns = [reader.picks(slot) for slot in reader.header['match_keys']]
+        total_picks = sum(len(column) - column.count(0) for column in match_columns)
+        champion_total = len(champion_column) - champion_column.count(0)
+
+        row = {
+            'event_id': reader.event_id,
+            'season': reader.header['season'],
+            'champion': reader.header['results'].get(reader.header['champion_slot']),
+            'teams': {},
+        }
+        for team in teams:
+            team_id = team_ids.get(team)
+            marker = bytes((team_id,)) if team_id else None
+            picks = sum(column.count(marker) for column in match_columns) if marker else 0
+            champion_picks = champion_column.count(marker) if marker else 0
+            row['teams'][team] = {
+                'pick_share': picks / total_picks if total_picks else 0.0,
+                'champion_share': champion_picks / champion_total if champion_total else 0.0,
+            }
+        rows.append(row)
+    return rows
+
+def repeat_winners(min_wins=2, archive_dir=ARCHIVE_DIR):
+    """여러 이벤트에서 1위(최소 틀린 개수, 공동 포함)를 한 닉네임"""
+    wins = defaultdict(list)
+    for reader in open_archives(archive_dir):
+        wrong_counts = reader.wrong_counts()
+        if not wrong_counts:
+            continue
+        best = min(wrong_counts)
+        nicknames = reader.nicknames()
+        index = wrong_counts.find(bytes((best,)))
+        while index >= 0:
+            wins[nicknames[index]].append(reader.event_id)
+            index = wrong_counts.find(bytes((best,)), index + 1)
+    repeated = [(nickname, event_ids) for nickname, event_ids in wins.items() if len(event_ids) >= min_wins]
+    return sorted(repeated, key=lambda item: (-len(item[1]), item[0]))
+
+def main():
+    args = sys.argv[1:]
+    command = args[0] if args else None
+
+    if command == 'ingest':
+        event = event_from_argv(args)
+        path, size = ingest_event(event)
+        print(f"✅ {event.id} 아카이브 저장: {path} ({size:,} bytes)")
+
+    elif command == 'list':
+        catalog = load_catalog()
+        if not catalog['events']:
+            print("아카이브된 이벤트가 없습니다.")
+        for event_id, entry in sorted(catalog['events'].items(), key=lambda item: (item[1]['season'], item[0])):
+            print(f"{event_id:<24} {entry['title']:<24} 참가자 {entry['participants']:>6,}명  "
+                  f"우승 {entry['champion'] or '-':<5} {entry['bytes']:>10,} bytes")
+
+    elif command == 'nickname' and len(args) >= 2:
+        history = nickname_history(args[1])
+        if not history:
+            print(f"'{args[1]}' 참가 기록이 없습니다.")
+        for entry in history:
+            accuracy = f"{entry['accuracy']:.1%}" if entry['accuracy'] is not None else "-"
+            print(f"{entry['event_id']:<24} 정확도 {accuracy:>6}  틀림 {entry['wrong']}개  "
+                  f"{entry['rank']}위/{entry['participants']}명")
+
+    elif command == 'bias':
+        teams = args[1:] or ['T1', 'GEN']
+        for row in crowd_bias(teams):
+            shares = '  '.join(
+                f"{team} 우승예측 {share['champion_share']:.1%} / 전체 {share['pick_share']:.1%}"
+                for team, share in row['teams'].items()
+            )
+            print(f"{row['season']:<24} {shares}  (실제 우승: {row['champion'] or '-'})")
+
+    elif command == 'repeat':
+        min_wins = int(args[args.index('--min') + 1]) if '--min' in args else 2
+        winners = repeat_winners(min_wins)
+        if not winners:
+            print(f"{min_wins}회 이상 1위한 참가자가 없습니다.")
+        for nickname, event_ids in winners:
+            print(f"{nickname}: {len(event_ids)}회 ({', '.join(event_ids)})")
+
+    else:
+        print(__doc__.split('사용법:')[1])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+엔드투엔드 벤치마크
+
+synthetic_data로 규모별 합성 이벤트를 만들고 파싱 → 점수 계산 → 통계 →
+분석 리포트 → 대시보드 통계 경로를 단계별로 측정합니다.
+처리량(참가자/초)과 최대 메모리를 기록하고, 이전 실행과 비교해 느려진 단계를 표시합니다.
+
+사용법:
+    python bench_e2e.py [--scales 166,1000,10000,100000] [--output bench_results.json]
+    python bench_e2e.py --scales 1000000 --no-memory      # 대규모는 메모리 측정 생략 가능
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from dashboard_render import compute_dashboard_stats
+from lck_playoff_analyzer import TournamentAnalyzer
+from lck_playoff_parser import parse_pgr21_comments
+from rank_predictors import calculate_scores, load_data
+from synthetic_data import write_event
+from tournament_tracker import TournamentTracker
+
+DEFAULT_SCALES = [166, 1000, 10000, 100000]
+# 이전 실행 대비 처리량이 이 비율 이상 떨어지면 회귀로 표시
+REGRESSION_THRESHOLD = 0.2
+# 이보다 짧은 단계는 측정 잡음이 커서 회귀 판정에서 제외
+MIN_REGRESSION_SECONDS = 0.005
+
+ANALYZER_REPORTS = [
+    ('list_nicknames', ()),
+    ('championship_predictions', ()),
+    ('match_predictions', ('R1 M1', 'R1 M1')),
+    ('match_predictions', ('R1 M2', 'R1 M2')),
+    ('match_predictions', ('R2 M1', 'R2 M1')),
+    ('match_predictions', ('R2 M2', 'R2 M2')),
+    ('gen_choice_analysis', ()),
+    ('team_statistics', ()),
+    ('round_analysis', ('R1',)),
+    ('round_analysis', ('R2',)),
+    ('round_analysis', ('R3',)),
+    ('round_analysis', ('LB',)),
+    ('round_analysis', ('FINAL',)),
+]
+
+def measure(func, track_memory):
+    """함수를 한 번 실행하여 (결과, 소요 시간 초, 최대 메모리 바이트) 반환"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func()
+    elapsed = time.perf_counter() - start
+
+    peak = None
+    if track_memory:
+        tracemalloc.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+def run_scale(scale, seed, track_memory, workdir):
+    """한 규모에 대해 모든 단계를 측정"""
+    event_dir = os.path.join(workdir, f"scale_{scale}")
+    comments, _, _ = write_event(event_dir, scale, seed, completed_matches=6)
+    predictions_file = os.path.join(event_dir, 'predictions.json')
+    results_file = os.path.join(event_dir, 'match_result.txt')
+
+    stages = []
+
+    def record(name, func, items):
+        result, elapsed, peak = measure(func, track_memory)
+        stages.append({
+            'stage': name,
+            'seconds': round(elapsed, 6),
+            'items': items,
+            'throughput': round(items / elapsed, 1) if elapsed > 0 else None,
+            'peak_memory_bytes': peak,
+        })
+        return result
+
+    results, _, _, total_users = record('parse_pgr21_comments', lambda: parse_pgr21_comments(comments), scale)
+    participants = len(results)
+
+    predictions, match_results = load_data(predictions_file, results_file)
+    record('calculate_scores', lambda: calculate_scores(predictions, match_results), participants)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracker = TournamentTracker(predictions_file, results_file)
+    record('calculate_prediction_stats', tracker.calculate_prediction_stats, participants)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzer = TournamentAnalyzer(predictions_file)
+    for method, args in ANALYZER_REPORTS:
+        label = f"analyzer.{method}" + (f"({args[0]})" if args else "")
+        record(label, lambda: getattr(analyzer, method)(*args), participants)
+
+    dashboard_results = dict(tracker.match_results)
+    record('dashboard_stats', lambda: compute_dashboard_stats(predictions, dashboard_results), participants)
+
+    return {
+        'scale': scale,
+        'comments': total_users,
+        'participants': participants,
+        'stages': stages,
+    }
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def find_regressions(run, previous):
+    """이전 실행과 같은 규모/단계의 처리량을 비교"""
+    if not previous:
+        return []
+    previous_stages = {
+        (scale['scale'], stage['stage']): stage
+        for scale in previous['scales'] for stage in scale['stages']
+    }
+    regressions = []
+    for scale in run['scales']:
+        for stage in scale['stages']:
+            before = previous_stages.get((scale['scale'], stage['stage']))
+            if not before or not before.get('throughput') or not stage.get('throughput'):
+                continue
+            if max(before['seconds'], stage['seconds']) < MIN_REGRESSION_SECONDS:
+                continue
+            change = stage['throughput'] / before['throughput'] - 1
+            if change < -REGRESSION_THRESHOLD:
+                regressions.append({
+                    'scale': scale['scale'],
+                    'stage': stage['stage'],
+                    'previous_throughput': before['throughput'],
+                    'throughput': stage['throughput'],
+                    'change': round(change, 3),
+                })
+    return regressions
+
+def load_history(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'runs': []}
+
+def print_scale(result):
+    print(f"\n[규모 {result['scale']:,}] 댓글 {result['comments']:,}개, 참가자 {result['participants']:,}명")
+    for stage in result['stages']:
+        memory = stage['peak_memory_bytes']
+        memory_text = f"{memory / 1024 / 1024:8.1f}MB" if memory is not None else "       -"
+        print(f"  {stage['stage']:<40} {stage['seconds'] * 1000:10.1f}ms "
+              f"{stage['throughput'] or 0:14,.0f}/s {memory_text}")
+
+def main():
+    parser = argparse.ArgumentParser(description="엔드투엔드 벤치마크")
+    parser.add_argument('--scales', default=','.join(str(scale) for scale in DEFAULT_SCALES))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--no-memory', action='store_true', help="tracemalloc 측정 생략")
+    args = parser.parse_args()
+
+    scales = [int(scale) for scale in args.scales.split(',') if scale.strip()]
+    history = load_history(args.output)
+    previous = history['runs'][-1] if history['runs'] else None
+
+    run = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'scales': [],
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for scale in scales:
+            result = run_scale(scale, args.seed, not args.no_memory, workdir)
+            run['scales'].append(result)
+            print_scale(result)
+
+    run['regressions'] = find_regressions(run, previous)
+    history['runs'].append(run)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(history, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {args.output}")
+
+    if run['regressions']:
+        print(f"\n⚠️ 이전 실행 대비 {REGRESSION_THRESHOLD:.0%} 이상 느려진 단계:")
+        for regression in run['regressions']:
+            print(f"  - [{regression['scale']:,}] {regression['stage']}: "
+                  f"{regression['previous_throughput']:,.0f}/s → {regression['throughput']:,.0f}/s")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+CLI 도구 import 시간 벤치마크
+
+각 모듈을 새 인터프리터에서 import하는 데 걸리는 시간을 반복 측정합니다
+(빈 인터프리터 시작 시간을 뺀 최솟값). 잡음은 시간을 늘리기만 하므로 최솟값이 실제 비용에 가장 가깝습니다.
+cron/봇에서 매 경기마다 여러 번 실행되는 도구들의 시작 시간이 나빠지지 않았는지 확인하는 용도입니다.
+
+무거운 패키지(plotly, pandas 등)를 불러오면 항상 실패(종료 코드 1)입니다.
+시간 예산 초과는 측정 환경에 따라 흔들리므로 경고만 하고, --strict일 때만 실패로 처리합니다.
+
+사용법:
+    python bench_imports.py [--repeat 7] [--strict] [--json bench_imports.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+# 모듈별 import 시간 예산 (ms, 인터프리터 시작 시간 제외)
+# 측정 잡음을 감안한 값으로, 무거운 import가 끼어드는 회귀 자체는 FORBIDDEN_MODULES 검사가 잡음
+BUDGETS_MS = {
+    'bracket': 20,
+    'data_cache': 40,
+    'rank_predictors': 50,
+    'lck_playoff_parser': 50,
+    'lck_playoff_analyzer': 60,
+    'update_match': 60,
+    'tournament_tracker': 60,
+}
+
+# 위 도구들이 시작할 때 불러오면 안 되는 패키지
+FORBIDDEN_MODULES = ['plotly', 'pandas', 'numpy', 'streamlit']
+
+CHECK_SCRIPT = """
+import sys
+import {module}
+print(','.join(name for name in {forbidden!r} if name in sys.modules))
+"""
+
+def run_python(code):
+    """새 인터프리터에서 코드를 실행하고 (소요 시간 ms, stdout) 반환"""
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip())
+    return elapsed, completed.stdout.strip()
+
+def measure(module, repeat):
+    """모듈 import 시간 최솟값(ms)과 불러온 금지 패키지 목록"""
+    code = CHECK_SCRIPT.format(module=module, forbidden=FORBIDDEN_MODULES)
+    timings = []
+    loaded = ''
+    for _ in range(repeat):
+        elapsed, loaded = run_python(code)
+        timings.append(elapsed)
+    return min(timings), [name for name in loaded.split(',') if name]
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI 도구 import 시간 벤치마크")
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--strict', action='store_true', help="시간 예산 초과도 실패로 처리")
+    parser.add_argument('--json', help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    baseline = min(run_python('pass')[0] for _ in range(args.repeat))
+    print(f"인터프리터 시작 시간 (기준): {baseline:.1f}ms")
+    print("-" * 60)
+
+    results = []
+    heavy = False
+    over_budget = False
+    for module, budget in BUDGETS_MS.items():
+        total, loaded = measure(module, args.repeat)
+        import_ms = max(0.0, total - baseline)
+        within_budget = import_ms <= budget
+        ok = within_budget and not loaded
+        heavy = heavy or bool(loaded)
+        over_budget = over_budget or not within_budget
+        mark = "❌" if loaded else ("✅" if within_budget else "⚠️")
+        extra = f" (불러온 무거운 패키지: {', '.join(loaded)})" if loaded else ""
+        print(f"{mark} {module:<22} {import_ms:6.1f}ms / 예산 {budget}ms{extra}")
+        results.append({
+            'module': module,
+            'import_ms': round(import_ms, 2),
+            'budget_ms': budget,
+            'within_budget': within_budget,
+            'forbidden_loaded': loaded,
+            'ok': ok,
+        })
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'baseline_ms': round(baseline, 2), 'results': results}, f, ensure_ascii=False, indent=2)
+
+    if heavy:
+        print("\n❌ 시작할 때 무거운 패키지를 불러오는 모듈이 있습니다 (필요한 곳에서만 import 하세요).")
+        sys.exit(1)
+    if over_budget:
+        print("\n⚠️ import 시간 예산을 넘은 모듈이 있습니다 (반복 횟수를 늘려 다시 확인하세요).")
+        if args.strict:
+            sys.exit(1)
+        return
+    print("\n모든 모듈이 예산 안에서 시작됩니다.")
+
+if __name__ == "__main__":
+    main()
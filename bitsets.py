@@ -0,0 +1,175 @@
+"""
+참가자 비트맵 인덱스
+
+슬롯마다 (팀 → 그 팀을 고른 참가자 비트맵)을 한 번만 만들어 두면
+경기 결과 조합 하나를 채점하는 일이 큰 정수 몇 개의 AND/OR와 popcount로 끝납니다.
+비트 i는 데이터셋의 i번째 참가자입니다 (Python int를 비트 배열로 사용).
+
+틀린 개수는 비트 평면(bit-sliced counter)으로 셉니다. 평면 k는 틀린 개수의 k번째 비트이고
+경기마다 "틀린 참가자" 비트맵을 이진 덧셈으로 더하므로 참가자 수와 무관하게 평면 몇 개만 다룹니다.
+
+생존자(완료된 경기를 하나도 틀리지 않은 참가자)는 SurvivorEngine으로 구합니다.
+실제 승자를 고른(또는 비워 둔) 참가자 비트맵의 AND이므로 수는 popcount, 목록은 비트 스캔입니다.
+survivor_engine()은 같은 데이터셋 객체에 대해 엔진을 하나만 만들어 여러 세션/도구가 공유합니다.
+"""
+
+import heapq
+from itertools import islice
+
+from bracket import Bracket
+from data_cache import LRUCache
+from model import MISSING, as_dataset
+
+ENGINE_CACHE_SIZE = 8
+
+
+def popcount(bits):
+    return bits.bit_count()
+
+def iter_bits(bits):
+    """켜진 비트 위치를 작은 것부터 순회 (문자열 한 번 변환으로 O(n))"""
+    digits = bin(bits)[:1:-1]
+    index = digits.find('1')
+    while index >= 0:
+        yield index
+        index = digits.find('1', index + 1)
+
+def column_bitmap(column, value):
+    """열(bytes)에서 값이 value인 위치의 비트맵"""
+    if not column:
+        return 0
+    table = bytearray(b'0' * 256)
+    table[value] = ord('1')
+    return int(column.translate(table)[::-1], 2)
+
+
+class PickBitsets:
+    """슬롯별 팀 선택 비트맵 (예측 데이터가 바뀌지 않는 동안 재사용)"""
+    __slots__ = ('size', 'everyone', 'nicknames', 'picks', 'missing')
+
+    def __init__(self, dataset, slots=None):
+        dataset = as_dataset(dataset)
+        names = dataset.teams.names
+        self.size = len(dataset)
+        self.everyone = (1 << self.size) - 1
+        self.nicknames = dataset.nicknames
+        self.picks = {}
+        self.missing = {}
+        for slot in slots or dataset.slots:
+            if slot not in dataset.slot_index:
+                continue
+            column = dataset.column(slot)
+            self.picks[slot] = {
+                names[team_id]: column_bitmap(column, team_id)
+                for team_id in sorted(set(column)) if team_id != MISSING
+            }
+            self.missing[slot] = column_bitmap(column, MISSING)
+
+    def picked(self, slot, team):
+        """slot에서 team을 고른 참가자"""
+        return self.picks.get(slot, {}).get(team, 0)
+
+    def wrong(self, slot, winner):
+        """slot 결과가 winner일 때 틀린 참가자 (예측을 비운 참가자는 틀리지 않은 것으로 봄)"""
+        if slot not in self.picks:
+            return 0
+        return self.everyone & ~(self.picked(slot, winner) | self.missing[slot])
+
+    def wrong_planes(self, match_results, slots):
+        """결과가 있는 슬롯들의 틀린 개수를 비트 평면 목록으로 계산"""
+        planes = []
+        for slot in slots:
+            winner = match_results.get(slot)
+            if not winner:
+                continue
+            carry = self.wrong(slot, winner)
+            for level, plane in enumerate(planes):
+                if not carry:
+                    break
+                planes[level], carry = plane ^ carry, plane & carry
+            if carry:
+                planes.append(carry)
+        return planes
+
+    def with_wrong(self, planes, count):
+        """틀린 개수가 정확히 count인 참가자"""
+        if count >> len(planes):
+            return 0
+        bits = self.everyone
+        for level, plane in enumerate(planes):
+            bits &= plane if count >> level & 1 else ~plane
+        return bits
+
+    def histogram(self, planes):
+        """틀린 개수별 참가자 수 (0부터 최댓값까지)"""
+        counts = [popcount(self.with_wrong(planes, count)) for count in range(1 << len(planes))]
+        while len(counts) > 1 and not counts[-1]:
+            counts.pop()
+        return counts if self.size else []
+
+    def leaders(self, planes, limit):
+        """틀린 개수가 적은 순 (동률은 닉네임 순) 상위 참가자 [(순위, 닉네임, 틀린 개수)]"""
+        leaders = []
+        ranked = 0
+        for count in range(1 << len(planes)):
+            if len(leaders) >= limit:
+                break
+            bits = self.with_wrong(planes, count)
+            nicknames = heapq.nsmallest(limit - len(leaders), (self.nicknames[row] for row in iter_bits(bits)))
+            leaders.extend((ranked + 1, nickname, count) for nickname in nicknames)
+            ranked += popcount(bits)
+        return leaders
+
+
+class SurvivorEngine:
+    """완료된 경기 결과로 생존자 비트맵 계산"""
+    __slots__ = ('bitsets', 'match_keys')
+
+    def __init__(self, bitsets, match_keys):
+        self.bitsets = bitsets
+        self.match_keys = list(match_keys)
+
+    def survivors(self, match_results):
+        """결과가 나온 경기를 모두 맞힌 참가자 비트맵"""
+        bits = self.bitsets.everyone
+        for slot in self.match_keys:
+            winner = match_results.get(slot)
+            if winner:
+                bits &= ~self.bitsets.wrong(slot, winner)
+        return bits
+
+    def count(self, match_results):
+        return popcount(self.survivors(match_results))
+
+    def nicknames(self, match_results, limit=None):
+        """생존자 닉네임 (참가자 순서, limit개까지)"""
+        nicknames = self.bitsets.nicknames
+        return [nicknames[row] for row in islice(iter_bits(self.survivors(match_results)), limit)]
+
+    def flags(self, match_results):
+        """참가자 순서대로 생존 여부 (bytes, 1이면 생존)"""
+        size = self.bitsets.size
+        if not size:
+            return b''
+        digits = format(self.survivors(match_results), f'0{size}b')[::-1]
+        return digits.encode('ascii').translate(bytes.maketrans(b'01', b'\x00\x01'))
+
+
+_engines = LRUCache(ENGINE_CACHE_SIZE)
+
+
+def survivor_engine(predictions, bracket=None):
+    """예측 데이터(데이터셋 또는 레코드 목록)별로 공유되는 생존자 엔진
+
+    data_cache.load_predictions는 파일이 그대로면 같은 데이터셋 객체를 돌려주므로
+    대시보드 세션, 트래커, API 서버가 비트맵을 한 번만 만들어 함께 씁니다.
+    """
+    bracket = bracket or Bracket()
+    # 캐시가 원본 객체를 붙잡고 있으므로 id가 다른 객체에 재사용되지 않음
+    key = (id(predictions), tuple(bracket.slots), tuple(bracket.match_keys))
+    cached = _engines.get(key)
+    if cached is not None and cached[0] is predictions:
+        return cached[1]
+    engine = SurvivorEngine(PickBitsets(as_dataset(predictions), bracket.slots), bracket.match_keys)
+    _engines.put(key, (predictions, engine))
+    return engine
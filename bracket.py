@@ -0,0 +1,155 @@
+"""
+LCK 플레이오프 브라켓 정의 및 대진 계산
+"""
+
+import hashlib
+
+SLOT_KEYS = [
+    'R1 M1', 'R1 M2', 'GEN이 고른 팀', 'R2 M1', 'R2 M2',
+    'R1 LB', 'R2 LB', 'R3 UB', 'R3 LB', 'R4 LF', 'Grand Final'
+]
+UNDECIDED = '미정'
+
+# 팀 소스 표기법
+#   'T1'             : 고정 팀
+#   'winner:R1 M1'   : 해당 경기 승자
+#   'loser:R1 M1'    : 해당 경기 패자
+#   'choice:슬롯'    : 선택 슬롯에서 고른 팀
+#   'unchosen:슬롯'  : 선택 슬롯에서 고르지 않은 팀
+LCK_2025_BRACKET = {
+    'teams': ['T1', 'DK', 'KT', 'BFX', 'GEN', 'HLE'],
+    'slots': SLOT_KEYS,
+    'choices': {
+        'GEN이 고른 팀': ['winner:R1 M1', 'winner:R1 M2']
+    },
+    'matches': {
+        'R1 M1': {'title': 'R1 M1', 'team1': 'T1', 'team2': 'DK'},
+        'R1 M2': {'title': 'R1 M2', 'team1': 'KT', 'team2': 'BFX'},
+        'R2 M1': {'title': 'R2 M1 (승자조)', 'team1': 'GEN', 'team2': 'choice:GEN이 고른 팀'},
+        'R2 M2': {'title': 'R2 M2 (승자조)', 'team1': 'HLE', 'team2': 'unchosen:GEN이 고른 팀'},
+        'R1 LB': {'title': 'R1 LB (패자조)', 'team1': 'loser:R1 M1', 'team2': 'loser:R1 M2'},
+        'R2 LB': {'title': 'R2 LB (패자조)', 'team1': 'loser:R2 M2', 'team2': 'winner:R1 LB'},
+        'R3 UB': {'title': 'R3 UB (승자조 결승)', 'team1': 'winner:R2 M1', 'team2': 'winner:R2 M2'},
+        'R3 LB': {'title': 'R3 LB (패자조)', 'team1': 'loser:R2 M1', 'team2': 'winner:R2 LB'},
+        'R4 LF': {'title': 'R4 LF (패자조 결승)', 'team1': 'loser:R3 UB', 'team2': 'winner:R3 LB'},
+        'Grand Final': {'title': 'Grand Final', 'team1': 'winner:R3 UB', 'team2': 'winner:R4 LF'},
+    },
+    # 대시보드 브라켓 배치 (섹션 > 컬럼 > 경기)
+    'layout': [
+        {'title': '🏆 승자조 대진표', 'columns': [
+            {'title': '1라운드', 'matches': ['R1 M1', 'R1 M2']},
+            {'title': '2라운드', 'matches': ['R2 M1', 'R2 M2']},
+            {'title': '승자조 결승', 'matches': ['R3 UB']},
+        ]},
+        {'title': '⚔️ 패자조 대진표', 'columns': [
+            {'title': '패자조 1R', 'matches': ['R1 LB']},
+            {'title': '패자조 2R', 'matches': ['R2 LB']},
+            {'title': '패자조 3R', 'matches': ['R3 LB']},
+            {'title': '패자조 결승', 'matches': ['R4 LF']},
+        ]},
+        {'title': '🏆 GRAND FINAL', 'widths': [1, 2, 1], 'columns': [
+            {'title': None, 'matches': []},
+            {'title': None, 'matches': ['Grand Final']},
+            {'title': None, 'matches': []},
+        ]},
+    ],
+}
+
+
+class Bracket:
+    def __init__(self, definition=None):
+        definition = definition or LCK_2025_BRACKET
+        self.definition = definition
+        self.teams = list(definition['teams'])
+        self.slots = list(definition['slots'])
+        self.choices = definition.get('choices', {})
+        self.matches = definition['matches']
+        self.layout = definition.get('layout', [])
+        # 실제 경기 슬롯 (선택 슬롯 제외, 슬롯 순서 유지)
+        self.match_keys = [slot for slot in self.slots if slot in self.matches]
+
+    def resolve(self, source, results):
+        """팀 소스 표기를 실제 팀명으로 변환 (미정이면 None)"""
+        if ':' not in source:
+            return source
+
+        kind, ref = source.split(':', 1)
+        if kind == 'winner':
+            return results.get(ref) or None
+
+        if kind == 'loser':
+            team1, team2 = self.match_teams(ref, results)
+            winner = results.get(ref)
+            if not (team1 and team2 and winner):
+                return None
+            if winner == team1:
+                return team2
+            if winner == team2:
+                return team1
+            return None
+
+        chosen = results.get(ref)
+        if kind == 'choice':
+            return chosen or None
+        if kind == 'unchosen':
+            options = [self.resolve(option, results) for option in self.choices[ref]]
+            if not chosen or not all(options):
+                return None
+            for option in options:
+                if option != chosen:
+                    return option
+            return None
+
+        raise ValueError(f"알 수 없는 팀 소스: {source}")
+
+    def match_teams(self, match_key, results):
+        """경기의 두 팀 반환 (미정인 쪽은 None)"""
+        match = self.matches[match_key]
+        return self.resolve(match['team1'], results), self.resolve(match['team2'], results)
+
+    def slot_options(self, slot, results):
+        """슬롯에 입력 가능한 팀 목록 (대진 미확정이면 None)"""
+        if slot in self.choices:
+            options = [self.resolve(option, results) for option in self.choices[slot]]
+        else:
+            options = list(self.match_teams(slot, results))
+        if not all(options):
+            return None
+        return options
+
+    def cards(self, results):
+        """대시보드 카드용 경기별 대진 (미정 팀은 '미정', 대진 확정 전 승자는 None)"""
+        cards = {}
+        for match_key in self.match_keys:
+            team1, team2 = self.match_teams(match_key, results)
+            cards[match_key] = {
+                'match_id': match_key,
+                'team1': team1 or UNDECIDED,
+                'team2': team2 or UNDECIDED,
+                'winner': (results.get(match_key) or None) if team1 and team2 else None,
+            }
+        return cards
+
+    def validate(self, results, slots=None):
+        """경기 결과가 대진과 일관되는지 검사하고 오류 메시지 목록 반환 (slots를 주면 그 슬롯만)"""
+        errors = []
+        for slot in slots or self.slots:
+            value = results.get(slot)
+            if not value:
+                continue
+            if value not in self.teams:
+                errors.append(f"{slot}: 알 수 없는 팀 '{value}'")
+                continue
+            options = self.slot_options(slot, results)
+            if options is None:
+                errors.append(f"{slot}: 대진이 확정되지 않았는데 결과 '{value}'가 입력됨")
+            elif value not in options:
+                errors.append(f"{slot}: '{value}'는 가능한 팀({', '.join(options)})이 아님")
+        return errors
+
+
+def results_version(match_results):
+    """경기 결과 내용으로 결정되는 버전 문자열 (결과가 같으면 항상 같은 값)"""
+    completed = sorted((key, value) for key, value in match_results.items() if value)
+    payload = '\n'.join(f"{key}:{value}" for key, value in completed)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
@@ -0,0 +1,89 @@
+"""
+참가자별 역배(소신) 점수
+
+슬롯마다 그 팀을 고른 비율 p로 선택의 희귀도 -ln(p)를 정합니다 (모두가 고른 팀은 0, 드문 팀일수록 큼).
+  - 역배 점수: 시트의 모든 선택의 희귀도 합 (얼마나 대중과 다르게 찍었는지)
+  - 역배 적중: 결과가 나온 경기 중 맞힌 선택의 희귀도 합 (현재 성적 중 소수 의견으로 얻은 몫)
+
+슬롯마다 팀 ID → 희귀도 표(256칸)를 한 번 만들고 열(bytes)을 표 조회로 바꿔 더하므로
+참가자 수에 선형입니다. numpy가 있으면 배열 인덱싱으로, 없으면 map 표 조회로 계산합니다.
+비율은 분석기 메뉴(슬롯별 승리 예측)와 같은 집계를 씁니다. 예측을 비운 슬롯은 0으로 칩니다.
+"""
+
+import heapq
+import math
+import operator
+
+from bracket import Bracket
+from model import MISSING, as_dataset
+
+
+def pick_weights(dataset, slot, counts=None):
+    """팀 ID → 희귀도 -ln(선택 비율) 표 (256칸, 빈 값과 아무도 고르지 않은 팀은 0)
+
+    counts(팀 이름 → 선택 수)를 주면 그 집계를 그대로 쓰고, 없으면 열에서 셉니다.
+    """
+    names = dataset.teams.names
+    if counts is None:
+        column = dataset.column(slot)
+        counts = {names[team_id]: column.count(bytes((team_id,))) for team_id in range(1, len(names))}
+    answered = sum(counts.values())
+    weights = [0.0] * 256
+    if not answered:
+        return weights
+    for team, count in counts.items():
+        team_id = dataset.teams.get(team)
+        if team_id is not None and count:
+            weights[team_id] = -math.log(count / answered)
+    return weights
+
+def hit_weights(dataset, weights, winner):
+    """승자를 고른 칸만 희귀도를 남긴 표"""
+    hits = [0.0] * 256
+    winner_id = dataset.teams.get(winner) if winner else None
+    if winner_id is not None and winner_id != MISSING:
+        hits[winner_id] = weights[winner_id]
+    return hits
+
+def contrarian_scores(predictions, match_results=None, bracket=None, slot_counts=None):
+    """참가자 순서대로 (역배 점수 목록, 역배 적중 목록)
+
+    slot_counts에 슬롯별 선택 수(aggregates.PickAggregate.slot_counts)를 넘기면 그 비율을 씁니다.
+    """
+    dataset = as_dataset(predictions)
+    bracket = bracket or Bracket()
+    match_results = match_results or {}
+    slot_counts = slot_counts or {}
+    columns = []
+    for slot in bracket.match_keys:
+        if slot not in dataset.slot_index:
+            continue
+        weights = pick_weights(dataset, slot, slot_counts.get(slot))
+        columns.append((dataset.column(slot), weights, hit_weights(dataset, weights, match_results.get(slot))))
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    size = len(dataset)
+    if np is not None:
+        scores = np.zeros(size)
+        hits = np.zeros(size)
+        for column, weights, winner_weights in columns:
+            team_ids = np.frombuffer(column, dtype=np.uint8)
+            scores += np.asarray(weights)[team_ids]
+            hits += np.asarray(winner_weights)[team_ids]
+        return scores.tolist(), hits.tolist()
+
+    scores = [0.0] * size
+    hits = [0.0] * size
+    for column, weights, winner_weights in columns:
+        scores = list(map(operator.add, scores, map(weights.__getitem__, column)))
+        hits = list(map(operator.add, hits, map(winner_weights.__getitem__, column)))
+    return scores, hits
+
+def top_contrarians(nicknames, values, limit=10):
+    """값이 큰 순 (동률은 닉네임 순) 상위 [(닉네임, 값)]"""
+    top = heapq.nsmallest(limit, range(len(nicknames)), key=lambda row: (-values[row], nicknames[row]))
+    return [(nicknames[row], values[row]) for row in top]
@@ -0,0 +1,246 @@
+"""
+대시보드 데이터 계산 및 HTML/차트 생성
+
+streamlit_app과 정적 스냅샷 내보내기(export_snapshot)가 같은 화면을 만들도록
+Streamlit에 의존하지 않는 부분을 모아둔 모듈입니다.
+"""
+
+import profiling
+from bitsets import iter_bits, survivor_engine
+from bracket import Bracket
+from data_cache import load_predictions
+from events import LCK_2025_SCHEDULE
+from model import as_dataset
+
+@profiling.traced('load')
+def load_dashboard_data(predictions_file='predictions.json', results_file='match_result.txt', slots=None):
+    """예측 데이터와 경기 결과 로드 (경고 메시지는 목록으로 반환)"""
+    warnings = []
+
+    # 예측 데이터 로드
+    predictions = []
+    try:
+        predictions = load_predictions(predictions_file, slots)
+    except FileNotFoundError:
+        warnings.append(f"{predictions_file} 파일을 찾을 수 없습니다.")
+
+    # 경기 결과 로드
+    match_results = {}
+    try:
+        with open(results_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if ':' in line:
+                    parts = line.split(':', 1)
+                    if len(parts) == 2:
+                        key = parts[0].strip()
+                        value = parts[1].strip()
+                        match_results[key] = value if value else None
+    except FileNotFoundError:
+        warnings.append(f"{results_file} 파일을 찾을 수 없습니다.")
+
+    return predictions, match_results, warnings
+
+def get_schedule():
+    """경기 일정 (기본 이벤트)"""
+    return dict(LCK_2025_SCHEDULE)
+
+def gen_choice_message(match_results, bracket=None):
+    """GEN 선택 안내 문구 (GEN 선택 슬롯이 없는 브라켓이면 None)"""
+    if bracket is not None and 'GEN이 고른 팀' not in bracket.choices:
+        return None
+    r1_m1_winner = match_results.get('R1 M1')
+    r1_m2_winner = match_results.get('R1 M2')
+    gen_choice = match_results.get('GEN이 고른 팀')
+
+    if gen_choice:
+        return f"🎯 GEN이 선택한 팀: {gen_choice}"
+    elif r1_m1_winner and r1_m2_winner:
+        return f"🎯 GEN이 선택 가능한 팀: {r1_m1_winner}, {r1_m2_winner}"
+    else:
+        return "🎯 R1 경기 완료 후 GEN이 상대를 선택합니다"
+
+def match_card_html(match_id, team1, team2, winner, schedule_time):
+    """개별 매치 카드 HTML"""
+    # 상태 결정
+    if winner:
+        status_color = "#10B981"
+        status_emoji = "✅"
+        result_text = f"승자: {winner}"
+    elif team1 == "미정" or team2 == "미정":
+        status_color = "#6B7280"
+        status_emoji = "⏸️"
+        result_text = "대기 중"
+    else:
+        status_color = "#F59E0B"
+        status_emoji = "⏳"
+        result_text = "경기 예정"
+
+    return f"""
+    <div style='
+        border: 2px solid {status_color};
+        border-radius: 10px;
+        padding: 12px;
+        margin: 8px 0;
+        background: white;
+        text-align: center;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    '>
+        <div style='font-weight: bold; color: {status_color}; font-size: 1.1em;'>
+            {status_emoji} {match_id}
+        </div>
+        <div style='font-size: 1.2em; margin: 8px 0; font-weight: bold;'>
+            {team1} vs {team2}
+        </div>
+        <div style='color: #666; font-size: 0.9em; margin: 5px 0;'>
+            {result_text}
+        </div>
+        <div style='color: #888; font-size: 0.8em; font-style: italic;'>
+            {schedule_time}
+        </div>
+    </div>
+    """
+
+def survivor_banner_html(stats):
+    """대형 생존자 표시 HTML"""
+    color = stats['color']
+    return f"""
+                <div style='
+                    text-align: center;
+                    padding: 30px;
+                    background: linear-gradient(135deg, {color}22, {color}11);
+                    border-radius: 20px;
+                    margin: 20px 0;
+                    border: 3px solid {color};
+                '>
+                    <h1 style='color: {color}; margin: 0; font-size: 4em;'>{stats['emoji']} {stats['surviving']}</h1>
+                    <h2 style='color: {color}; margin: 10px 0; font-size: 2em;'>SURVIVORS REMAINING</h2>
+                    <p style='color: #666; margin: 0; font-size: 1.4em;'>
+                        생존율 {stats['survival_rate']:.1f}% - 상태: {stats['status']}
+                    </p>
+                    <p style='color: #888; margin: 10px 0; font-size: 1.1em;'>
+                        총 {stats['total']}명 중 {stats['eliminated']}명 탈락
+                    </p>
+                </div>
+                """
+
+def survival_status(survival_rate):
+    """생존율에 따른 색상과 상태"""
+    if survival_rate > 70:
+        return "#10B981", "🟢", "안전"
+    elif survival_rate > 40:
+        return "#F59E0B", "🟡", "주의"
+    elif survival_rate > 20:
+        return "#EF4444", "🟠", "위험"
+    else:
+        return "#DC2626", "🔴", "극한"
+
+@profiling.traced('score')
+def compute_dashboard_stats(predictions, match_results, bracket=None, wrong_counts=None):
+    """예측 통계 탭에 필요한 값을 한 번에 계산
+
+    wrong_counts를 주면 (events.load_event_data에서 채점해 둔 값) 다시 채점하지 않습니다.
+    """
+    bracket = bracket or Bracket()
+    dataset = as_dataset(predictions)
+    completed = sum(1 for match in bracket.match_keys if match_results.get(match))
+
+    if wrong_counts is None:
+        wrong_counts = dataset.wrong_counts(match_results, bracket.match_keys)
+    if completed > 0:
+        accuracy_sum = (completed * len(dataset) - sum(wrong_counts)) / completed
+    else:
+        accuracy_sum = float(len(dataset))
+    profiling.count('participants_scored', len(dataset))
+
+    # 생존자 수는 대시보드/트래커/API가 공유하는 비트맵으로
+    total_participants = len(dataset)
+    surviving = survivor_engine(predictions, bracket).count(match_results) if total_participants else 0
+    eliminated = total_participants - surviving
+    survival_rate = (surviving / total_participants) * 100 if total_participants > 0 else 0
+    color, emoji, status = survival_status(survival_rate)
+
+    x_vals = list(range(max(wrong_counts) + 1)) if wrong_counts else []
+    y_vals = [wrong_counts.count(i) for i in x_vals]
+
+    return {
+        'completed': completed,
+        'total': total_participants,
+        'surviving': surviving,
+        'eliminated': eliminated,
+        'survival_rate': survival_rate,
+        'color': color,
+        'emoji': emoji,
+        'status': status,
+        'avg_accuracy': accuracy_sum / total_participants if total_participants else 0,
+        'perfect': surviving,
+        'histogram': {'x': x_vals, 'y': y_vals},
+    }
+
+@profiling.traced('score')
+def compute_whatif_stats(bitsets, match_results, bracket=None, top=10):
+    """가상 결과 조합의 생존자/분포/상위 참가자 (bitsets.PickBitsets로 비트 연산만 수행)"""
+    bracket = bracket or Bracket()
+    planes = bitsets.wrong_planes(match_results, bracket.match_keys)
+    histogram = bitsets.histogram(planes)
+
+    total_participants = bitsets.size
+    surviving = histogram[0] if histogram else 0
+    survival_rate = (surviving / total_participants) * 100 if total_participants > 0 else 0
+    color, emoji, status = survival_status(survival_rate)
+
+    return {
+        'total': total_participants,
+        'surviving': surviving,
+        'eliminated': total_participants - surviving,
+        'survival_rate': survival_rate,
+        'color': color,
+        'emoji': emoji,
+        'status': status,
+        'histogram': {'x': list(range(len(histogram))), 'y': histogram},
+        'leaders': bitsets.leaders(planes, top),
+    }
+
+@profiling.traced('score')
+def find_survivors(data, slot, team):
+    """slot에서 team을 고른 생존자 닉네임 (DB가 있으면 SQL 인덱스, 없으면 비트맵)"""
+    if data.store is not None:
+        return data.store.survivors(slot, team)
+    engine = data.engine
+    bits = engine.survivors(data.match_results) & engine.bitsets.picked(slot, team)
+    return [data.dataset.nicknames[row] for row in iter_bits(bits)]
+
+@profiling.traced('render')
+def build_pie_figure(stats):
+    """생존자/탈락자 파이 차트"""
+    import plotly.graph_objects as go
+
+    pie_fig = go.Figure(data=[go.Pie(
+        labels=['생존자', '탈락자'],
+        values=[stats['surviving'], stats['eliminated']],
+        hole=0.4,
+        marker_colors=['#10B981', '#EF4444']
+    )])
+    pie_fig.update_layout(
+        title=f"참가자 현황 (총 {stats['total']}명)",
+        height=400
+    )
+    return pie_fig
+
+@profiling.traced('render')
+def build_histogram_figure(stats):
+    """틀린 예측 수별 분포 히스토그램"""
+    import plotly.graph_objects as go
+
+    hist_fig = go.Figure(data=[go.Bar(
+        x=stats['histogram']['x'],
+        y=stats['histogram']['y'],
+        marker_color='#3B82F6'
+    )])
+    hist_fig.update_layout(
+        title="틀린 예측 수별 참가자 분포",
+        xaxis_title="틀린 예측 수",
+        yaxis_title="참가자 수",
+        height=400
+    )
+    return hist_fig
@@ -0,0 +1,121 @@
+"""
+파싱된 데이터 웜 스타트 캐시
+
+predictions.json 같은 입력 파일을 한 번 파싱하면 .cache/ 아래에 pickle로 저장하고,
+원본 파일의 (mtime, size)가 그대로면 다음 실행부터는 pickle을 바로 읽습니다.
+cron/봇에서 스크립트를 여러 번 실행해도 JSON 파싱 비용을 반복하지 않습니다.
+같은 프로세스 안에서는 메모리에 올려둔 결과를 그대로 돌려줍니다 (호출 측에서 수정 금지).
+메모리 캐시는 크기 제한 LRU라 여러 이벤트를 오가도 최근에 쓴 것만 남습니다.
+"""
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+from bracket import SLOT_KEYS
+from jsonl_store import iter_records
+from model import PredictionDataset
+
+CACHE_DIR = '.cache'
+CACHE_FORMAT = 2
+MEMORY_CACHE_SIZE = 16
+
+
+class LRUCache:
+    """최근 사용 순서로 최대 maxsize개만 유지하는 dict 캐시"""
+    __slots__ = ('maxsize', 'entries')
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+
+    def get(self, key, default=None):
+        try:
+            self.entries.move_to_end(key)
+        except KeyError:
+            return default
+        return self.entries[key]
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        return self.entries.pop(key, default)
+
+    def clear(self):
+        self.entries.clear()
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+
+_memory_cache = LRUCache(MEMORY_CACHE_SIZE)
+
+def file_key(path):
+    """캐시 유효성 판단용 원본 파일 상태 (없으면 FileNotFoundError)"""
+    stat = os.stat(path)
+    return (CACHE_FORMAT, stat.st_mtime_ns, stat.st_size)
+
+def cache_path(path, kind):
+    """원본 파일에 대응하는 캐시 파일 경로"""
+    name = os.path.abspath(path).replace(os.sep, '_').replace(':', '_')
+    return os.path.join(CACHE_DIR, f"{name}.{kind}.pickle")
+
+def cached_load(path, kind, loader):
+    """loader(path) 결과를 메모리/디스크에 캐시하여 반환"""
+    key = file_key(path)
+
+    memory_key = (os.path.abspath(path), kind)
+    cached = _memory_cache.get(memory_key)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    pickle_path = cache_path(path, kind)
+    try:
+        with open(pickle_path, 'rb') as f:
+            stored_key, data = pickle.load(f)
+        if stored_key == key:
+            _memory_cache.put(memory_key, (key, data))
+            return data
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError, ValueError, AttributeError):
+        pass
+
+    data = loader(path)
+    _memory_cache.put(memory_key, (key, data))
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{pickle_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pickle_path)
+    except OSError:
+        # 읽기 전용 환경 등에서는 디스크 캐시 없이 동작
+        pass
+    return data
+
+def _read_dataset(path, slots=SLOT_KEYS):
+    # .jsonl(.gz)는 레코드를 한 줄씩 읽어 바로 데이터셋에 추가
+    return PredictionDataset.from_records(iter_records(path), slots)
+
+def load_predictions(path='predictions.json', slots=None):
+    """예측 데이터를 압축 모델(PredictionDataset)로 로드
+
+    slots를 주면 해당 이벤트 브라켓의 슬롯 순서로 행을 구성합니다.
+    FileNotFoundError/JSONDecodeError는 그대로 전달합니다.
+    """
+    if slots is None or list(slots) == SLOT_KEYS:
+        return cached_load(path, 'predictions', _read_dataset)
+    slots = list(slots)
+    kind = 'predictions-' + hashlib.sha1('\n'.join(slots).encode('utf-8')).hexdigest()[:8]
+    return cached_load(path, kind, lambda source: _read_dataset(source, slots))
+
+def clear_memory_cache():
+    """프로세스 내 캐시 비우기"""
+    _memory_cache.clear()
@@ -0,0 +1,255 @@
+"""
+예측 이벤트 레지스트리
+
+리그/시즌마다 브라켓, 일정, 예측, 결과 파일을 따로 두고 이벤트 ID로 선택합니다.
+
+    events/<이벤트 ID>/event.json        제목, 시즌, 브라켓 정의, 일정, 팀 별칭
+    events/<이벤트 ID>/predictions.json  파싱된 예측 (.jsonl / .jsonl.gz도 가능, 가장 최근 파일 사용)
+    events/<이벤트 ID>/match_result.txt  경기 결과
+    events/<이벤트 ID>/comments.txt      원본 댓글
+    events/<이벤트 ID>/predictions.sqlite 예측/결과 SQLite 저장소 (선택, 있으면 위 파일 대신 사용,
+                                          파일이 바뀌면 열 때 다시 가져옴)
+
+기본 이벤트(lck-2025-playoffs)는 기존처럼 작업 디렉터리의 파일을 그대로 씁니다.
+로드/채점한 이벤트 데이터는 크기 제한 LRU에 보관하고 파일이 바뀌었을 때만 다시 읽으므로
+한 프로세스가 여러 이벤트를 요청마다 파일을 다시 읽지 않고 서빙할 수 있습니다.
+
+event.json 예시:
+    {
+        "title": "LCK 플레이오프 2025",
+        "season": "2025",
+        "bracket": {"teams": [...], "slots": [...], "matches": {...}, "layout": [...]},
+        "schedule": {"R1 M1": "9월 10일 수요일 오후 5시", ...},
+        "aliases": {"티원": "T1", "젠지": "GEN"}
+    }
+"bracket"을 생략하면 LCK 2025 플레이오프 브라켓을 사용합니다.
+"""
+
+import json
+import os
+
+from bitsets import survivor_engine
+from bracket import LCK_2025_BRACKET, Bracket, results_version
+from data_cache import LRUCache, file_key, load_predictions
+from model import PredictionDataset
+
+EVENTS_DIR = 'events'
+EVENT_FILE = 'event.json'
+DEFAULT_EVENT_ID = 'lck-2025-playoffs'
+EVENT_CACHE_SIZE = 8
+
+LCK_2025_SCHEDULE = {
+    'R1 M1': '9월 10일 수요일 오후 5시',
+    'R1 M2': '9월 11일 목요일 오후 5시',
+    'R2 M1': '9월 13일 토요일 오후 3시',
+    'R2 M2': '9월 14일 일요일 오후 3시',
+    'R1 LB': '9월 17일 수요일 오후 5시',
+    'R2 LB': '9월 18일 목요일 오후 5시',
+    'R3 UB': '9월 20일 토요일 오후 3시',
+    'R3 LB': '9월 21일 일요일 오후 3시',
+    'R4 LF': '9월 27일 토요일 오후 2시',
+    'Grand Final': '9월 28일 일요일 오후 2시'
+}
+
+
+class Event:
+    """이벤트 하나의 정의와 파일 경로"""
+
+    def __init__(self, event_id, root='.', title=None, bracket=None, schedule=None, aliases=None, season=None):
+        self.id = event_id
+        self.root = root
+        self.title = title or event_id
+        self.season = season or event_id
+        self.bracket = Bracket(bracket or LCK_2025_BRACKET)
+        self.schedule = dict(schedule or {})
+        self.aliases = dict(aliases or {})
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    def record_file(self, stem):
+        """stem.json / stem.jsonl / stem.jsonl.gz 중 가장 최근에 쓴 파일 (없으면 stem.json)"""
+        latest, latest_mtime = self.path(f"{stem}.json"), None
+        for suffix in ('.json', '.jsonl', '.jsonl.gz'):
+            candidate = self.path(stem + suffix)
+            try:
+                mtime = os.stat(candidate).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if latest_mtime is None or mtime > latest_mtime:
+                latest, latest_mtime = candidate, mtime
+        return latest
+
+    @property
+    def predictions_file(self):
+        return self.record_file('predictions')
+
+    @property
+    def results_file(self):
+        return self.path('match_result.txt')
+
+    @property
+    def comments_file(self):
+        return self.path('comments.txt')
+
+    @property
+    def store_file(self):
+        from sqlite_store import STORE_FILE
+        return self.path(STORE_FILE)
+
+    def open_store(self):
+        """SQLite 저장소 (predictions.sqlite가 없으면 None)
+
+        예측/결과 파일이 DB로 가져온 뒤에 바뀌었으면 먼저 다시 가져오고 경고를 출력합니다.
+        """
+        from sqlite_store import open_store, sync_store
+        store = open_store(self.store_file)
+        if store is not None:
+            synced = sync_store(store, self)
+            if synced:
+                names = ', '.join(os.path.basename(path) for path in synced)
+                print(f"⚠️ {names} 파일이 DB 가져오기 이후 바뀌어 {self.store_file}에 다시 가져왔습니다.")
+        return store
+
+    def load_results(self):
+        """경기 결과 로드 (모든 슬롯 포함, 결과 없으면 None / 파일이 없으면 FileNotFoundError)"""
+        results = {slot: None for slot in self.bracket.slots}
+        with open(self.results_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if ':' in line:
+                    key, value = line.split(':', 1)
+                    results[key.strip()] = value.strip() or None
+        return results
+
+    def __repr__(self):
+        return f"Event({self.id!r}, root={self.root!r})"
+
+
+class EventData:
+    """이벤트의 예측 데이터셋, 경기 결과, 참가자별 틀린 개수"""
+    __slots__ = ('event', 'fingerprint', 'dataset', 'match_results', 'version', 'wrong_counts', 'warnings', 'store')
+
+    def __init__(self, event, fingerprint, dataset, match_results, warnings, store=None):
+        self.event = event
+        self.fingerprint = fingerprint
+        self.dataset = dataset
+        self.match_results = match_results
+        self.version = results_version(match_results)
+        self.wrong_counts = dataset.wrong_counts(match_results, event.bracket.match_keys)
+        self.warnings = warnings
+        self.store = store
+
+    @property
+    def engine(self):
+        """생존자 엔진 (처음 요청할 때 한 번 만들고 같은 데이터셋을 쓰는 모든 세션이 공유)"""
+        return survivor_engine(self.dataset, self.event.bracket)
+
+    @property
+    def bitsets(self):
+        """참가자 비트맵 인덱스"""
+        return self.engine.bitsets
+
+
+_event_data_cache = LRUCache(EVENT_CACHE_SIZE)
+
+
+def default_event():
+    """작업 디렉터리 파일을 쓰는 기본 이벤트"""
+    return Event(DEFAULT_EVENT_ID, '.', title='LCK 플레이오프 2025', schedule=LCK_2025_SCHEDULE, season='2025')
+
+def load_event(event_id=None):
+    """이벤트 ID로 이벤트 로드 (없는 이벤트면 FileNotFoundError)"""
+    if not event_id or event_id == DEFAULT_EVENT_ID:
+        return default_event()
+
+    root = os.path.join(EVENTS_DIR, event_id)
+    with open(os.path.join(root, EVENT_FILE), 'r', encoding='utf-8') as f:
+        definition = json.load(f)
+    return Event(
+        event_id, root,
+        title=definition.get('title'),
+        bracket=definition.get('bracket'),
+        schedule=definition.get('schedule'),
+        aliases=definition.get('aliases'),
+        season=definition.get('season')
+    )
+
+def list_events():
+    """등록된 이벤트 ID 목록 (기본 이벤트가 맨 앞)"""
+    event_ids = [DEFAULT_EVENT_ID]
+    try:
+        names = sorted(os.listdir(EVENTS_DIR))
+    except FileNotFoundError:
+        names = []
+    for name in names:
+        if name != DEFAULT_EVENT_ID and os.path.isfile(os.path.join(EVENTS_DIR, name, EVENT_FILE)):
+            event_ids.append(name)
+    return event_ids
+
+def _fingerprint(event, store=None):
+    if store is not None:
+        return ('sqlite', store.fingerprint())
+    fingerprint = []
+    for path in (event.predictions_file, event.results_file):
+        try:
+            fingerprint.append(file_key(path))
+        except FileNotFoundError:
+            fingerprint.append(None)
+    return tuple(fingerprint)
+
+def load_event_data(event):
+    """이벤트 데이터 로드 및 채점 (파일이 그대로면 LRU에 보관된 결과 재사용)
+
+    event에는 Event 또는 이벤트 ID를 넘길 수 있습니다.
+    """
+    if not isinstance(event, Event):
+        event = load_event(event)
+
+    store = event.open_store()
+    fingerprint = _fingerprint(event, store)
+    cache_key = (event.id, os.path.abspath(event.root))
+    cached = _event_data_cache.get(cache_key)
+    if cached is not None and cached.fingerprint == fingerprint:
+        return cached
+
+    if store is not None:
+        # DB가 있으면 예측/결과 파일 대신 DB에서 읽음 (업데이터가 결과를 DB에도 기록)
+        dataset = store.load_dataset(event.bracket.slots)
+        match_results = store.load_results(event.bracket.slots)
+        data = EventData(event, fingerprint, dataset, match_results, [], store)
+        _event_data_cache.put(cache_key, data)
+        return data
+
+    warnings = []
+    try:
+        dataset = load_predictions(event.predictions_file, event.bracket.slots)
+    except FileNotFoundError:
+        warnings.append(f"{event.predictions_file} 파일을 찾을 수 없습니다.")
+        dataset = PredictionDataset(event.bracket.slots)
+    try:
+        match_results = event.load_results()
+    except FileNotFoundError:
+        warnings.append(f"{event.results_file} 파일을 찾을 수 없습니다.")
+        match_results = {slot: None for slot in event.bracket.slots}
+
+    data = EventData(event, fingerprint, dataset, match_results, warnings)
+    _event_data_cache.put(cache_key, data)
+    return data
+
+def pop_event_option(argv):
+    """argv에서 --event ID를 제거하고 이벤트 ID 반환 (없으면 None)"""
+    if '--event' not in argv:
+        return None
+    index = argv.index('--event')
+    del argv[index]
+    if index >= len(argv) or argv[index].startswith('-'):
+        raise SystemExit("--event 옵션에는 이벤트 ID가 필요합니다.")
+    return argv.pop(index)
+
+def event_from_argv(argv):
+    """CLI 공통: --event 옵션으로 이벤트 선택 (없는 이벤트면 메시지 출력 후 종료)"""
+    event_id = pop_event_option(argv)
+    try:
+        return load_event(event_id)
+    except FileNotFoundError:
+        raise SystemExit(f"이벤트를 찾을 수 없습니다: {event_id} ({EVENTS_DIR}/{event_id}/{EVENT_FILE})")
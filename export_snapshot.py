@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+대시보드 정적 스냅샷 내보내기
+
+streamlit_app.main이 보여주는 브라켓 카드, 생존자 배너, 파이 차트, 히스토그램을
+정적 HTML/JSON 묶음(리더보드 상위 페이지 포함)으로 만들어 일반 웹 서버가 그대로 서빙할 수 있게 합니다.
+결과 버전이 바뀌었을 때만 다시 생성합니다.
+
+묶음은 <output>/releases/<이름>/에 통째로 쓴 뒤 <output>/current 심볼릭 링크를 os.replace로
+바꿔 게시하므로, current를 서빙하는 웹 서버는 항상 한 버전의 파일만 보게 됩니다
+(이전 버전 파일이 섞이거나 지난 리더보드 페이지가 남지 않음).
+
+사용법:
+    python export_snapshot.py [--output snapshot] [--force] [--pages 20]
+    python export_snapshot.py --watch 5     # 5초마다 확인하여 바뀌면 재생성
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+
+from bracket import Bracket, results_version
+from dashboard_render import (
+    build_histogram_figure, build_pie_figure, compute_dashboard_stats,
+    gen_choice_message, get_schedule, load_dashboard_data, match_card_html,
+    survivor_banner_html
+)
+from events import default_event, event_from_argv, load_event_data
+from rank_predictors import calculate_scores
+
+PLOTLY_JS = "https://cdn.plot.ly/plotly-2.27.0.min.js"
+RELEASES_DIR = 'releases'
+CURRENT_LINK = 'current'
+# current가 바뀌는 순간 이전 버전을 읽던 클라이언트를 위해 남겨 두는 묶음 수 (current 포함)
+KEEP_RELEASES = 2
+LEADERBOARD_PAGE_SIZE = 50
+# 만드는 리더보드 페이지 수 (상위 LEADERBOARD_PAGES x LEADERBOARD_PAGE_SIZE명)
+LEADERBOARD_PAGES = 20
+
+def snapshot_version(predictions_file, match_results):
+    """결과 버전 + 예측 파일 상태로 스냅샷 버전 결정"""
+    try:
+        stat = os.stat(predictions_file)
+        predictions_key = f"{stat.st_mtime_ns}:{stat.st_size}"
+    except FileNotFoundError:
+        predictions_key = "none"
+    digest = hashlib.sha1(predictions_key.encode('utf-8')).hexdigest()[:6]
+    return f"{results_version(match_results)}-{digest}"
+
+def render_bracket_html(match_results, schedule, bracket=None):
+    """브라켓 배치에 따라 카드 HTML 생성"""
+    bracket = bracket or Bracket()
+    cards = bracket.cards(match_results)
+    sections = []
+
+    for section in bracket.layout:
+        widths = section.get('widths', [1] * len(section['columns']))
+        template = ' '.join(f"{width}fr" for width in widths)
+        columns = []
+        for column_def in section['columns']:
+            parts = []
+            if column_def['title']:
+                parts.append(f"<p><strong>{html.escape(column_def['title'])}</strong></p>")
+            for match_id in column_def['matches']:
+                card = cards[match_id]
+                parts.append(match_card_html(match_id, card['team1'], card['team2'],
+                                             card['winner'], schedule.get(match_id, '')))
+            columns.append(f"<div>{''.join(parts)}</div>")
+        sections.append(
+            f"<h3>{html.escape(section['title'])}</h3>"
+            f"<div class='row' style='grid-template-columns: {template};'>{''.join(columns)}</div>"
+        )
+
+    return '<hr>'.join(sections), cards
+
+def leaderboard_files(predictions, match_results, version, pages=LEADERBOARD_PAGES, page_size=LEADERBOARD_PAGE_SIZE):
+    """상위 pages개 리더보드 페이지 (같은 틀린 개수는 같은 순위, api_server와 같은 형식)"""
+    completed = {slot: winner for slot, winner in match_results.items() if winner}
+    ranked_scores = calculate_scores(predictions, completed)
+    page_count = max(1, -(-len(ranked_scores) // page_size))
+    limit = min(len(ranked_scores), pages * page_size)
+
+    entries = []
+    rank = 0
+    previous_wrong = None
+    for position, score in enumerate(ranked_scores[:limit], 1):
+        if score.wrong_predictions != previous_wrong:
+            rank = position
+            previous_wrong = score.wrong_predictions
+        entries.append({'rank': rank, 'nickname': score.nickname, 'wrong_predictions': score.wrong_predictions})
+
+    files = {}
+    for page in range(1, min(pages, page_count) + 1):
+        start = (page - 1) * page_size
+        files[f'leaderboard/page-{page}.json'] = json.dumps({
+            'version': version,
+            'page': page,
+            'page_count': page_count,
+            'page_size': page_size,
+            'total': len(ranked_scores),
+            'entries': entries[start:start + page_size],
+        }, ensure_ascii=False).encode('utf-8')
+    return files
+
+def render_snapshot(predictions, match_results, schedule, version, event=None, pages=LEADERBOARD_PAGES):
+    """스냅샷 파일 내용 생성 ({파일명: bytes}, 리더보드 페이지 포함)"""
+    event = event or default_event()
+    bracket_html, cards = render_bracket_html(match_results, schedule, event.bracket)
+    stats = compute_dashboard_stats(predictions, match_results, event.bracket)
+    title = html.escape(event.title)
+    generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    data = {
+        'version': version,
+        'generated_at': generated_at,
+        'results': match_results,
+        'gen_choice': gen_choice_message(match_results, event.bracket),
+        'cards': list(cards.values()),
+        'stats': stats,
+    }
+
+    stats_html = "<p class='info'>아직 완료된 경기가 없어 통계를 표시할 수 없습니다.</p>"
+    charts_js = ""
+    if stats['completed'] > 0 and predictions:
+        pie_json = build_pie_figure(stats).to_json()
+        hist_json = build_histogram_figure(stats).to_json() if stats['histogram']['x'] else 'null'
+        data['figures'] = {'pie': json.loads(pie_json), 'histogram': json.loads(hist_json)}
+        stats_html = f"""
+        {survivor_banner_html(stats)}
+        <div class='row' style='grid-template-columns: repeat(4, 1fr);'>
+            <div class='metric'><span>총 참가자</span><b>{stats['total']}</b></div>
+            <div class='metric'><span>생존자</span><b>{stats['surviving']}</b></div>
+            <div class='metric'><span>평균 정확도</span><b>{stats['avg_accuracy']:.1%}</b></div>
+            <div class='metric'><span>완벽한 예측</span><b>{stats['perfect']}</b></div>
+        </div>
+        <div class='row' style='grid-template-columns: 1fr 1fr;'>
+            <div id='pie'></div><div id='histogram'></div>
+        </div>"""
+        charts_js = f"""
+    <script src="{PLOTLY_JS}"></script>
+    <script>
+        const pie = {pie_json};
+        const histogram = {hist_json};
+        Plotly.newPlot('pie', pie.data, pie.layout, {{responsive: true}});
+        if (histogram) Plotly.newPlot('histogram', histogram.data, histogram.layout, {{responsive: true}});
+    </script>"""
+
+    choice_html = f"<p class='info'>{html.escape(data['gen_choice'])}</p>" if data['gen_choice'] else ""
+    page = f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="utf-8">
+    <meta name="snapshot-version" content="{version}">
+    <title>{title} - 승부예측 대시보드</title>
+    <style>
+        body {{ font-family: sans-serif; max-width: 1200px; margin: 0 auto; padding: 20px; }}
+        .row {{ display: grid; gap: 16px; }}
+        .info {{ background: #e8f0fe; padding: 12px; border-radius: 8px; }}
+        .metric {{ display: flex; flex-direction: column; padding: 8px; }}
+        .metric b {{ font-size: 2em; }}
+    </style>
+</head>
+<body>
+    <h1>🏆 {title} - 승부예측 대시보드</h1>
+    <h2>토너먼트 브라켓</h2>
+    {choice_html}
+    {bracket_html}
+    <hr>
+    <h2>예측 통계</h2>
+    {stats_html}
+    <hr>
+    <p>📅 마지막 업데이트: {generated_at}</p>{charts_js}
+</body>
+</html>
+"""
+
+    manifest = {'version': version, 'generated_at': generated_at}
+    files = {
+        'data.json': json.dumps(data, ensure_ascii=False).encode('utf-8'),
+        'index.html': page.encode('utf-8'),
+        'manifest.json': json.dumps(manifest, ensure_ascii=False).encode('utf-8'),
+    }
+    files.update(leaderboard_files(predictions, match_results, version, pages))
+    return files
+
+def write_files(files, path):
+    """{상대 경로: bytes}를 path 디렉터리에 기록"""
+    for name, content in files.items():
+        file_path = os.path.join(path, name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as f:
+            f.write(content)
+
+def new_release_path(output_dir, version):
+    """새 묶음 디렉터리 경로 (이름순 = 생성순, 같은 버전을 다시 만들어도 겹치지 않음)"""
+    name = f"{time.time_ns()}-{version}"
+    return os.path.join(output_dir, RELEASES_DIR, name)
+
+def publish_release(path, output_dir):
+    """완성된 묶음 디렉터리를 current로 게시 (심볼릭 링크를 os.replace로 한 번에 교체)"""
+    link = os.path.join(output_dir, CURRENT_LINK)
+    tmp_link = f"{link}.tmp-{os.getpid()}"
+    if os.path.lexists(tmp_link):
+        os.remove(tmp_link)
+    os.symlink(os.path.relpath(path, output_dir), tmp_link)
+    os.replace(tmp_link, link)
+    prune_releases(output_dir)
+
+def prune_releases(output_dir, keep=KEEP_RELEASES):
+    """최근 keep개를 제외한 지난 묶음 삭제 (current가 가리키는 묶음은 항상 유지)"""
+    directory = os.path.join(output_dir, RELEASES_DIR)
+    current = os.path.realpath(os.path.join(output_dir, CURRENT_LINK))
+    names = sorted(name for name in os.listdir(directory) if '.tmp-' not in name)
+    for name in names[:-keep]:
+        path = os.path.join(directory, name)
+        if os.path.realpath(path) != current:
+            shutil.rmtree(path, ignore_errors=True)
+
+def write_snapshot(files, output_dir, version):
+    """새 묶음 디렉터리에 모두 쓴 뒤 current를 바꿔 게시"""
+    path = new_release_path(output_dir, version)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    write_files(files, tmp_path)
+    os.replace(tmp_path, path)
+    publish_release(path, output_dir)
+
+def current_snapshot_version(output_dir):
+    """현재 게시된 스냅샷의 버전 (없으면 None)"""
+    try:
+        with open(os.path.join(output_dir, CURRENT_LINK, 'manifest.json'), 'r', encoding='utf-8') as f:
+            return json.load(f).get('version')
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def export_snapshot(output_dir='snapshot', predictions_file='predictions.json',
+                    results_file='match_result.txt', force=False, event=None, pages=LEADERBOARD_PAGES):
+    """결과 버전이 바뀌었으면 스냅샷을 다시 생성하고 생성 여부 반환
+
+    event를 주면 해당 이벤트의 브라켓, 일정과 대시보드와 같은 데이터(load_event_data:
+    predictions.sqlite가 있으면 DB)를 사용합니다.
+    """
+    if event is not None:
+        predictions_file = event.predictions_file
+        schedule = event.schedule
+        data = load_event_data(event)
+        predictions, match_results, warnings = data.dataset, data.match_results, data.warnings
+    else:
+        schedule = get_schedule()
+        predictions, match_results, warnings = load_dashboard_data(predictions_file, results_file)
+    for warning in warnings:
+        print(f"⚠️ {warning}")
+
+    version = snapshot_version(predictions_file, match_results)
+    if not force and current_snapshot_version(output_dir) == version:
+        return False
+
+    files = render_snapshot(predictions, match_results, schedule, version, event, pages)
+    write_snapshot(files, output_dir, version)
+    print(f"✅ 스냅샷 생성 완료: {output_dir}/{CURRENT_LINK}/ (버전 {version})")
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 정적 스냅샷 내보내기")
+    parser.add_argument('--output', default='snapshot')
+    parser.add_argument('--predictions', default='predictions.json')
+    parser.add_argument('--results', default='match_result.txt')
+    parser.add_argument('--event', help="이벤트 ID (지정하면 해당 이벤트의 파일 사용)")
+    parser.add_argument('--force', action='store_true', help="버전이 같아도 다시 생성")
+    parser.add_argument('--pages', type=int, default=LEADERBOARD_PAGES, help="만들 리더보드 페이지 수")
+    parser.add_argument('--watch', type=float, metavar='초', help="주기적으로 확인하여 바뀌면 재생성")
+    args = parser.parse_args()
+    if args.event:
+        event = event_from_argv(['--event', args.event])
+    elif (args.predictions, args.results) == (parser.get_default('predictions'), parser.get_default('results')):
+        # 파일을 따로 지정하지 않으면 기본 이벤트 (대시보드와 같은 데이터)
+        event = default_event()
+    else:
+        event = None
+
+    if not args.watch:
+        if not export_snapshot(args.output, args.predictions, args.results, args.force, event, args.pages):
+            print("변경 사항이 없어 스냅샷을 유지합니다.")
+        return
+
+    print(f"{args.watch}초마다 결과 변경을 확인합니다. (종료: Ctrl+C)")
+    try:
+        force = args.force
+        while True:
+            export_snapshot(args.output, args.predictions, args.results, force, event, args.pages)
+            force = False
+            time.sleep(args.watch)
+    except KeyboardInterrupt:
+        print("\n스냅샷 감시를 종료합니다.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+저장한 PGR21 스레드 HTML 페이지에서 댓글 추출
+
+댓글 페이지마다 브라우저에서 "다른 이름으로 저장"한 HTML 파일을 한 디렉터리에 모아 두면
+comments.txt를 손으로 복사하지 않고 바로 파싱할 수 있습니다.
+
+    python lck_playoff_parser.py --html pages/ --selectors selectors.json [--workers 4]
+
+각 페이지는 html.parser로 조금씩 읽으며 (파일 전체를 문자열로 만들지 않음) 댓글 요소가
+닫히는 대로 닉네임, 작성 시각, 수정 여부, 본문을 꺼냅니다. 페이지는 프로세스 풀에서
+병렬로 읽고, 예측 추출과 중복 처리는 페이지 순서대로 댓글 복사본과 같은 과정(stream_comments)을 거칩니다.
+
+요소는 간단한 선택자("태그", ".클래스", "태그.클래스")로 찾습니다. 게시판 마크업은 바뀔 수 있고
+확인된 기본값이 없으므로, 저장한 페이지의 구조에 맞춘 JSON 파일을 --selectors로 반드시 넘깁니다
+("edited"만 생략 가능).
+    {
+        "comment": "div.comment-item",    댓글 하나를 감싸는 요소
+        "nickname": ".nick",              닉네임
+        "timestamp": ".date",             작성 시각 (datetime 속성이 있으면 그 값)
+        "body": ".comment-content",       본문
+        "edited": ".modified"             이 요소가 있으면 수정된 댓글
+    }
+"""
+
+import codecs
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+
+# 선택자 파일에 꼭 있어야 하는 키와 생략할 수 있는 키
+REQUIRED_SELECTORS = ('comment', 'nickname', 'timestamp', 'body')
+OPTIONAL_SELECTORS = ('edited',)
+PAGE_SUFFIXES = ('.html', '.htm')
+READ_CHUNK = 65536
+
+# 닫는 태그가 없는 요소 (스택에 올리지 않음)
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+# 본문에서 줄바꿈으로 바꿀 블록 요소
+BLOCK_TAGS = {'p', 'div', 'li', 'ul', 'ol', 'blockquote', 'pre', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+SKIP_TAGS = {'script', 'style'}
+
+
+def parse_selector(selector):
+    """"태그.클래스" → (태그 또는 None, 클래스 또는 None)"""
+    tag, _, css_class = selector.strip().partition('.')
+    return tag.lower() or None, css_class or None
+
+def load_selectors(path):
+    """JSON 선택자 파일 읽기 (필수 키가 없거나 빈 선택자면 ValueError)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        selectors = json.load(f)
+    unknown = set(selectors) - set(REQUIRED_SELECTORS) - set(OPTIONAL_SELECTORS)
+    if unknown:
+        raise ValueError(f"알 수 없는 선택자 키: {', '.join(sorted(unknown))}")
+    missing = [name for name in REQUIRED_SELECTORS if name not in selectors]
+    if missing:
+        raise ValueError(f"선택자 키가 없습니다: {', '.join(missing)}")
+    empty = [name for name, selector in selectors.items() if parse_selector(selector) == (None, None)]
+    if empty:
+        raise ValueError(f"빈 선택자: {', '.join(empty)}")
+    return selectors
+
+
+class CommentExtractor(HTMLParser):
+    """feed()로 들어오는 HTML에서 댓글 요소가 닫힐 때마다 댓글 dict를 comments에 추가"""
+
+    FIELDS = ('nickname', 'timestamp', 'body')
+
+    def __init__(self, selectors):
+        super().__init__(convert_charrefs=True)
+        self.rules = {name: parse_selector(selector) for name, selector in selectors.items()}
+        self.comments = []
+        self._stack = []       # 열린 요소마다 (태그, 이 요소가 연 댓글/필드)
+        self._open = []        # 열린 댓글 (중첩 답글이면 안쪽이 마지막)
+        self._field = None     # (댓글, 필드 이름, 조각 목록)
+        self._skip = 0
+        self._sequence = 0
+
+    def _matches(self, name, tag, classes):
+        if name not in self.rules:
+            return False
+        rule_tag, rule_class = self.rules[name]
+        return (rule_tag is None or rule_tag == tag) and (rule_class is None or rule_class in classes)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+        opened = None
+
+        if tag in SKIP_TAGS:
+            self._skip += 1
+        elif self._matches('comment', tag, classes):
+            self._sequence += 1
+            opened = {'order': self._sequence, 'nickname': '', 'timestamp': '', 'body': '', 'edited': False}
+            self._open.append(opened)
+        elif self._open and self._field is None:
+            comment = self._open[-1]
+            if self._matches('edited', tag, classes):
+                comment['edited'] = True
+            for name in self.FIELDS:
+                if self._matches(name, tag, classes):
+                    self._field = (comment, name, [])
+                    if name == 'timestamp' and attrs.get('datetime'):
+                        comment['timestamp'] = attrs['datetime']
+                    opened = self._field
+                    break
+        elif self._field is not None:
+            if self._matches('edited', tag, classes):
+                self._field[0]['edited'] = True
+            if tag == 'br' or tag in BLOCK_TAGS:
+                self._field[2].append('\n')
+
+        if tag not in VOID_TAGS:
+            self._stack.append((tag, opened))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        # 짝이 맞지 않는 닫는 태그는 가장 가까운 같은 태그까지 닫음
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                break
+        else:
+            return
+        while len(self._stack) > index:
+            closed_tag, opened = self._stack.pop()
+            self._close(closed_tag, opened)
+
+    def _close(self, tag, opened):
+        if tag in SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+        if self._field is not None and tag in BLOCK_TAGS:
+            self._field[2].append('\n')
+        if opened is None:
+            return
+        if opened is self._field:
+            comment, name, parts = opened
+            text = ''.join(parts)
+            if name == 'body':
+                comment[name] = '\n'.join(line.strip() for line in text.strip().split('\n'))
+            elif not comment[name]:
+                comment[name] = ' '.join(text.split())
+            self._field = None
+        else:
+            self._open.remove(opened)
+            self.comments.append(opened)
+
+    def handle_data(self, data):
+        if self._field is not None and not self._skip:
+            # 소스의 줄바꿈은 공백일 뿐이고 화면의 줄바꿈은 <br>/블록 요소로만 생김
+            self._field[2].append(data.replace('\r', ' ').replace('\n', ' '))
+
+    def close(self):
+        super().close()
+        # 닫히지 않은 요소 정리 후 문서 순서(댓글 시작 순서)로 정렬
+        while self._stack:
+            self._close(*self._stack.pop())
+        self.comments.sort(key=lambda comment: comment['order'])
+
+
+def parse_page(path, selectors, encoding='utf-8'):
+    """HTML 페이지 하나를 조금씩 읽어 댓글 목록 반환"""
+    extractor = CommentExtractor(selectors)
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(READ_CHUNK)
+            if not chunk:
+                break
+            extractor.feed(decoder.decode(chunk))
+    extractor.feed(decoder.decode(b'', final=True))
+    extractor.close()
+    return extractor.comments
+
+def _page_number(name):
+    """page2.html이 page10.html보다 앞에 오도록 숫자 단위로 정렬"""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+def list_pages(directory):
+    names = [name for name in os.listdir(directory) if name.lower().endswith(PAGE_SUFFIXES)]
+    return [os.path.join(directory, name) for name in sorted(names, key=_page_number)]
+
+def _parse_page_job(job):
+    path, selectors, encoding = job
+    return parse_page(path, selectors, encoding)
+
+def iter_html_comments(directory, selectors, workers=None, encoding='utf-8'):
+    """디렉터리의 페이지를 병렬로 읽어 (닉네임, 디버그 위치 정보, 댓글 내용)을 페이지 순서대로 순회
+
+    lck_playoff_parser.stream_comments에 그대로 넘길 수 있는 형식입니다.
+    본문이 비어 있는 댓글(삭제된 댓글 등)은 내용이 None이라 "수정 아이콘 없음"과 같이 처리되고,
+    닉네임을 찾지 못한 댓글은 닉네임이 None이라 댓글 수에만 포함됩니다.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"작업 프로세스 수는 1 이상이어야 합니다: {workers}")
+    pages = list_pages(directory)
+    if not pages:
+        raise FileNotFoundError(f"HTML 페이지가 없습니다: {directory}")
+
+    jobs = [(path, selectors, encoding) for path in pages]
+    if workers == 1 or len(pages) == 1:
+        parsed = map(_parse_page_job, jobs)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        parsed = executor.map(_parse_page_job, jobs)
+
+    try:
+        for path, comments in zip(pages, parsed):
+            page = os.path.basename(path)
+            for index, comment in enumerate(comments, 1):
+                location = {"page": page, "comment_index": index, "timestamp": comment['timestamp']}
+                nickname = comment['nickname'] or None
+                if comment['edited']:
+                    location["edited"] = True
+                yield nickname, location, comment['body'] or None
+    finally:
+        if executor is not None:
+            executor.shutdown()
@@ -0,0 +1,162 @@
+"""
+JSONL 레코드 저장소 (스트리밍 쓰기 + 오프셋 인덱스)
+
+레코드를 한 줄에 하나씩 JSON으로 바로 써서 전체 목록을 메모리에 모을 필요가 없습니다.
+쓰는 동안 레코드 위치를 <파일>.idx에 남겨 두므로 읽을 때 전체를 읽지 않고
+n번째 레코드로 바로 이동하거나 처음부터 한 줄씩 순회할 수 있습니다.
+
+gzip 모드에서는 BLOCK_RECORDS개 레코드마다 gzip 멤버를 새로 시작합니다.
+여러 멤버를 이어 붙인 파일도 일반 gzip 파일이라 `zcat`이나 gzip.open으로 그대로 읽힙니다.
+인덱스에는 레코드마다 (멤버 시작 위치, 멤버 안에서의 위치)를 저장해 해당 멤버만 풀면 됩니다.
+
+인덱스 파일 구조:
+    INDEX_MAGIC, 플래그 1바이트 (1이면 gzip), 이후 레코드마다 '<QI' (블록 위치, 블록 내 위치)
+"""
+
+import gzip
+import json
+import struct
+import zlib
+
+INDEX_MAGIC = b'JSONLIX1'
+INDEX_ENTRY = struct.Struct('<QI')
+BLOCK_RECORDS = 256
+
+
+def index_path(path):
+    return f"{path}.idx"
+
+
+class JsonlWriter:
+    """레코드를 JSONL로 바로 기록 (with 문 또는 close()로 마무리)"""
+
+    def __init__(self, path, compress=None, block_records=BLOCK_RECORDS):
+        self.path = path
+        self.compress = path.endswith('.gz') if compress is None else compress
+        self.block_records = block_records
+        self.count = 0
+        self._file = open(path, 'wb')
+        self._index = open(index_path(path), 'wb')
+        self._index.write(INDEX_MAGIC + bytes((1 if self.compress else 0,)))
+        self._block = []
+        self._block_size = 0
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n'
+        if self.compress:
+            # 블록 시작 위치는 멤버를 쓸 때 정해지므로 블록 내 위치만 모아둠
+            self._block.append(self._block_size)
+            self._block.append(line)
+            self._block_size += len(line)
+            if len(self._block) >= self.block_records * 2:
+                self._flush_block()
+        else:
+            self._index.write(INDEX_ENTRY.pack(self._file.tell(), 0))
+            self._file.write(line)
+        self.count += 1
+
+    def _flush_block(self):
+        if not self._block:
+            return
+        start = self._file.tell()
+        offsets = self._block[0::2]
+        lines = self._block[1::2]
+        self._file.write(gzip.compress(b''.join(lines)))
+        self._index.write(b''.join(INDEX_ENTRY.pack(start, offset) for offset in offsets))
+        self._block = []
+        self._block_size = 0
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self.compress:
+            self._flush_block()
+        self._file.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+
+class JsonlReader:
+    """JSONL 파일 순회/임의 접근 (인덱스가 있으면 사용)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.compress = path.endswith('.gz')
+        self._entries = None
+        self._block_start = None
+        self._block_data = None
+
+    def _load_index(self):
+        if self._entries is not None:
+            return self._entries
+        try:
+            with open(index_path(self.path), 'rb') as f:
+                header = f.read(len(INDEX_MAGIC) + 1)
+                if header[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+                    raise ValueError(f"인덱스 파일 형식이 올바르지 않습니다: {index_path(self.path)}")
+                self.compress = header[-1] == 1
+                raw = f.read()
+            self._entries = [INDEX_ENTRY.unpack_from(raw, offset)
+                             for offset in range(0, len(raw), INDEX_ENTRY.size)]
+        except FileNotFoundError:
+            if self.compress:
+                raise
+            # 압축하지 않은 파일은 한 번 훑어서 위치 계산
+            self._entries = []
+            with open(self.path, 'rb') as f:
+                position = 0
+                for line in f:
+                    self._entries.append((position, 0))
+                    position += len(line)
+        return self._entries
+
+    def __len__(self):
+        return len(self._load_index())
+
+    def __iter__(self):
+        opener = gzip.open if self.compress else open
+        with opener(self.path, 'rb') as f:
+            for line in f:
+                yield json.loads(line)
+
+    def __getitem__(self, index):
+        entries = self._load_index()
+        if index < 0:
+            index += len(entries)
+        block_start, inner = entries[index]
+        if not self.compress:
+            with open(self.path, 'rb') as f:
+                f.seek(block_start)
+                return json.loads(f.readline())
+
+        if self._block_start != block_start:
+            with open(self.path, 'rb') as f:
+                f.seek(block_start)
+                decompressor = zlib.decompressobj(wbits=31)
+                chunks = []
+                while not decompressor.eof:
+                    chunk = f.read(65536)
+                    if not chunk:
+                        break
+                    chunks.append(decompressor.decompress(chunk))
+            self._block_start = block_start
+            self._block_data = b''.join(chunks)
+        end = self._block_data.index(b'\n', inner)
+        return json.loads(self._block_data[inner:end])
+
+
+def is_jsonl(path):
+    return path.endswith('.jsonl') or path.endswith('.jsonl.gz')
+
+def iter_records(path):
+    """JSONL(.jsonl/.jsonl.gz)이면 한 줄씩, 기존 JSON 목록 파일이면 통째로 읽어 레코드 순회"""
+    if is_jsonl(path):
+        return iter(JsonlReader(path))
+    with open(path, 'r', encoding='utf-8') as f:
+        return iter(json.load(f))
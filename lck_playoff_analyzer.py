@@ -2,19 +2,72 @@ import json
 import sys
 from collections import Counter
 
+import profiling
+from aggregates import PickAggregate
+from data_cache import load_predictions
+from events import event_from_argv, load_event
+from model import KEY_ALIASES
+from sqlite_store import is_store_path, open_store
+
+ROUND_KEYS = {
+    'R1': ['R1 M1', 'R1 M2'],
+    'R2': ['R2 M1', 'R2 M2'],
+    'R3': ['R3 UB', 'R3 LB'],
+    'LB': ['R1 LB', 'R2 LB'],
+    'FINAL': ['R4 LF', 'Grand Final']
+}
+AGGREGATE_SUFFIX = '.agg.json'
+REPORT_FORMATS = ('json', 'csv')
+CSV_COLUMNS = ['source', 'section', 'key', 'value', 'count', 'percentage']
+CONTRARIAN_TOP = 20
+
+def count_rows(counter):
+    """Counter → 많이 선택된 순 [{'team', 'count', 'percentage'}] (출력 메뉴와 같은 순서)"""
+    total = sum(counter.values())
+    return [
+        {'team': team, 'count': count, 'percentage': round(count / total * 100, 1)}
+        for team, count in counter.most_common()
+    ]
+
 class TournamentAnalyzer:
-    def __init__(self, json_file):
-        with open(json_file, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+    def __init__(self, json_file, slots=None, bracket=None):
+        if bracket is not None:
+            slots = bracket.slots
+        self.store = None
+        self.bracket = bracket
+        if is_store_path(json_file):
+            # SQLite 저장소면 집계를 SQL GROUP BY로 (시트를 메모리에 올리지 않음)
+            self.store = open_store(json_file)
+            if self.store is None:
+                raise FileNotFoundError(json_file)
+            self.data = None
+            with profiling.span('aggregate', 'TournamentAnalyzer.aggregate'):
+                self.aggregate = self.store.aggregate(bracket)
+        else:
+            with profiling.span('load', 'TournamentAnalyzer.load'):
+                self.data = load_predictions(json_file, slots)
+            with profiling.span('aggregate', 'TournamentAnalyzer.aggregate'):
+                self.aggregate = PickAggregate(bracket, self.data.slots).add_dataset(self.data)
         
-        # 인코딩 문제 수정을 위한 키 매핑
-        self.key_mapping = {
-            'GENì´ ê³ ë¥¸ íŒ€': 'GEN이 고른 팀'
-        }
+        # 인코딩 문제 수정을 위한 키 매핑 (로드 시 모델에서 이미 정규화됨)
+        self.key_mapping = KEY_ALIASES
         
-        self.total_predictions = len(self.data)
+        self.total_predictions = self.aggregate.participants
         print(f"총 {self.total_predictions}개의 예측 데이터 로드됨")
     
+    @classmethod
+    def from_aggregate(cls, aggregate):
+        """저장된 집계만으로 분석기 생성 (원본 시트가 없으므로 닉네임 목록은 제공하지 않음)"""
+        analyzer = cls.__new__(cls)
+        analyzer.data = None
+        analyzer.store = None
+        analyzer.bracket = None
+        analyzer.aggregate = aggregate
+        analyzer.key_mapping = KEY_ALIASES
+        analyzer.total_predictions = aggregate.participants
+        print(f"총 {analyzer.total_predictions}개의 예측 집계 로드됨")
+        return analyzer
+    
     def get_prediction_value(self, prediction, key):
         """인코딩 문제를 고려하여 예측 값을 가져옴"""
         if key in prediction:
@@ -27,100 +80,80 @@ class TournamentAnalyzer:
         
         return None
     
+    @profiling.traced('aggregate')
     def list_nicknames(self):
         """닉네임만 콤마 구분으로 출력"""
-        nicknames = [entry['nickname'] for entry in self.data]
+        nicknames = self.nicknames()
+        if nicknames is None:
+            print("\n집계 파일에는 닉네임이 없습니다.")
+            return ''
+        
         result = ', '.join(nicknames)
         print(f"\n전체 닉네임 ({len(nicknames)}명):")
         print(result)
         return result
     
+    def slot_counts(self, match_key):
+        """슬롯별 팀 선택 수 (없는 슬롯이면 빈 Counter)"""
+        return self.aggregate.slot_counts.get(match_key, Counter())
+    
+    @profiling.traced('aggregate')
     def championship_predictions(self):
         """우승자 예측 확률"""
-        grand_finals = []
-        for entry in self.data:
-            winner = entry['prediction'].get('Grand Final')
-            if winner:
-                grand_finals.append(winner)
-        
-        counter = Counter(grand_finals)
-        total = len(grand_finals)
+        # 마지막 슬롯이 결승 (LCK 브라켓은 'Grand Final')
+        counter = self.aggregate.champion_counts
+        total = sum(counter.values())
         
         print(f"\n우승자 예측 ({total}명 응답):")
         for team, count in counter.most_common():
             percentage = (count / total) * 100
             print(f"{team}: {count}명 ({percentage:.1f}%)")
     
+    @profiling.traced('aggregate')
     def match_predictions(self, match_key, match_name):
         """특정 매치의 팀별 승리 예측 비율"""
-        teams = []
-        for entry in self.data:
-            team = entry['prediction'].get(match_key)
-            if team:
-                teams.append(team)
-        
-        counter = Counter(teams)
-        total = len(teams)
+        counter = self.slot_counts(match_key)
+        total = sum(counter.values())
         
         print(f"\n{match_name} 승리 예측 ({total}명 응답):")
         for team, count in counter.most_common():
             percentage = (count / total) * 100
             print(f"{team}: {count}명 ({percentage:.1f}%)")
     
+    @profiling.traced('aggregate')
     def gen_choice_analysis(self):
         """R1 결과에 따른 GEN 선택 예측 분석"""
-        scenarios = {}
-        
-        for entry in self.data:
-            pred = entry['prediction']
-            r1m1_winner = pred.get('R1 M1')
-            r1m2_winner = pred.get('R1 M2')
-            gen_choice = self.get_prediction_value(pred, 'GEN이 고른 팀')
-            
-            if r1m1_winner and r1m2_winner and gen_choice:
-                scenario = f"{r1m1_winner} vs {r1m2_winner}"
-                if scenario not in scenarios:
-                    scenarios[scenario] = []
-                scenarios[scenario].append(gen_choice)
+        # 처음 등장한 순서대로 상황별로 묶인 교차표
+        scenarios = self.aggregate.scenarios.get('GEN이 고른 팀')
+        if scenarios is None:
+            print("\n이 이벤트에는 GEN 선택 슬롯이 없습니다.")
+            return
         
         print(f"\nR1 결과별 GEN 선택 예측:")
-        for scenario, choices in scenarios.items():
-            counter = Counter(choices)
-            total = len(choices)
+        for (r1m1_winner, r1m2_winner), counter in scenarios.items():
+            scenario = f"{r1m1_winner} vs {r1m2_winner}"
+            total = sum(counter.values())
             print(f"\n{scenario} 상황 ({total}명 예측):")
             for team, count in counter.most_common():
                 percentage = (count / total) * 100
                 print(f"  GEN이 {team} 선택: {count}명 ({percentage:.1f}%)")
     
+    @profiling.traced('aggregate')
     def team_statistics(self):
         """팀별 전체 통계"""
-        all_picks = []
-        
-        for entry in self.data:
-            pred = entry['prediction']
-            for key, value in pred.items():
-                if value and key != 'GEN이 고른 팀':
-                    # 인코딩된 키 제외
-                    if key not in self.key_mapping:
-                        all_picks.append(value)
-        
-        counter = Counter(all_picks)
-        total = len(all_picks)
+        # 선택 슬롯을 제외하고 행 단위로 처음 등장한 순서 유지 (동률 정렬 순서)
+        counter = self.aggregate.team_totals
+        total = sum(counter.values())
         
         print(f"\n전체 팀별 선택 횟수:")
         for team, count in counter.most_common():
             percentage = (count / total) * 100
             print(f"{team}: {count}회 선택 ({percentage:.1f}%)")
     
+    @profiling.traced('aggregate')
     def round_analysis(self, round_name):
         """라운드별 상세 분석"""
-        round_keys = {
-            'R1': ['R1 M1', 'R1 M2'],
-            'R2': ['R2 M1', 'R2 M2'],
-            'R3': ['R3 UB', 'R3 LB'],
-            'LB': ['R1 LB', 'R2 LB'],
-            'FINAL': ['R4 LF', 'Grand Final']
-        }
+        round_keys = ROUND_KEYS
         
         if round_name.upper() not in round_keys:
             print("유효한 라운드: R1, R2, R3, LB, FINAL")
@@ -130,20 +163,221 @@ class TournamentAnalyzer:
         print(f"\n{round_name.upper()} 라운드 분석:")
         
         for key in keys:
-            teams = []
-            for entry in self.data:
-                team = entry['prediction'].get(key)
-                if team:
-                    teams.append(team)
-            
-            counter = Counter(teams)
-            total = len(teams)
+            counter = self.slot_counts(key)
+            total = sum(counter.values())
             
             print(f"\n{key} ({total}명 응답):")
             for team, count in counter.most_common():
                 percentage = (count / total) * 100
                 print(f"  {team}: {count}명 ({percentage:.1f}%)")
 
+    def nicknames(self):
+        """닉네임 목록 (집계 파일이면 None)"""
+        if self.data is not None:
+            return list(self.data.nicknames)
+        if self.store is not None:
+            return self.store.nicknames()
+        return None
+    
+    def sheets(self):
+        """참가자별 시트 데이터셋 (집계 파일이면 None)"""
+        if self.data is not None:
+            return self.data
+        if self.store is not None:
+            return self.store.load_dataset(self.aggregate.slots)
+        return None
+    
+    def contrarian_top(self, limit=10):
+        """역배 점수 상위 [(닉네임, 점수)]와 전체 평균 (집계 파일이면 None)"""
+        from contrarian import contrarian_scores, top_contrarians
+        
+        dataset = self.sheets()
+        if dataset is None:
+            return None
+        # 메뉴의 슬롯별 승리 예측과 같은 선택 비율로 계산
+        scores, _ = contrarian_scores(dataset, bracket=self.bracket, slot_counts=self.aggregate.slot_counts)
+        average = sum(scores) / len(scores) if scores else 0.0
+        return top_contrarians(dataset.nicknames, scores, limit), average
+    
+    @profiling.traced('score')
+    def contrarian_ranking(self, limit=10):
+        """역배(소신) 점수 순위 - 대중과 다르게 찍은 시트"""
+        result = self.contrarian_top(limit)
+        if result is None:
+            print("\n집계 파일에는 참가자별 시트가 없습니다.")
+            return
+        top, average = result
+        print(f"\n역배(소신) 점수 상위 {len(top)}명 (슬롯별 선택 비율 p의 -ln p 합, 전체 평균 {average:.2f}):")
+        for rank, (nickname, score) in enumerate(top, 1):
+            print(f"{rank:2d}. {nickname}: {score:.2f}")
+    
+    @profiling.traced('aggregate')
+    def report(self):
+        """메뉴의 모든 리포트를 한 번에 (이미 한 번 훑어 만든 집계에서 꺼내기만 함)"""
+        aggregate = self.aggregate
+        scenarios = aggregate.scenarios.get('GEN이 고른 팀')
+        contrarian = self.contrarian_top(CONTRARIAN_TOP)
+        return {
+            'participants': self.total_predictions,
+            'nicknames': self.nicknames(),
+            'champion_slot': aggregate.champion_slot,
+            'champion': count_rows(aggregate.champion_counts),
+            'matches': {
+                slot: count_rows(counter)
+                for slot, counter in aggregate.slot_counts.items() if slot not in aggregate.choices
+            },
+            'gen_choice': None if scenarios is None else [
+                {'scenario': f"{r1m1_winner} vs {r1m2_winner}", 'total': sum(counter.values()),
+                 'choices': count_rows(counter)}
+                for (r1m1_winner, r1m2_winner), counter in scenarios.items()
+            ],
+            'team_totals': count_rows(aggregate.team_totals),
+            'rounds': {
+                round_name: {key: count_rows(self.slot_counts(key)) for key in keys}
+                for round_name, keys in ROUND_KEYS.items()
+            },
+            'contrarian': None if contrarian is None else {
+                'average': round(contrarian[1], 4),
+                'top': [{'nickname': nickname, 'score': round(score, 4)} for nickname, score in contrarian[0]],
+            },
+        }
+
+def open_analyzer(path, event_id=None):
+    """경로 종류(.agg.json 집계, SQLite, 예측 파일)에 맞게 분석기 생성"""
+    bracket = load_event(event_id).bracket if event_id else None
+    if path.endswith(AGGREGATE_SUFFIX):
+        return TournamentAnalyzer.from_aggregate(PickAggregate.load(path))
+    return TournamentAnalyzer(path, bracket=bracket)
+
+def build_report(job):
+    """(라벨, 경로, 이벤트 ID) 하나의 전체 리포트 (프로세스 풀 작업 단위)"""
+    label, path, event_id = job
+    import contextlib
+    import io
+    
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = open_analyzer(path, event_id).report()
+    except FileNotFoundError:
+        return label, {'error': f"파일을 찾을 수 없습니다: {path}"}
+    except (json.JSONDecodeError, ValueError) as e:
+        return label, {'error': f"파일 형식이 올바르지 않습니다: {path} ({e})"}
+    report['source'] = path
+    return label, report
+
+def build_reports(jobs, workers=None):
+    """여러 파일의 리포트를 프로세스 풀에서 동시에 만들고 입력 순서대로 반환"""
+    if len(jobs) <= 1 or workers == 1:
+        return [build_report(job) for job in jobs]
+    # 메뉴 모드 시작 시간에 영향이 없도록 필요할 때만 import
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(build_report, jobs))
+
+def report_csv_rows(label, report):
+    """리포트 하나를 (source, section, key, value, count, percentage) 행으로 펼침"""
+    if 'error' in report:
+        yield [label, 'error', '', report['error'], '', '']
+        return
+    yield [label, 'participants', '', '', report['participants'], '']
+    for nickname in report['nicknames'] or []:
+        yield [label, 'nickname', '', nickname, '', '']
+    for row in report['champion']:
+        yield [label, 'champion', report['champion_slot'], row['team'], row['count'], row['percentage']]
+    for slot, rows in report['matches'].items():
+        for row in rows:
+            yield [label, 'match', slot, row['team'], row['count'], row['percentage']]
+    for scenario in report['gen_choice'] or []:
+        for row in scenario['choices']:
+            yield [label, 'gen_choice', scenario['scenario'], row['team'], row['count'], row['percentage']]
+    for row in report['team_totals']:
+        yield [label, 'team_totals', '', row['team'], row['count'], row['percentage']]
+    for round_name, slots in report['rounds'].items():
+        for slot, rows in slots.items():
+            for row in rows:
+                yield [label, 'round', f"{round_name}/{slot}", row['team'], row['count'], row['percentage']]
+    if report['contrarian']:
+        for rank, row in enumerate(report['contrarian']['top'], 1):
+            yield [label, 'contrarian', rank, row['nickname'], row['score'], '']
+
+def unique_labels(jobs):
+    """같은 라벨(같은 파일을 두 번 지정 등)에 #2, #3을 붙여 JSON 키가 겹치지 않게 함"""
+    seen = Counter()
+    unique = []
+    for label, path, event_id in jobs:
+        seen[label] += 1
+        if seen[label] > 1:
+            label = f"{label}#{seen[label]}"
+        unique.append((label, path, event_id))
+    return unique
+
+def write_reports(reports, output_format, out):
+    """JSON(파일이 하나면 리포트 자체, 여러 개면 라벨별) 또는 CSV로 출력"""
+    if output_format == 'csv':
+        import csv
+        
+        writer = csv.writer(out)
+        writer.writerow(CSV_COLUMNS)
+        for label, report in reports:
+            writer.writerows(report_csv_rows(label, report))
+    else:
+        payload = reports[0][1] if len(reports) == 1 else {label: report for label, report in reports}
+        json.dump(payload, out, ensure_ascii=False, indent=2)
+        out.write('\n')
+
+def pop_option(argv, flag):
+    """argv에서 flag와 값을 제거하고 값 반환 (없으면 None)"""
+    if flag not in argv:
+        return None
+    index = argv.index(flag)
+    del argv[index]
+    if index >= len(argv) or argv[index].startswith('--'):
+        raise SystemExit(f"{flag} 옵션에는 값이 필요합니다.")
+    return argv.pop(index)
+
+def run_batch(argv):
+    """--batch: 메뉴 없이 모든 리포트를 JSON/CSV로 출력 (파일 여러 개는 동시에 처리)"""
+    argv = [arg for arg in argv if arg != '--batch']
+    output_format = pop_option(argv, '--format') or 'json'
+    if output_format not in REPORT_FORMATS:
+        raise SystemExit(f"지원하지 않는 형식입니다: {output_format} (json 또는 csv)")
+    output = pop_option(argv, '--output')
+    workers = pop_option(argv, '--workers')
+    if workers is not None and (not workers.isdigit() or int(workers) < 1):
+        print_usage()
+        sys.exit(1)
+    workers = int(workers) if workers else None
+    event_ids = pop_option(argv, '--event')
+    
+    jobs = []
+    for event_id in (event_ids.split(',') if event_ids else []):
+        try:
+            event = load_event(event_id)
+        except FileNotFoundError:
+            raise SystemExit(f"이벤트를 찾을 수 없습니다: {event_id}")
+        path = event.store_file if event.open_store() is not None else event.predictions_file
+        jobs.append((event_id, path, event_id))
+    jobs.extend((path, path, None) for path in argv)
+    if not jobs:
+        raise SystemExit("리포트를 만들 파일이나 --event 를 지정하세요.")
+    
+    reports = build_reports(unique_labels(jobs), workers)
+    if output:
+        with open(output, 'w', encoding='utf-8', newline='') as f:
+            write_reports(reports, output_format, f)
+        print(f"리포트 저장: {output} ({len(reports)}개)")
+    else:
+        write_reports(reports, output_format, sys.stdout)
+    return all('error' not in report for _, report in reports)
+
+def print_usage():
+    print("사용법: python tournament_analyzer.py predictions.json")
+    print("        python tournament_analyzer.py --event 이벤트ID")
+    print("        python tournament_analyzer.py --aggregate total.agg.json")
+    print("        python tournament_analyzer.py --batch [--format json|csv] [--output 파일] [--workers N(1 이상)]")
+    print("            [--event ID1,ID2] [predictions.json day1.agg.json ...]")
+
 def show_menu():
     print("\n" + "="*50)
     print("토너먼트 예측 분석기")
@@ -157,18 +391,37 @@ def show_menu():
     print("7. GEN 선택 예측 분석")
     print("8. 팀별 전체 통계")
     print("9. 라운드별 분석")
+    print("10. 역배(소신) 점수 순위")
     print("0. 종료")
     print("-"*50)
 
 def main():
-    if len(sys.argv) != 2:
-        print("사용법: python tournament_analyzer.py predictions.json")
+    if '--batch' in sys.argv:
+        if not run_batch(sys.argv[1:]):
+            sys.exit(1)
+        return
+    
+    bracket = None
+    aggregate_file = None
+    if '--event' in sys.argv:
+        event = event_from_argv(sys.argv)
+        bracket = event.bracket
+        json_file = event.store_file if event.open_store() is not None else event.predictions_file
+    elif len(sys.argv) == 3 and sys.argv[1] == '--aggregate':
+        json_file = aggregate_file = sys.argv[2]
+    elif len(sys.argv) == 2:
+        json_file = sys.argv[1]
+    else:
+        print_usage()
         return
     
     try:
-        analyzer = TournamentAnalyzer(sys.argv[1])
+        if aggregate_file:
+            analyzer = TournamentAnalyzer.from_aggregate(PickAggregate.load(aggregate_file))
+        else:
+            analyzer = TournamentAnalyzer(json_file, bracket=bracket)
     except FileNotFoundError:
-        print(f"파일을 찾을 수 없습니다: {sys.argv[1]}")
+        print(f"파일을 찾을 수 없습니다: {json_file}")
         return
     except json.JSONDecodeError:
         print("JSON 파일 형식이 올바르지 않습니다.")
@@ -176,7 +429,7 @@ def main():
     
     while True:
         show_menu()
-        choice = input("선택하세요 (0-9): ").strip()
+        choice = input("선택하세요 (0-10): ").strip()
         
         if choice == '0':
             print("분석기를 종료합니다.")
@@ -200,10 +453,13 @@ def main():
         elif choice == '9':
             round_name = input("라운드를 입력하세요 (R1/R2/R3/LB/FINAL): ").strip()
             analyzer.round_analysis(round_name)
+        elif choice == '10':
+            analyzer.contrarian_ranking()
         else:
             print("올바른 번호를 입력하세요.")
         
         input("\n계속하려면 Enter를 누르세요...")
 
 if __name__ == "__main__":
+    profiling.install_cli(sys.argv)
     main()
\ No newline at end of file
@@ -1,32 +1,120 @@
 import json
+import os
 import re
+import sys
+import unicodedata
 
-def parse_pgr21_comments(text):
+import profiling
+from bracket import SLOT_KEYS, Bracket
+from events import event_from_argv
+from jsonl_store import JsonlWriter
+from slot_aliases import KeyMatcher
+from team_aliases import AliasMatcher
+
+DUPLICATE_POLICIES = ('first', 'last', 'reject')
+EDIT_MARKER = "(수정됨)"
+
+def duplicate_key(nickname):
+    """중복 판단용 닉네임 (수정 표시 제거)"""
+    return nickname.replace(EDIT_MARKER, '').strip()
+
+# 디버그 기록 수준: 0 없음, 1 실패/중복만, 2 전체
+DEBUG_LEVELS = (0, 1, 2)
+
+
+class ListOutput:
+    """파싱 결과를 목록으로 모음 (기본)"""
+
+    def __init__(self):
+        self.results = []
+        self.failed_users = []
+        self.debug_info = []
+        self.recovered = 0
+
+    def result(self, record):
+        if "recovered" in record:
+            self.recovered += 1
+        self.results.append(record)
+
+    def failure(self, record):
+        self.failed_users.append(record)
+
+    def debug(self, entry):
+        self.debug_info.append(entry)
+
+
+class JsonlOutput:
+    """파싱 결과를 레코드가 나오는 대로 JSONL 파일에 기록 (gzip 선택)"""
+
+    def __init__(self, path_for, compress=False, debug_level=2):
+        suffix = '.jsonl.gz' if compress else '.jsonl'
+        self.writers = {
+            'result': JsonlWriter(path_for(f"predictions{suffix}"), compress),
+            'failure': JsonlWriter(path_for(f"failed_predictions{suffix}"), compress),
+        }
+        if debug_level:
+            self.writers['debug'] = JsonlWriter(path_for(f"debug_info{suffix}"), compress)
+        self.failure_samples = []
+        self.recovered = 0
+
+    def result(self, record):
+        if "recovered" in record:
+            self.recovered += 1
+        self.writers['result'].write(record)
+
+    def failure(self, record):
+        if len(self.failure_samples) < 5:
+            self.failure_samples.append(record)
+        self.writers['failure'].write(record)
+
+    def debug(self, entry):
+        self.writers['debug'].write(entry)
+
+    def count(self, kind):
+        writer = self.writers.get(kind)
+        return writer.count if writer else 0
+
+    def close(self):
+        for writer in self.writers.values():
+            writer.close()
+
+
+@profiling.traced('parse')
+def parse_pgr21_comments(text, slots=SLOT_KEYS, matcher=None, duplicate_policy='first', recover_keys=True):
+    """댓글 복사본 파싱 (정상 예측, 실패 목록, 디버그 정보, 발견한 댓글 수)
+
+    같은 닉네임의 정상 예측이 여러 개면 duplicate_policy에 따라 처리합니다.
+        first   처음 댓글 유지 (기본)
+        last    마지막 댓글 유지 (수정해서 다시 쓴 경우)
+        reject  해당 닉네임 예측을 모두 제외
+    제외된 댓글은 debug_info에 "duplicate - ..." 상태와 duplicate_of(유지/대체한 댓글 번호)로 남습니다.
+    """
+    output = ListOutput()
+    user_count, _ = stream_pgr21_comments(text, output, slots, matcher, duplicate_policy, recover_keys=recover_keys)
+    return output.results, output.failed_users, output.debug_info, user_count
+
+def stream_pgr21_comments(text, output, slots=SLOT_KEYS, matcher=None, duplicate_policy='first', debug_level=2,
+                          recover_keys=True):
+    """댓글 복사본을 파싱하며 레코드를 output.result/failure/debug로 바로 넘김 (댓글 수, 중복 제외 수)"""
+    return stream_comments(scan_pgr21_text(text), output, slots, matcher, duplicate_policy, debug_level, recover_keys)
+
+def scan_pgr21_text(text):
+    """댓글 복사본에서 댓글 단위로 (닉네임, 디버그 위치 정보, 댓글 내용) 순회
+
+    "추천"으로 시작하는 줄의 바로 윗줄이 닉네임이고, "수정 아이콘" 다음 줄부터
+    다음 "추천" 줄 전까지가 댓글 내용입니다. 수정 아이콘이 없으면 내용은 None,
+    첫 줄부터 "추천"이라 닉네임이 없으면 닉네임이 None입니다.
+    """
     lines = text.strip().split('\n')
-    results = []
-    failed_users = []
-    debug_info = []
-    
     i = 0
-    user_count = 0
     
     while i < len(lines):
         # "추천" 으로 시작하는 라인 찾기 (추천 0, 추천 1 등 모두 포함)
         if lines[i].strip().startswith("추천"):
-            user_count += 1
-            
             # 바로 윗줄이 닉네임
             if i > 0:
                 nickname = lines[i-1].strip()
                 
-                # 디버그 정보 저장
-                debug_entry = {
-                    "user_number": user_count,
-                    "nickname": nickname,
-                    "line_number": i,
-                    "status": "processing"
-                }
-                
                 # "수정 아이콘" 찾기
                 j = i + 1
                 found_edit_icon = False
@@ -36,6 +124,7 @@ def parse_pgr21_comments(text):
                         break
                     j += 1
                 
+                comment_text = None
                 if found_edit_icon:
                     j += 1  # "수정 아이콘" 다음줄부터 댓글 내용
                     
@@ -46,113 +135,406 @@ def parse_pgr21_comments(text):
                             break
                         comment_content.append(lines[j].strip())
                         j += 1
-                    
-                    # 승부예측 패턴 찾기
                     comment_text = '\n'.join(comment_content)
-                    prediction, failure_reason = extract_prediction_with_reason(comment_text)
-                    
-                    if prediction:
-                        results.append({
-                            "nickname": nickname,
-                            "prediction": prediction
-                        })
-                        debug_entry["status"] = "success"
-                    else:
-                        failed_users.append({
-                            "nickname": nickname,
-                            "reason": failure_reason,
-                            "comment": comment_text[:100] + "..." if len(comment_text) > 100 else comment_text
-                        })
-                        debug_entry["status"] = "failed - " + failure_reason
-                else:
-                    debug_entry["status"] = "failed - 수정 아이콘 없음"
                 
-                debug_info.append(debug_entry)
+                yield nickname, {"line_number": i}, comment_text
                 i = j  # 다음 "추천"부터 계속
             else:
+                yield None, None, None
                 i += 1
         else:
             i += 1
     
-    return results, failed_users, debug_info, user_count
-
-def extract_prediction_with_reason(text):
-    prediction_pattern = {
-        "R1 M1": None,
-        "R1 M2": None,
-        "GEN이 고른 팀": None,
-        "R2 M1": None,
-        "R2 M2": None,
-        "R1 LB": None,
-        "R2 LB": None,
-        "R3 UB": None,
-        "R3 LB": None,
-        "R4 LF": None,
-        "Grand Final": None
-    }
-    
-    found_fields = []
-    missing_fields = []
-    
-    # 각 패턴 찾기
-    for key in prediction_pattern.keys():
-        pattern = rf"{re.escape(key)}\s*:\s*(\w+)"
-        match = re.search(pattern, text)
-        if match:
-            prediction_pattern[key] = match.group(1)
-            found_fields.append(key)
+    profiling.count('lines_scanned', len(lines))
+
+def stream_comments(comments, output, slots=SLOT_KEYS, matcher=None, duplicate_policy='first', debug_level=2,
+                    recover_keys=True, bracket=None):
+    """(닉네임, 디버그 위치 정보, 댓글 내용) 순서대로 예측을 추출해 output으로 넘김 (댓글 수, 중복 제외 수)
+
+    댓글 복사본(scan_pgr21_text)과 저장된 HTML 페이지(html_ingest)가 같은 처리를 거칩니다.
+    recover_keys면 정확한 키로 실패한 댓글만 키 오타를 보정해 한 번 더 추출하고, 보정된 예측과
+    디버그 항목에 "recovered" (신뢰도, 슬롯 → 원래 표기)를 남깁니다. 보정한 슬롯의 대진은
+    bracket(기본 LCK 2025 브라켓)으로 검사합니다.
+    first 정책은 정상 예측과 디버그 항목을 바로 내보냅니다. last/reject 정책은 앞서 낸 예측을
+    뒤집을 수 있으므로 정상 예측과 디버그 항목만 모아 두었다가 끝에서 내보냅니다.
+    """
+    if duplicate_policy not in DUPLICATE_POLICIES:
+        raise ValueError(f"중복 처리 정책은 {', '.join(DUPLICATE_POLICIES)} 중 하나여야 합니다: {duplicate_policy}")
+    if debug_level not in DEBUG_LEVELS:
+        raise ValueError(f"디버그 수준은 {DEBUG_LEVELS} 중 하나여야 합니다: {debug_level}")
+    
+    buffered = duplicate_policy != 'first'
+    results = []
+    debug_info = []
+    # 닉네임 → [results 위치, 디버그 항목, 예측]
+    seen = {}
+    dropped = 0
+    
+    def emit_debug(entry):
+        if buffered:
+            debug_info.append(entry)
+        elif debug_level == 2 or (debug_level == 1 and entry["status"] != "success"):
+            output.debug(entry)
+    
+    user_count = 0
+    
+    for nickname, location, comment_text in comments:
+        user_count += 1
+        if nickname is None:
+            continue
+        
+        # 디버그 정보 저장
+        debug_entry = {
+            "user_number": user_count,
+            "nickname": nickname,
+            **location,
+            "status": "processing"
+        }
+        
+        if comment_text is not None:
+            # 승부예측 패턴 찾기
+            with profiling.span('extract', 'extract_prediction'):
+                prediction, failure_reason, unresolved = extract_prediction(comment_text, slots, matcher)
+            recovery = None
+            if not prediction and recover_keys:
+                with profiling.span('extract', 'recover_prediction'):
+                    prediction, recovery, rejected = recover_prediction(comment_text, slots, matcher, bracket)
+                failure_reason = rejected or failure_reason
+            
+            if prediction:
+                record = {
+                    "nickname": nickname,
+                    "prediction": prediction
+                }
+                if recovery:
+                    record["recovered"] = recovery
+                    debug_entry["recovered"] = recovery
+                key = duplicate_key(nickname)
+                previous = seen.get(key)
+                if previous is None:
+                    seen[key] = [len(results), debug_entry, prediction]
+                    if buffered:
+                        results.append(record)
+                    else:
+                        results.append(None)
+                        output.result(record)
+                    debug_entry["status"] = "success"
+                else:
+                    dropped += resolve_duplicate(duplicate_policy, previous, debug_entry, results, record)
+            else:
+                failed_entry = {
+                    "nickname": nickname,
+                    "reason": failure_reason,
+                    "comment": comment_text[:100] + "..." if len(comment_text) > 100 else comment_text
+                }
+                if unresolved:
+                    failed_entry["unresolved"] = unresolved
+                output.failure(failed_entry)
+                debug_entry["status"] = "failed - " + failure_reason
         else:
-            missing_fields.append(key)
+            debug_entry["status"] = "failed - 수정 아이콘 없음"
+        
+        emit_debug(debug_entry)
+    
+    if buffered:
+        for record in results:
+            if record is not None:
+                output.result(record)
+        buffered = False
+        for entry in debug_info:
+            emit_debug(entry)
+    
+    profiling.count('comments_scanned', user_count)
+    profiling.count('duplicates_dropped', dropped)
+    return user_count, dropped
+
+def resolve_duplicate(policy, previous, debug_entry, results, record):
+    """같은 닉네임의 두 번째 이후 정상 예측 처리 (제외된 예측 수 반환)"""
+    position, previous_entry, previous_prediction = previous
+    debug_entry["same_prediction"] = previous_prediction == record["prediction"]
+    
+    if policy == 'first':
+        debug_entry["status"] = "duplicate - 첫 댓글 유지"
+        debug_entry["duplicate_of"] = previous_entry["user_number"]
+        return 1
+    
+    if policy == 'last':
+        results[position] = None
+        previous_entry["status"] = "duplicate - 이후 댓글로 대체"
+        previous_entry["duplicate_of"] = debug_entry["user_number"]
+        previous[:] = [len(results), debug_entry, record["prediction"]]
+        results.append(record)
+        debug_entry["status"] = "success"
+        return 1
+    
+    # reject: 처음 발견한 예측도 함께 제외
+    debug_entry["status"] = "duplicate - 중복으로 제외"
+    debug_entry["duplicate_of"] = previous_entry["user_number"]
+    if results[position] is not None:
+        results[position] = None
+        previous_entry["status"] = "duplicate - 중복으로 제외"
+        return 2
+    return 1
+
+_key_patterns = {}
+_key_matchers = {}
+_default_matcher = None
+
+def key_pattern(slots):
+    """모든 슬롯 키를 한 번에 찾는 정규식 (긴 키 우선, 슬롯 목록별로 한 번만 컴파일)"""
+    slots = tuple(slots)
+    pattern = _key_patterns.get(slots)
+    if pattern is None:
+        alternatives = '|'.join(re.escape(slot) for slot in sorted(slots, key=len, reverse=True))
+        pattern = _key_patterns[slots] = re.compile(rf"({alternatives})\s*:\s*")
+    return pattern
+
+def default_matcher():
+    """기본 브라켓 팀 + 기본 별칭 매처"""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = AliasMatcher(Bracket().teams)
+    return _default_matcher
+
+def key_matcher(slots):
+    """슬롯 목록별 오타 보정 매처 (한 번만 만듦)"""
+    slots = tuple(slots)
+    matcher = _key_matchers.get(slots)
+    if matcher is None:
+        matcher = _key_matchers[slots] = KeyMatcher(slots)
+    return matcher
+
+def scan_keys(text, slots=SLOT_KEYS, matcher=None):
+    """정확한 슬롯 키로 찾은 (슬롯 → 팀 코드 또는 None, 슬롯 → 해석하지 못한 팀명)"""
+    matcher = matcher or default_matcher()
+    pattern = key_pattern(slots)
+    prediction_pattern = {slot: None for slot in slots}
+    unresolved = {}
+    
+    # 모든 키를 한 번에 찾기
+    profiling.count('regex_calls', 1)
+    for match in pattern.finditer(text):
+        key = match.group(1)
+        if prediction_pattern[key] is not None:
+            continue
+        # 값 없이 바로 다음 키가 오면 빈 필드
+        if pattern.match(text, match.end()):
+            continue
+        team, token = matcher.resolve(text, match.end())
+        if team:
+            prediction_pattern[key] = team
+            unresolved.pop(key, None)
+        elif token and key not in unresolved:
+            unresolved[key] = token
+    return prediction_pattern, unresolved
+
+def recover_prediction(text, slots=SLOT_KEYS, matcher=None, bracket=None):
+    """키 표기 오타를 보정해 다시 추출 (예측, 보정 정보, 거부 사유)
+
+    정확한 키로 찾은 값은 그대로 두고, 빈 슬롯만 줄 단위로 채웁니다. 줄마다 첫 콜론 앞을
+    키 표기로 보고 KeyMatcher로 슬롯을 찾은 뒤 콜론 뒤의 팀 표기를 별칭 트라이로 해석합니다.
+    보정 정보의 confidence는 보정한 키 중 가장 낮은 1 - 편집 거리/키 길이입니다.
+
+    보정한 키가 이미 채워진 슬롯으로 향하거나 (다른 슬롯을 잘못 읽은 것), 보정한 슬롯의 팀이
+    그 시트의 대진(Bracket.validate)과 맞지 않으면 보정하지 않고 거부 사유를 돌려줍니다.
+    빈 슬롯이 남거나 보정할 키가 없으면 (None, None, None)입니다.
+    """
+    matcher = matcher or default_matcher()
+    bracket = bracket or Bracket()
+    fuzzy = key_matcher(slots)
+    prediction_pattern, _ = scan_keys(text, slots, matcher)
+    recovered = {}
+    confidence = 1.0
+    
+    for line in unicodedata.normalize('NFKC', text).split('\n'):
+        key_text, colon, value = line.partition(':')
+        if not colon:
+            continue
+        match = fuzzy.match(key_text)
+        if match is None:
+            continue
+        slot, distance, length = match
+        key_text = key_text.strip()
+        if prediction_pattern[slot] is not None:
+            # 정확한 키 줄은 이미 반영됨, 그 밖의 표기가 채워진 슬롯으로 맞으면 오인
+            if key_text == slot:
+                continue
+            return None, None, f"키 보정 충돌: '{key_text}' → {slot} (이미 입력된 슬롯)"
+        value_start = len(value) - len(value.lstrip())
+        team, _ = matcher.resolve(value, value_start)
+        if team:
+            prediction_pattern[slot] = team
+            recovered[slot] = key_text
+            confidence = min(confidence, 1 - distance / length)
+    
+    if not recovered or any(value is None for value in prediction_pattern.values()):
+        return None, None, None
+    errors = bracket.validate(prediction_pattern, list(recovered))
+    if errors:
+        return None, None, "키 보정 후 대진 불일치: " + "; ".join(errors)
+    profiling.count('keys_recovered', len(recovered))
+    return prediction_pattern, {"confidence": round(confidence, 3), "keys": recovered}, None
+
+def extract_prediction(text, slots=SLOT_KEYS, matcher=None):
+    """승부예측 추출 (예측, 실패 사유, 해석하지 못한 팀명 목록)
+
+    슬롯 키는 정규식 하나로 찾고, 키 뒤의 팀 표기는 별칭 트라이로 팀 코드로 바꿉니다.
+    같은 키가 여러 번 나오면 처음 해석된 값을 씁니다.
+    """
+    prediction_pattern, unresolved = scan_keys(text, slots, matcher)
     
     # 모든 필드가 채워졌는지 확인
     if all(value is not None for value in prediction_pattern.values()):
-        return prediction_pattern, None
+        return prediction_pattern, None, []
+    
+    unresolved = [{'slot': key, 'token': token} for key, token in unresolved.items()]
+    found_count = sum(1 for value in prediction_pattern.values() if value is not None)
     
     # 실패 이유 생성
-    if not found_fields:
+    if unresolved and found_count + len(unresolved) == len(prediction_pattern):
+        tokens = ', '.join(f"{item['token']}({item['slot']})" for item in unresolved)
+        reason = f"알 수 없는 팀명: {tokens}"
+    elif not found_count and not unresolved:
         reason = "승부예측 패턴이 전혀 없음"
     else:
-        reason = f"일부 필드만 발견됨 - 발견: {len(found_fields)}/11개"
+        reason = f"일부 필드만 발견됨 - 발견: {found_count + len(unresolved)}/{len(prediction_pattern)}개"
     
-    return None, reason
+    return None, reason, unresolved
+
+def extract_prediction_with_reason(text, slots=SLOT_KEYS, matcher=None):
+    prediction, reason, _ = extract_prediction(text, slots, matcher)
+    return prediction, reason
+
+def pop_value_option(argv, flag, choices, default):
+    """argv에서 '플래그 값'을 제거하고 값 반환 (허용 값이 아니면 사용법 출력 후 종료)"""
+    if flag not in argv:
+        return default
+    index = argv.index(flag)
+    del argv[index]
+    value = argv.pop(index) if index < len(argv) else ''
+    if value not in choices:
+        print_usage()
+        sys.exit(1)
+    return value
+
+def pop_path_option(argv, flag):
+    """argv에서 '플래그 값'을 제거하고 값 반환 (없으면 None, 값이 없으면 사용법 출력 후 종료)"""
+    if flag not in argv:
+        return None
+    index = argv.index(flag)
+    del argv[index]
+    if index >= len(argv) or argv[index].startswith('-'):
+        print_usage()
+        sys.exit(1)
+    return argv.pop(index)
+
+def print_usage():
+    print("사용법: python lck_playoff_parser.py [--event 이벤트ID] "
+          f"[--duplicates {'|'.join(DUPLICATE_POLICIES)}] [--jsonl [--gzip]] [--debug-level 0|1|2] [--strict-keys]")
+    print("        [--html 페이지폴더 --selectors 선택자.json [--workers N(1 이상)]]")
 
 def main():
-    # 파일 읽기
-    with open('comments.txt', 'r', encoding='utf-8') as f:
-        text = f.read()
-    
-    # 파싱
-    results, failed_users, debug_info, total_users = parse_pgr21_comments(text)
+    event = event_from_argv(sys.argv)
+    duplicate_policy = pop_value_option(sys.argv, '--duplicates', DUPLICATE_POLICIES, 'first')
+    debug_level = int(pop_value_option(sys.argv, '--debug-level', [str(level) for level in DEBUG_LEVELS], '2'))
+    html_dir = pop_path_option(sys.argv, '--html')
+    selectors_file = pop_path_option(sys.argv, '--selectors')
+    workers = pop_path_option(sys.argv, '--workers')
+    if workers is not None and (not workers.isdigit() or int(workers) < 1):
+        print_usage()
+        sys.exit(1)
+    jsonl = '--jsonl' in sys.argv
+    compress = '--gzip' in sys.argv
+    recover_keys = '--strict-keys' not in sys.argv
     
-    # JSON 저장
-    with open('predictions.json', 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    if html_dir:
+        # 저장한 HTML 페이지에서 바로 댓글 추출 (페이지별 병렬)
+        from html_ingest import iter_html_comments, load_selectors
+        if not os.path.isdir(html_dir):
+            raise SystemExit(f"HTML 페이지 폴더를 찾을 수 없습니다: {html_dir}")
+        if not selectors_file:
+            print_usage()
+            raise SystemExit("--html에는 페이지 구조에 맞춘 --selectors 선택자 파일이 필요합니다.")
+        try:
+            selectors = load_selectors(selectors_file)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"선택자 파일을 읽을 수 없습니다: {e}")
+        comments = iter_html_comments(html_dir, selectors, int(workers) if workers else None)
+    else:
+        # 파일 읽기
+        with profiling.span('load', 'read_comments'):
+            with open(event.comments_file, 'r', encoding='utf-8') as f:
+                text = f.read()
+        comments = scan_pgr21_text(text)
     
-    # 실패 정보 저장
-    if failed_users:
-        with open('failed_predictions.json', 'w', encoding='utf-8') as f:
-            json.dump(failed_users, f, ensure_ascii=False, indent=2)
+    # 파싱
+    matcher = AliasMatcher(event.bracket.teams, event.aliases)
+    if jsonl:
+        # 레코드가 나오는 대로 파일에 기록 (목록을 메모리에 모으지 않음)
+        output = JsonlOutput(event.path, compress, debug_level)
+        try:
+            total_users, duplicates = stream_comments(
+                comments, output, event.bracket.slots, matcher, duplicate_policy, debug_level, recover_keys,
+            event.bracket)
+        finally:
+            output.close()
+        result_count = output.count('result')
+        failed_count = output.count('failure')
+        failure_samples = output.failure_samples
+        debug_file = output.writers['debug'].path if debug_level else None
+    else:
+        output = ListOutput()
+        total_users, duplicates = stream_comments(
+            comments, output, event.bracket.slots, matcher, duplicate_policy, debug_level, recover_keys,
+            event.bracket)
+        results, failed_users = output.results, output.failed_users
+        
+        with profiling.span('render', 'write_outputs'):
+            # JSON 저장
+            with open(event.path('predictions.json'), 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+            
+            # 실패 정보 저장
+            if failed_users:
+                with open(event.path('failed_predictions.json'), 'w', encoding='utf-8') as f:
+                    json.dump(failed_users, f, ensure_ascii=False, indent=2)
+            
+            # 디버그 정보 저장
+            debug_file = event.path('debug_info.json') if debug_level else None
+            if debug_file:
+                with open(debug_file, 'w', encoding='utf-8') as f:
+                    json.dump(output.debug_info, f, ensure_ascii=False, indent=2)
+        
+        result_count = len(results)
+        failed_count = len(failed_users)
+        failure_samples = failed_users[:5]
     
-    # 디버그 정보 저장
-    with open('debug_info.json', 'w', encoding='utf-8') as f:
-        json.dump(debug_info, f, ensure_ascii=False, indent=2)
+    # SQLite 저장소가 있으면 새 예측을 바로 DB에 다시 가져옴 (대시보드/순위/분석기가 DB를 읽음)
+    event.open_store()
     
     # 결과 출력
+    processed = result_count + failed_count + duplicates
     print(f"총 발견된 유저: {total_users}명")
-    print(f"파싱 성공: {len(results)}개")
-    print(f"파싱 실패: {len(failed_users)}개")
-    print(f"처리된 총합: {len(results) + len(failed_users)}개")
+    print(f"파싱 성공: {result_count}개")
+    if output.recovered:
+        print(f"  (키 오타 보정: {output.recovered}개, 예측의 \"recovered\" 항목 참고)")
+    print(f"파싱 실패: {failed_count}개")
+    if duplicates:
+        print(f"중복 제외: {duplicates}개 (정책: {duplicate_policy})")
+    print(f"처리된 총합: {processed}개")
     
-    if total_users != len(results) + len(failed_users):
-        print(f"\n⚠️ 누락된 유저: {total_users - len(results) - len(failed_users)}명")
-        print("debug_info.json 파일을 확인해보세요.")
+    if total_users != processed:
+        print(f"\n⚠️ 누락된 유저: {total_users - processed}명")
+        if debug_file:
+            print(f"{os.path.basename(debug_file)} 파일을 확인해보세요.")
     
-    if failed_users:
+    if failed_count:
         print(f"\n파싱 실패 사유:")
-        for user in failed_users[:5]:  # 처음 5명만 출력
+        for user in failure_samples:  # 처음 5명만 출력
             print(f"- {user['nickname']}: {user['reason']}")
-        if len(failed_users) > 5:
-            print(f"... 외 {len(failed_users)-5}명 더")
+        if failed_count > 5:
+            print(f"... 외 {failed_count-5}명 더")
 
 if __name__ == "__main__":
+    profiling.install_cli(sys.argv)
     main()
\ No newline at end of file
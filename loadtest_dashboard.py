@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+대시보드 동시 접속 부하 테스트
+
+synthetic_data로 대규모 합성 이벤트를 임시 디렉터리에 만들고, Streamlit의 프로세스 내 실행기
+(streamlit.testing.v1.AppTest)로 streamlit_app.py 세션 N개를 스레드에서 동시에 돌립니다.
+세션마다 rerun, 위젯 조작(만약에 탭 선택, 생존자 찾기), 그리고 그 사이 별도 스레드가
+MatchUpdater.update_match_direct로 경기 결과를 갱신해 캐시 무효화까지 함께 측정합니다.
+탭 전환은 브라우저 쪽 동작이라 서버는 매 rerun마다 모든 탭을 그리므로 각 탭의 위젯 조작으로 대신합니다.
+
+출력: 동작별/전체 rerun 지연 시간 p50/p95/p99, 프로세스 CPU 시간, 세션당 메모리
+(tracemalloc 증가분), 최대 RSS. 세션들이 같은 프로세스의 캐시(이벤트 LRU, 생존자 엔진)를
+공유하므로 실제 서버 한 프로세스에 여러 브라우저가 붙은 상황에 가깝습니다.
+
+사용법:
+    python loadtest_dashboard.py [--participants 100000] [--sessions 8] [--reruns 20]
+        [--updates 3] [--update-interval 2.0] [--completed 4] [--output loadtest.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+from bracket import Bracket
+from events import default_event
+from synthetic_data import write_event
+from update_match import MatchUpdater
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'streamlit_app.py')
+ACTIONS = ('rerun', 'whatif', 'search')
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values, pct):
+    """최근접 순위 방식 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, -(-pct * len(ordered) // 100) - 1))
+    return ordered[index]
+
+def latency_summary(values):
+    summary = {'count': len(values)}
+    for pct in PERCENTILES:
+        value = percentile(values, pct)
+        summary[f'p{pct}_ms'] = round(value * 1000, 1) if value is not None else None
+    summary['max_ms'] = round(max(values) * 1000, 1) if values else None
+    return summary
+
+def max_rss_bytes():
+    """프로세스 최대 RSS (리눅스는 KB, macOS는 바이트 단위로 보고됨)"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def whatif_widgets(app):
+    """선택 가능한 만약에 탭 selectbox (대진 미정 슬롯은 비활성이라 제외)"""
+    return [widget for widget in app.selectbox
+            if (widget.key or '').startswith('whatif-') and not widget.disabled]
+
+def run_action(app, action, rng):
+    """동작 하나를 적용하고 rerun (조작할 위젯이 없으면 그냥 rerun)"""
+    if action == 'whatif':
+        widgets = whatif_widgets(app)
+        if widgets:
+            widget = rng.choice(widgets)
+            widget.select(rng.choice(widget.options))
+    elif action == 'search':
+        slots = [widget for widget in app.selectbox if widget.key == 'survivor-search-slot']
+        teams = [widget for widget in app.selectbox if widget.key == 'survivor-search-team']
+        if slots and teams:
+            slots[0].select(rng.choice(slots[0].options))
+            teams[0].select(rng.choice(teams[0].options))
+    app.run()
+
+
+class Session(threading.Thread):
+    """AppTest 세션 하나 (첫 실행 후 reruns번 동작 반복)"""
+
+    def __init__(self, index, reruns, timeout, seed, start_barrier):
+        super().__init__(name=f"session-{index}", daemon=True)
+        self.index = index
+        self.reruns = reruns
+        self.timeout = timeout
+        self.rng = random.Random(seed + index)
+        self.start_barrier = start_barrier
+        self.app = None
+        self.first_run = None
+        self.latencies = {action: [] for action in ACTIONS}
+        self.errors = []
+
+    def run(self):
+        from streamlit.testing.v1 import AppTest
+
+        self.app = AppTest.from_file(APP_FILE, default_timeout=self.timeout)
+        self.start_barrier.wait()
+        started = time.perf_counter()
+        try:
+            self.app.run()
+        except Exception as e:
+            self.errors.append(f"첫 실행: {e}")
+            return
+        self.first_run = time.perf_counter() - started
+        self.record_exceptions('첫 실행')
+
+        for step in range(self.reruns):
+            action = ACTIONS[step % len(ACTIONS)]
+            started = time.perf_counter()
+            try:
+                run_action(self.app, action, self.rng)
+            except Exception as e:
+                self.errors.append(f"{action}: {e}")
+                continue
+            self.latencies[action].append(time.perf_counter() - started)
+            self.record_exceptions(action)
+
+    def record_exceptions(self, action):
+        """스크립트 안에서 난 예외는 AppTest가 삼키고 exception 요소로 남김"""
+        for element in self.app.exception:
+            self.errors.append(f"{action}: {element.message}")
+
+
+class Updater(threading.Thread):
+    """interval초마다 다음 경기 결과를 실제(합성) 승자로 갱신"""
+
+    def __init__(self, pending, interval, stop):
+        super().__init__(name="updater", daemon=True)
+        self.pending = list(pending)
+        self.interval = interval
+        self.stop = stop
+        self.applied = []
+
+    def run(self):
+        updater = MatchUpdater(default_event())
+        for slot, winner in self.pending:
+            if self.stop.wait(self.interval):
+                return
+            started = time.perf_counter()
+            if updater.update_match_direct(slot, winner):
+                self.applied.append({'slot': slot, 'winner': winner,
+                                     'seconds': round(time.perf_counter() - started, 6)})
+
+
+def run_loadtest(args, workdir):
+    _, _, match_results = write_event(workdir, args.participants, args.seed, completed_matches=args.completed)
+    slots = Bracket().slots
+    pending = [(slot, match_results[slot]) for slot in slots[args.completed:args.completed + args.updates]
+               if match_results.get(slot)]
+
+    tracemalloc.start()
+    baseline_memory = tracemalloc.get_traced_memory()[0]
+    barrier = threading.Barrier(args.sessions + 1)
+    sessions = [Session(index, args.reruns, args.timeout, args.seed, barrier) for index in range(args.sessions)]
+    stop = threading.Event()
+    updater = Updater(pending, args.update_interval, stop)
+
+    for session in sessions:
+        session.start()
+    barrier.wait()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    updater.start()
+    for session in sessions:
+        session.join()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    stop.set()
+    updater.join()
+
+    # 세션 객체가 살아 있는 동안 잡힌 메모리 = 공유 캐시 + 세션별 상태
+    current_memory, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    all_latencies = [value for session in sessions for values in session.latencies.values() for value in values]
+    reruns = len(all_latencies) + sum(1 for session in sessions if session.first_run is not None)
+    return {
+        'participants': args.participants,
+        'sessions': args.sessions,
+        'wall_seconds': round(wall, 3),
+        'reruns': reruns,
+        'reruns_per_second': round(reruns / wall, 2) if wall > 0 else None,
+        'first_run': latency_summary([s.first_run for s in sessions if s.first_run is not None]),
+        'actions': {
+            action: latency_summary([value for s in sessions for value in s.latencies[action]])
+            for action in ACTIONS
+        },
+        'overall': latency_summary(all_latencies),
+        'cpu_seconds': round(cpu, 3),
+        'cpu_ms_per_rerun': round(cpu * 1000 / reruns, 1) if reruns else None,
+        'memory_per_session_bytes': (current_memory - baseline_memory) // max(1, args.sessions),
+        'traced_peak_bytes': peak_memory,
+        'max_rss_bytes': max_rss_bytes(),
+        'updates': updater.applied,
+        'errors': [f"{s.name} {error}" for s in sessions for error in s.errors],
+    }
+
+def print_report(report):
+    print(f"\n[참가자 {report['participants']:,}명, 세션 {report['sessions']}개] "
+          f"{report['reruns']}회 rerun / {report['wall_seconds']:.1f}초 "
+          f"({report['reruns_per_second'] or 0:.1f}회/초)")
+    print(f"  {'동작':<10} {'횟수':>6} {'p50':>10} {'p95':>10} {'p99':>10} {'최대':>10}")
+    rows = [('첫 실행', report['first_run'])] + list(report['actions'].items()) + [('전체', report['overall'])]
+    for label, summary in rows:
+        cells = [f"{summary[key]:8.1f}ms" if summary[key] is not None else f"{'-':>10}"
+                 for key in ('p50_ms', 'p95_ms', 'p99_ms', 'max_ms')]
+        print(f"  {label:<10} {summary['count']:>6} {' '.join(cells)}")
+    print(f"  CPU 시간: {report['cpu_seconds']:.2f}초 (rerun당 {report['cpu_ms_per_rerun'] or 0:.1f}ms)")
+    print(f"  세션당 메모리: {report['memory_per_session_bytes'] / 1024 / 1024:.1f}MB, "
+          f"추적 최대 {report['traced_peak_bytes'] / 1024 / 1024:.1f}MB, "
+          f"최대 RSS {report['max_rss_bytes'] / 1024 / 1024:.1f}MB")
+    for update in report['updates']:
+        print(f"  결과 갱신: {update['slot']} → {update['winner']} ({update['seconds'] * 1000:.1f}ms)")
+    if report['errors']:
+        print(f"\n⚠️ 오류 {len(report['errors'])}건:")
+        for error in report['errors'][:20]:
+            print(f"  - {error}")
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 동시 접속 부하 테스트")
+    parser.add_argument('--participants', type=int, default=100000)
+    parser.add_argument('--sessions', type=int, default=8)
+    parser.add_argument('--reruns', type=int, default=20, help="세션당 첫 실행 이후 rerun 횟수")
+    parser.add_argument('--updates', type=int, default=3, help="부하 중에 반영할 경기 결과 수")
+    parser.add_argument('--update-interval', type=float, default=2.0, help="결과 갱신 간격(초)")
+    parser.add_argument('--completed', type=int, default=4, help="시작 시점에 결과가 있는 슬롯 수")
+    parser.add_argument('--timeout', type=float, default=120.0, help="rerun 하나의 제한 시간(초)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=None, help="결과를 JSON으로 저장")
+    args = parser.parse_args()
+
+    try:
+        import streamlit.testing.v1  # noqa: F401
+    except ImportError:
+        raise SystemExit("streamlit(AppTest 포함 1.28 이상)이 필요합니다: pip install -r requirements.txt")
+
+    original_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        # 앱과 MatchUpdater는 현재 디렉터리의 기본 이벤트 파일을 읽고 씀
+        os.chdir(workdir)
+        try:
+            # 갱신 메시지가 표와 섞이지 않도록 측정 중 출력은 버림
+            with contextlib.redirect_stdout(io.StringIO()):
+                report = run_loadtest(args, workdir)
+        finally:
+            os.chdir(original_dir)
+
+    report.update({
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+    })
+    print_report(report)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if report['errors']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+참가자/예측 시트의 압축 메모리 모델
+
+예측 한 장을 {"nickname", "prediction": {11개 키 → 팀명}} dict로 들고 있지 않고,
+팀명과 슬롯 키를 작은 정수로 바꿔 참가자당 슬롯 수만큼의 바이트(행)로 저장합니다.
+모든 행은 하나의 bytearray에 이어 붙이므로 열(슬롯) 단위 조회는 슬라이스 한 번이고,
+틀린 개수 계산도 bytes.translate + 큰 정수 덧셈으로 파이썬 반복 없이 처리합니다.
+
+참가자 객체(Participant)와 시트(SheetView)는 필요할 때 만드는 __slots__ 뷰입니다.
+"""
+
+import sys
+from collections import Counter
+from collections.abc import Mapping
+
+from bracket import SLOT_KEYS
+
+MISSING = 0
+MAX_TEAMS = 255
+
+# 인코딩이 깨진 채 저장된 슬롯 키 → 올바른 키
+KEY_ALIASES = {
+    'GENì´ ê³ ë¥¸ íŒ€': 'GEN이 고른 팀'
+}
+
+
+class Interner:
+    """문자열 ↔ 작은 정수 ID (0은 빈 값)"""
+    __slots__ = ('names', 'ids')
+
+    def __init__(self, names=()):
+        self.names = [None]
+        self.ids = {}
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name):
+        if not name:
+            return MISSING
+        name_id = self.ids.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            if name_id > MAX_TEAMS:
+                raise ValueError(f"팀 종류가 너무 많습니다 (최대 {MAX_TEAMS}개)")
+            name = sys.intern(name)
+            self.names.append(name)
+            self.ids[name] = name_id
+        return name_id
+
+    def get(self, name):
+        """등록된 ID (없으면 None)"""
+        return self.ids.get(name)
+
+    def name(self, name_id):
+        return self.names[name_id]
+
+    def __len__(self):
+        return len(self.names) - 1
+
+
+class SheetView(Mapping):
+    """한 참가자 예측 시트의 읽기 전용 dict 뷰 (빈 슬롯은 키가 없는 것으로 취급)"""
+    __slots__ = ('_dataset', '_offset')
+
+    def __init__(self, dataset, index):
+        self._dataset = dataset
+        self._offset = index * dataset.width
+
+    def __getitem__(self, slot):
+        dataset = self._dataset
+        position = dataset.slot_index.get(slot)
+        if position is None:
+            raise KeyError(slot)
+        team_id = dataset.rows[self._offset + position]
+        if team_id == MISSING:
+            raise KeyError(slot)
+        return dataset.teams.names[team_id]
+
+    def __iter__(self):
+        dataset = self._dataset
+        row = dataset.rows[self._offset:self._offset + dataset.width]
+        return (slot for slot, team_id in zip(dataset.slots, row) if team_id != MISSING)
+
+    def __len__(self):
+        dataset = self._dataset
+        row = dataset.rows[self._offset:self._offset + dataset.width]
+        return dataset.width - row.count(MISSING)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class Participant:
+    """데이터셋 안의 참가자 한 명에 대한 가벼운 뷰"""
+    __slots__ = ('dataset', 'index')
+
+    def __init__(self, dataset, index):
+        self.dataset = dataset
+        self.index = index
+
+    @property
+    def nickname(self):
+        return self.dataset.nicknames[self.index]
+
+    @property
+    def row(self):
+        """팀 ID 행 (bytes)"""
+        width = self.dataset.width
+        return bytes(self.dataset.rows[self.index * width:(self.index + 1) * width])
+
+    @property
+    def prediction(self):
+        return SheetView(self.dataset, self.index)
+
+    def __getitem__(self, key):
+        # 기존 dict 레코드 방식(participant['prediction']) 호환
+        if key == 'nickname':
+            return self.nickname
+        if key == 'prediction':
+            return self.prediction
+        raise KeyError(key)
+
+    def to_dict(self):
+        return {'nickname': self.nickname, 'prediction': dict(self.prediction)}
+
+    def __repr__(self):
+        return f"Participant({self.nickname!r}, {dict(self.prediction)!r})"
+
+
+class RankedParticipant(Participant):
+    """틀린 개수가 붙은 참가자 뷰 (calculate_scores 결과)"""
+    __slots__ = ('wrong_predictions',)
+
+    def __init__(self, dataset, index, wrong_predictions):
+        super().__init__(dataset, index)
+        self.wrong_predictions = wrong_predictions
+
+    def __getitem__(self, key):
+        if key == 'wrong_predictions':
+            return self.wrong_predictions
+        return super().__getitem__(key)
+
+
+class PredictionDataset:
+    """참가자 닉네임 목록 + 슬롯별 팀 ID 행을 이어 붙인 bytearray"""
+    __slots__ = ('slots', 'slot_index', 'width', 'teams', 'nicknames', 'rows')
+
+    def __init__(self, slots=SLOT_KEYS, teams=()):
+        self.slots = [sys.intern(slot) for slot in slots]
+        self.slot_index = {slot: position for position, slot in enumerate(self.slots)}
+        self.width = len(self.slots)
+        self.teams = Interner(teams)
+        self.nicknames = []
+        self.rows = bytearray()
+
+    @classmethod
+    def from_records(cls, records, slots=SLOT_KEYS, key_aliases=KEY_ALIASES):
+        """[{'nickname', 'prediction'}] 레코드 목록으로 데이터셋 생성"""
+        dataset = cls(slots)
+        for record in records:
+            dataset.append(record['nickname'], record['prediction'], key_aliases)
+        return dataset
+
+    def append(self, nickname, prediction, key_aliases=KEY_ALIASES):
+        """참가자 한 명 추가 (알 수 없는 슬롯 키는 무시)"""
+        row = bytearray(self.width)
+        slot_index = self.slot_index
+        for key, team in prediction.items():
+            position = slot_index.get(key)
+            if position is None:
+                position = slot_index.get(key_aliases.get(key))
+                if position is None:
+                    continue
+            row[position] = self.teams.intern(team)
+        self.nicknames.append(nickname)
+        self.rows += row
+
+    def __len__(self):
+        return len(self.nicknames)
+
+    def __iter__(self):
+        return (Participant(self, index) for index in range(len(self.nicknames)))
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.nicknames)
+        if not 0 <= index < len(self.nicknames):
+            raise IndexError(index)
+        return Participant(self, index)
+
+    def column(self, slot):
+        """슬롯 하나의 참가자별 팀 ID (bytes, 참가자 순서)"""
+        position = self.slot_index[slot]
+        return bytes(self.rows[position::self.width])
+
+    def counts(self, slot):
+        """슬롯별 팀 선택 수 (Counter, 같은 수면 처음 등장한 팀이 앞)"""
+        column = self.column(slot)
+        found = []
+        for team_id in range(1, len(self.teams.names)):
+            marker = bytes((team_id,))
+            first = column.find(marker)
+            if first >= 0:
+                found.append((first, team_id, column.count(marker)))
+        found.sort()
+        return Counter({self.teams.names[team_id]: count for _, team_id, count in found})
+
+    def encode_results(self, match_results):
+        """경기 결과 dict → (슬롯 위치, 팀 ID) 목록 (결과가 없는 슬롯 제외)
+
+        아무도 고르지 않은 팀이 이긴 경우 팀 ID는 None입니다.
+        """
+        encoded = []
+        for slot, winner in match_results.items():
+            position = self.slot_index.get(slot)
+            if position is not None and winner:
+                encoded.append((position, self.teams.get(winner)))
+        return encoded
+
+    def wrong_counts(self, match_results, slots=None):
+        """참가자별 틀린 개수 (bytes, 참가자 순서)
+
+        예측이 비어 있는 슬롯은 틀린 것으로 세지 않습니다. 슬롯마다 열을 0/1 바이트로 바꾸고
+        바이트 단위 칸을 가진 큰 정수로 더하므로 (칸당 최대 슬롯 수 ≤ 255) 반복문이 없습니다.
+        """
+        count = len(self.nicknames)
+        if slots is not None:
+            match_results = {slot: match_results.get(slot) for slot in slots}
+        total = 0
+        for position, winner_id in self.encode_results(match_results):
+            table = bytearray(b'\x01' * 256)
+            table[MISSING] = 0
+            if winner_id is not None:
+                table[winner_id] = 0
+            column = self.rows[position::self.width]
+            total += int.from_bytes(column.translate(table), 'little')
+        return total.to_bytes(count, 'little')
+
+    def to_records(self):
+        """JSON 저장용 dict 레코드 목록"""
+        return [participant.to_dict() for participant in self]
+
+    def memory_usage(self):
+        """대략적인 메모리 사용량 (바이트)"""
+        return (sys.getsizeof(self.rows) + sys.getsizeof(self.nicknames)
+                + sum(sys.getsizeof(nickname) for nickname in self.nicknames))
+
+
+def as_dataset(predictions):
+    """dict 레코드 목록이 들어와도 데이터셋으로 변환 (이미 데이터셋이면 그대로)"""
+    if isinstance(predictions, PredictionDataset):
+        return predictions
+    return PredictionDataset.from_records(predictions or [])
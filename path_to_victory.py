@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+참가자별 우승 경로 찾기
+
+닉네임 하나에 대해 남은 경기 결과를 어떻게 채우면 1위(틀린 개수가 가장 적음, 동률은 공동 1위)가
+되는지 구체적인 결과 한 벌을 찾고, 어떤 결과로도 안 되면 그렇다고 답합니다.
+함께 모든 우승 경로에 공통으로 필요한 결과(꼭 나와야 하는 승자)를 돌려줍니다.
+
+남은 슬롯을 브라켓 순서(Bracket.slot_options로 대진이 정해지는 순서)대로 채우며 깊이 우선 탐색합니다.
+모든 경쟁자를 잎마다 다시 채점하지 않고, 경쟁자를 "틀린 개수 차이(경쟁자 - 대상)"별 비트맵으로
+묶어 슬롯마다 틀린 참가자 비트맵(bitsets.PickBitsets)으로 한꺼번에 옮깁니다.
+  - 차이가 남은 경기 수 이상인 경쟁자는 더는 앞설 수 없으므로 버립니다 (모두 버려지면 아래는 전부 우승).
+  - 차이가 -(남은 경기 수)보다 작은 경쟁자가 있으면 남은 결과로 따라잡을 수 없으므로 가지를 자릅니다.
+같은 대진 상태(남은 경기의 확정된 팀)와 같은 차이 분포로 다시 들어온 하위 브라켓은 메모한 답을 씁니다.
+
+사용법:
+    python path_to_victory.py 닉네임 [--event ID] [--sole] [--json]
+"""
+
+import argparse
+import json
+import sys
+
+import profiling
+from bitsets import column_bitmap, survivor_engine
+from bracket import Bracket
+from events import default_event, event_from_argv
+from model import as_dataset
+from rank_predictors import load_data
+
+
+class VictorySearch:
+    """예측 데이터와 현재 결과에 대한 우승 경로 탐색기 (참가자마다 find 호출)"""
+
+    def __init__(self, predictions, match_results, bracket=None):
+        self.bracket = bracket or Bracket()
+        self.dataset = as_dataset(predictions)
+        self.match_results = {slot: winner for slot, winner in match_results.items() if winner}
+        # 대시보드/트래커와 같은 비트맵을 공유
+        self.bitsets = survivor_engine(self.dataset, self.bracket).bitsets
+        self.wrong_counts = self.dataset.wrong_counts(self.match_results)
+        self.remaining = [slot for slot in self.bracket.slots if not self.match_results.get(slot)]
+        self.wrong_cache = {}
+        self.sheets = {}
+        self.rows = {}
+        for row, nickname in enumerate(self.dataset.nicknames):
+            self.rows.setdefault(nickname, row)
+
+    def wrong(self, slot, winner):
+        """slot 결과가 winner일 때 틀린 참가자 비트맵 (슬롯/승자별로 한 번만 계산)"""
+        key = (slot, winner)
+        bits = self.wrong_cache.get(key)
+        if bits is None:
+            bits = self.wrong_cache[key] = self.bitsets.wrong(slot, winner)
+        return bits
+
+    def structure(self, index, results):
+        """index 이후 슬롯의 대진을 정하는 값 (이미 확정된 팀 소스만, 미정은 None)"""
+        key = []
+        for slot in self.remaining[index:]:
+            if slot in self.bracket.choices:
+                sources = self.bracket.choices[slot]
+            else:
+                match = self.bracket.matches[slot]
+                sources = (match['team1'], match['team2'])
+            key.extend(self.bracket.resolve(source, results) for source in sources)
+        return tuple(key)
+
+    def pick(self, row, slot):
+        """row 참가자가 slot에 고른 팀 (비웠으면 None)"""
+        sheet = self.sheets.get(row)
+        if sheet is None:
+            sheet = self.sheets[row] = dict(self.dataset[row].prediction)
+        return sheet.get(slot)
+
+    def complete(self, index, results, row):
+        """아무 결과나 우승인 하위 브라켓을 대상의 예측 위주로 채운 결과 한 벌"""
+        scenario = {}
+        filled = dict(results)
+        for slot in self.remaining[index:]:
+            options = self.bracket.slot_options(slot, filled)
+            pick = self.pick(row, slot)
+            winner = pick if pick in options else options[0]
+            scenario[slot] = filled[slot] = winner
+        return scenario
+
+    def find(self, nickname, sole=False):
+        """닉네임의 우승 경로 (없는 닉네임이면 None)
+
+        sole이면 단독 1위만 인정합니다. 반환 dict:
+            possible   우승 가능 여부
+            scenario   우승하는 남은 결과 한 벌 (슬롯 → 승자)
+            required   모든 우승 경로에 공통인 결과 (슬롯 → 승자)
+            nodes      탐색한 노드 수
+        """
+        row = self.rows.get(nickname)
+        if row is None:
+            return None
+        target = 1 << row
+        base = self.wrong_counts[row]
+        # 차이(경쟁자 - 대상) → 경쟁자 비트맵, 단독 1위는 차이 1 이상이 조건이므로 1을 빼 둠
+        others = self.bitsets.everyone & ~target
+        margins = {
+            count - base - (1 if sole else 0): column_bitmap(self.wrong_counts, count) & others
+            for count in set(self.wrong_counts)
+        }
+
+        memo = {}
+        nodes = 0
+        results = dict(self.match_results)
+        total = len(self.remaining)
+
+        def search(index, margins):
+            nonlocal nodes
+            nodes += 1
+            left = total - index
+            margins = {margin: bits for margin, bits in margins.items() if bits and margin < left}
+            if any(margin + left < 0 for margin in margins):
+                return None
+            if not margins:
+                return {}, self.complete(index, results, row)
+
+            key = (index, self.structure(index, results), tuple(sorted(margins.items())))
+            if key in memo:
+                profiling.count('victory_memo_hits')
+                return memo[key]
+
+            slot = self.remaining[index]
+            options = self.bracket.slot_options(slot, results)
+            pick = self.pick(row, slot)
+            if pick in options:
+                options = [pick] + [option for option in options if option != pick]
+            found = []
+            for winner in options:
+                wrong = self.wrong(slot, winner)
+                target_wrong = 1 if wrong & target else 0
+                moved = {}
+                for margin, bits in margins.items():
+                    for shifted, part in ((margin + 1 - target_wrong, bits & wrong),
+                                          (margin - target_wrong, bits & ~wrong)):
+                        if part:
+                            moved[shifted] = moved.get(shifted, 0) | part
+                results[slot] = winner
+                child = search(index + 1, moved)
+                del results[slot]
+                if child is not None:
+                    found.append((winner, child))
+
+            answer = None
+            if found:
+                # 꼭 필요한 결과 = 우승하는 갈래들의 (이 슬롯 승자 + 하위 필요 결과) 교집합
+                first_winner, (required, scenario) = found[0]
+                required = {**required, slot: first_winner}
+                for winner, (child_required, _) in found[1:]:
+                    child_required = {**child_required, slot: winner}
+                    required = {key: value for key, value in required.items() if child_required.get(key) == value}
+                answer = required, {**scenario, slot: first_winner}
+            memo[key] = answer
+            return answer
+
+        with profiling.span('victory', 'search'):
+            answer = search(0, margins)
+        profiling.count('victory_nodes', nodes)
+        required, scenario = answer if answer is not None else ({}, None)
+        return {
+            'nickname': nickname,
+            'possible': answer is not None,
+            'sole': sole,
+            'wrong_predictions': base,
+            'remaining': list(self.remaining),
+            'scenario': {slot: scenario[slot] for slot in self.remaining} if scenario else None,
+            'required': {slot: required[slot] for slot in self.remaining if slot in required},
+            'nodes': nodes,
+        }
+
+    def final_standing(self, nickname, scenario):
+        """시나리오대로 끝났을 때 (틀린 개수, 순위, 같은 개수 참가자 수)"""
+        final_results = {**self.match_results, **(scenario or {})}
+        wrong_counts = self.dataset.wrong_counts(final_results)
+        wrong = wrong_counts[self.rows[nickname]]
+        rank = 1 + sum(1 for count in wrong_counts if count < wrong)
+        return wrong, rank, wrong_counts.count(wrong)
+
+
+def path_to_victory(predictions, match_results, nickname, bracket=None, sole=False):
+    """한 번만 조회할 때 쓰는 간단한 형태 (여러 닉네임이면 VictorySearch를 재사용)"""
+    return VictorySearch(predictions, match_results, bracket).find(nickname, sole)
+
+def display_path(search, result):
+    nickname = result['nickname']
+    goal = "단독 1위" if result['sole'] else "1위"
+    print(f"\n🏁 {nickname}님의 {goal} 경로 (현재 틀린 개수 {result['wrong_predictions']}개, "
+          f"남은 경기 {len(result['remaining'])}개)")
+    if not result['remaining']:
+        wrong, rank, tied = search.final_standing(nickname, {})
+        print(f"  모든 경기가 끝났습니다. 최종 {rank}위 (틀린 개수 {wrong}개)")
+        return
+    if not result['possible']:
+        print(f"  ❌ 남은 결과를 어떻게 채워도 {goal}가 될 수 없습니다.")
+        return
+
+    wrong, rank, tied = search.final_standing(nickname, result['scenario'])
+    print(f"  ✅ 가능합니다. 예를 들어 아래처럼 끝나면 {rank}위 (틀린 개수 {wrong}개, 같은 개수 {tied}명)")
+    for slot, winner in result['scenario'].items():
+        mark = "⭐" if slot in result['required'] else "  "
+        print(f"   {mark} {slot}: {winner}")
+    if result['required']:
+        needed = ', '.join(f"{slot} {winner}" for slot, winner in result['required'].items())
+        print(f"  ⭐ 꼭 필요한 결과 ({len(result['required'])}개): {needed}")
+    else:
+        print("  ⭐ 꼭 필요한 결과가 없습니다 (여러 경로로 우승 가능).")
+    print(f"  (탐색 노드 {result['nodes']}개)")
+
+def main():
+    parser = argparse.ArgumentParser(description="참가자별 우승 경로 찾기")
+    parser.add_argument('nickname')
+    parser.add_argument('--event', help="이벤트 ID")
+    parser.add_argument('--sole', action='store_true', help="공동 1위는 제외하고 단독 1위만 인정")
+    parser.add_argument('--json', action='store_true', help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+    event = event_from_argv(['--event', args.event]) if args.event else default_event()
+
+    predictions, match_results = load_data(event.predictions_file, event.results_file, event.bracket.slots)
+    if predictions is None:
+        sys.exit(1)
+    search = VictorySearch(predictions, match_results, event.bracket)
+    result = search.find(args.nickname, args.sole)
+    if result is None:
+        raise SystemExit(f"닉네임을 찾을 수 없습니다: {args.nickname}")
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        display_path(search, result)
+
+if __name__ == "__main__":
+    profiling.install_cli(sys.argv)
+    main()
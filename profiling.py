@@ -0,0 +1,255 @@
+"""
+단계별 계측 (span/카운터)
+
+load, parse, extract, score, aggregate, render 단계에 이름 붙은 span을 두고
+댓글 스캔 수, 정규식 호출 수, 점수 계산 인원 같은 카운터를 모읍니다.
+비활성화 상태에서는 span()이 공용 no-op 객체를 돌려주고 count()는 바로 반환하므로
+비용이 거의 없습니다. CLI는 enable()로 프로세스 전체를 계측하고, 여러 요청을 동시에 처리하는
+서버(대시보드)는 recording()으로 요청(rerun)마다 따로 기록합니다. 반복문 안에서는 지역 변수로 세고 끝난 뒤 한 번만 count() 하세요.
+
+CLI에서는 `profiling.install_cli(sys.argv)`가 다음 옵션을 처리합니다:
+    --profile [trace.json]     JSON 트레이스 (chrome://tracing / Perfetto 호환)
+    --cprofile out.prof        cProfile 통계 덤프
+    --tracemalloc out.txt      메모리 할당 상위 위치 덤프
+"""
+
+import atexit
+import contextvars
+import functools
+import json
+import os
+import time
+from collections import Counter
+
+STAGES = ('load', 'parse', 'extract', 'score', 'aggregate', 'render')
+
+
+class _Recorder:
+    """span 기록과 카운터 한 벌 (프로세스 전역용 하나 + recording()마다 하나)"""
+    __slots__ = ('origin', 'events', 'counters', 'stack')
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events = []
+        self.counters = Counter()
+        self.stack = []
+
+
+_enabled = False
+_global = _Recorder()
+# recording() 안에서는 이 컨텍스트(스레드/작업)의 기록기, 밖에서는 None
+_current = contextvars.ContextVar('profiling_recorder', default=None)
+
+
+def _active():
+    """지금 기록할 곳 (계측이 꺼져 있으면 None)"""
+    recorder = _current.get()
+    if recorder is None and _enabled:
+        return _global
+    return recorder
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('recorder', 'stage', 'name', 'start', 'child_time')
+
+    def __init__(self, recorder, stage, name):
+        self.recorder = recorder
+        self.stage = stage
+        self.name = name
+        self.child_time = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self.recorder.stack.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter()
+        stack = self.recorder.stack
+        stack.pop()
+        duration = end - self.start
+        if stack:
+            stack[-1].child_time += duration
+        self.recorder.events.append({
+            'name': self.name,
+            'cat': self.stage,
+            'ph': 'X',
+            'ts': round((self.start - self.recorder.origin) * 1e6, 1),
+            'dur': round(duration * 1e6, 1),
+            'pid': os.getpid(),
+            'tid': 0,
+            'args': {'depth': len(stack), 'self_us': round((duration - self.child_time) * 1e6, 1)},
+        })
+        return False
+
+
+def enable():
+    """프로세스 전체 계측 시작 (이전 기록은 지움, CLI용)"""
+    global _enabled
+    reset()
+    _enabled = True
+
+def disable():
+    global _enabled
+    _enabled = False
+
+def is_enabled():
+    return _active() is not None
+
+def reset():
+    """프로세스 전역 span과 카운터 초기화"""
+    global _global
+    _global = _Recorder()
+
+class recording:
+    """with 블록 안에서 이 컨텍스트에서만 계측하고 기록기를 돌려줌 (summary(recorder)로 요약)
+
+    contextvars로 격리되므로 Streamlit 세션처럼 스레드마다 도는 rerun이 동시에 계측해도
+    서로의 기록이 섞이지 않고 다른 세션의 계측을 켜거나 끄지 않습니다.
+    """
+    __slots__ = ('recorder', 'token')
+
+    def __enter__(self):
+        self.recorder = _Recorder()
+        self.token = _current.set(self.recorder)
+        return self.recorder
+
+    def __exit__(self, *exc_info):
+        _current.reset(self.token)
+        return False
+
+def span(stage, name=None):
+    """단계 span (with 문으로 사용)"""
+    recorder = _active()
+    if recorder is None:
+        return _NULL_SPAN
+    return _Span(recorder, stage, name or stage)
+
+def count(name, amount=1):
+    """카운터 증가"""
+    recorder = _active()
+    if recorder is not None:
+        recorder.counters[name] += amount
+
+def traced(stage, name=None):
+    """함수 전체를 span으로 감싸는 데코레이터"""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = _active()
+            if recorder is None:
+                return func(*args, **kwargs)
+            with _Span(recorder, stage, label):
+                return func(*args, **kwargs)
+
+        return wrapper
+    return decorator
+
+def summary(recorder=None):
+    """span 이름별 호출 수/총 소요 시간(ms), 단계별 자체 시간 합계, 카운터
+
+    recorder를 주지 않으면 프로세스 전역 기록을 요약합니다.
+    단계 합계는 하위 span 시간을 뺀 자체 시간 기준이라 중첩되어도 중복 집계되지 않습니다.
+    """
+    recorder = recorder or _global
+    by_name = {}
+    by_stage = {stage: 0.0 for stage in STAGES}
+    for event in recorder.events:
+        entry = by_name.setdefault(event['name'], {'stage': event['cat'], 'calls': 0, 'total_ms': 0.0})
+        entry['calls'] += 1
+        entry['total_ms'] += event['dur'] / 1000
+        by_stage[event['cat']] = by_stage.get(event['cat'], 0.0) + event['args']['self_us'] / 1000
+
+    for entry in by_name.values():
+        entry['total_ms'] = round(entry['total_ms'], 3)
+    return {
+        'spans': by_name,
+        'stages_ms': {stage: round(total, 3) for stage, total in by_stage.items()},
+        'counters': dict(recorder.counters),
+    }
+
+def write_trace(path):
+    """Chrome 트레이스 형식 JSON 저장 (요약과 카운터 포함)"""
+    trace = {
+        'traceEvents': list(_global.events),
+        'displayTimeUnit': 'ms',
+        'summary': summary(),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(trace, f, ensure_ascii=False, indent=2)
+
+def _pop_option(argv, flag, default=None):
+    """argv에서 옵션과 값을 제거하고 값 반환 (옵션이 없으면 None)
+
+    default가 있으면 값은 생략 가능하며, 다음 인자가 .json 파일일 때만 값으로 취급합니다.
+    """
+    if flag not in argv:
+        return None
+    index = argv.index(flag)
+    del argv[index]
+    has_value = index < len(argv) and not argv[index].startswith('-')
+    if default is not None:
+        if has_value and argv[index].endswith('.json'):
+            return argv.pop(index)
+        return default
+    if not has_value:
+        raise SystemExit(f"{flag} 옵션에는 파일 경로가 필요합니다.")
+    return argv.pop(index)
+
+def install_cli(argv):
+    """--profile/--cprofile/--tracemalloc 옵션을 argv에서 제거하고 종료 시 결과 저장"""
+    trace_path = _pop_option(argv, '--profile', default='profile_trace.json')
+    cprofile_path = _pop_option(argv, '--cprofile')
+    tracemalloc_path = _pop_option(argv, '--tracemalloc')
+
+    if not (trace_path or cprofile_path or tracemalloc_path):
+        return False
+
+    enable()
+
+    profiler = None
+    if cprofile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    if tracemalloc_path:
+        import tracemalloc
+        tracemalloc.start()
+
+    def finish():
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(cprofile_path)
+            print(f"cProfile 저장: {cprofile_path}")
+        if tracemalloc_path:
+            import tracemalloc
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            with open(tracemalloc_path, 'w', encoding='utf-8') as f:
+                f.write(f"current={current} peak={peak}\n")
+                for stat in snapshot.statistics('lineno')[:30]:
+                    f.write(f"{stat}\n")
+            print(f"tracemalloc 저장: {tracemalloc_path}")
+        if trace_path:
+            write_trace(trace_path)
+            print(f"트레이스 저장: {trace_path}")
+
+    atexit.register(finish)
+    return True
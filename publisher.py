@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+경기 결과 Git 게시 대기열 (백그라운드 커밋/푸시)
+
+update_match.py는 결과 파일을 저장한 뒤 커밋/푸시를 기다리지 않고 이 대기열에 작업을 넣습니다.
+별도 작업 프로세스가 대기열을 비우면서
+  - 짧은 시간(COALESCE_SECONDS) 안에 들어온 여러 결과를 커밋 하나로 합치고
+  - 푸시는 실패하면 지수 백오프로 다시 시도하며
+  - 진행 상황을 상태 파일(.publish/status.json)에 기록합니다.
+
+대기열은 .publish/queue.jsonl에 한 줄씩 추가되고, 작업 프로세스는 같은 잠금 파일(flock)을 잡은 채로
+대기열을 inflight.jsonl로 옮겨서 가져갑니다. 도중에 종료돼도 두 파일과
+푸시 대기 표시(push_pending)가 남아 있으므로 다음 실행(또는 `python publisher.py run`)에서 이어서 처리합니다.
+이미 커밋된 작업을 다시 처리하면 바뀐 내용이 없어 커밋을 건너뜁니다.
+
+사용법:
+    python publisher.py status       # 상태 확인
+    python publisher.py run          # 남은 대기열을 지금 처리 (포그라운드)
+"""
+
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows: 잠금 없이 동작 (한 줄 append는 그대로 안전)
+    fcntl = None
+
+PUBLISH_DIR = '.publish'
+QUEUE_FILE = 'queue.jsonl'
+INFLIGHT_FILE = 'inflight.jsonl'
+PUSH_PENDING_FILE = 'push_pending'
+STATUS_FILE = 'status.json'
+PID_FILE = 'worker.pid'
+LOCK_FILE = 'lock'
+
+# 이 시간 동안 들어온 결과는 커밋 하나로 합침
+COALESCE_SECONDS = 2.0
+# 대기열이 빈 채로 이만큼 지나면 작업 프로세스 종료
+LINGER_SECONDS = 10.0
+PUSH_RETRIES = 6
+BACKOFF_BASE = 2.0
+BACKOFF_MAX = 60.0
+GIT_TIMEOUT = 120
+
+
+def now_text():
+    return datetime.now().isoformat(timespec='seconds')
+
+def backoff_delay(attempt):
+    """attempt번째 실패 후 기다릴 시간 (2, 4, 8 ... 최대 60초)"""
+    return min(BACKOFF_BASE * (2 ** (attempt - 1)), BACKOFF_MAX)
+
+def pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+class Publisher:
+    """repo_dir 저장소의 게시 대기열"""
+
+    def __init__(self, repo_dir='.', remote=None, branch=None):
+        self.repo_dir = os.path.abspath(repo_dir)
+        self.remote = remote
+        self.branch = branch
+        self.directory = os.path.join(self.repo_dir, PUBLISH_DIR)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    @contextlib.contextmanager
+    def locked(self):
+        """대기열 파일 잠금 (추가와 가져가기가 겹치지 않도록)"""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path(LOCK_FILE), 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    # --- 대기열 (update_match 쪽) ---
+
+    def enqueue(self, paths, message, push=True):
+        """커밋할 파일과 메시지를 대기열에 추가 (바로 반환)"""
+        job = {
+            'paths': [os.path.relpath(os.path.abspath(path), self.repo_dir) for path in paths],
+            'message': message,
+            'push': push,
+            'queued_at': now_text(),
+        }
+        line = (json.dumps(job, ensure_ascii=False) + '\n').encode('utf-8')
+        with self.locked():
+            fd = os.open(self.path(QUEUE_FILE), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        self.write_status(pending=self.pending_count(), last_queued_at=job['queued_at'])
+        return job
+
+    def pending_count(self):
+        count = 0
+        for name in (QUEUE_FILE, INFLIGHT_FILE):
+            try:
+                with open(self.path(name), 'r', encoding='utf-8') as f:
+                    count += sum(1 for line in f if line.strip())
+            except FileNotFoundError:
+                pass
+        return count
+
+    def worker_pid(self):
+        """살아 있는 작업 프로세스의 PID (없으면 None)"""
+        try:
+            with open(self.path(PID_FILE), 'r', encoding='utf-8') as f:
+                pid = int(f.read().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return None
+        return pid if pid and pid_alive(pid) else None
+
+    def ensure_worker(self):
+        """작업 프로세스가 없으면 분리된 프로세스로 시작 (터미널을 막지 않음)
+
+        PID 확인은 작업 프로세스의 종료 판단(retire)과 같은 잠금 안에서 하므로, 종료 직전의
+        작업 프로세스를 보고 시작을 건너뛰었는데 그 프로세스가 새 작업을 못 본 채 끝나는 일이 없습니다.
+        """
+        with self.locked():
+            if self.worker_pid() is not None:
+                return False
+            self.spawn_worker()
+        return True
+
+    def spawn_worker(self):
+        command = [sys.executable, os.path.abspath(__file__), 'run', '--repo', self.repo_dir]
+        if self.remote:
+            command += ['--remote', self.remote]
+        if self.branch:
+            command += ['--branch', self.branch]
+        subprocess.Popen(
+            command, cwd=self.repo_dir, start_new_session=True,
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+    # --- 상태 파일 ---
+
+    def read_status(self):
+        try:
+            with open(self.path(STATUS_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {'state': 'idle'}
+
+    def write_status(self, **changes):
+        """상태 파일 갱신 (임시 파일에 쓴 뒤 교체)"""
+        os.makedirs(self.directory, exist_ok=True)
+        status = self.read_status()
+        status.update(changes)
+        status['updated_at'] = now_text()
+        tmp_path = f"{self.path(STATUS_FILE)}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(status, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path(STATUS_FILE))
+        return status
+
+    # --- 작업 프로세스 ---
+
+    def git(self, *args):
+        env = dict(os.environ, GIT_TERMINAL_PROMPT='0')
+        return subprocess.run(['git', *args], cwd=self.repo_dir, capture_output=True, text=True,
+                              env=env, timeout=GIT_TIMEOUT)
+
+    def claim_jobs(self):
+        """대기열을 inflight로 옮겨 가져옴 (이전 실행이 남긴 inflight가 있으면 함께)"""
+        with self.locked():
+            try:
+                with open(self.path(QUEUE_FILE), 'r', encoding='utf-8') as f:
+                    claimed = f.read()
+            except FileNotFoundError:
+                claimed = ''
+            if claimed:
+                with open(self.path(INFLIGHT_FILE), 'a', encoding='utf-8') as f:
+                    f.write(claimed)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.remove(self.path(QUEUE_FILE))
+
+        try:
+            with open(self.path(INFLIGHT_FILE), 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return []
+        jobs = []
+        for line in lines:
+            if line.strip():
+                try:
+                    jobs.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return jobs
+
+    def commit_jobs(self, jobs):
+        """작업들을 커밋 하나로 반영 (바뀐 내용이 없으면 커밋 생략)"""
+        paths = sorted({path for job in jobs for path in job['paths']})
+        added = self.git('add', '--', *paths)
+        if added.returncode != 0:
+            raise RuntimeError(f"git add 실패: {added.stderr.strip()}")
+
+        if self.git('diff', '--cached', '--quiet', '--', *paths).returncode == 0:
+            committed = None
+        else:
+            if len(jobs) == 1:
+                message = jobs[0]['message']
+            else:
+                message = f"Update: {len(jobs)}건 결과 반영\n\n" + '\n'.join(f"- {job['message']}" for job in jobs)
+            result = self.git('commit', '-m', message, '--', *paths)
+            if result.returncode != 0:
+                raise RuntimeError(f"git commit 실패: {result.stderr.strip() or result.stdout.strip()}")
+            committed = self.git('rev-parse', '--short', 'HEAD').stdout.strip()
+
+        if any(job.get('push', True) for job in jobs):
+            with open(self.path(PUSH_PENDING_FILE), 'w', encoding='utf-8') as f:
+                f.write(now_text())
+        os.remove(self.path(INFLIGHT_FILE))
+        return committed
+
+    def push(self):
+        command = ['push']
+        if self.remote:
+            command.append(self.remote)
+            if self.branch:
+                command.append(self.branch)
+        result = self.git(*command)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or result.stdout.strip() or "git push 실패")
+
+    def acquire(self):
+        """작업 프로세스 하나만 실행되도록 PID 파일 생성 (이미 있으면 False)"""
+        os.makedirs(self.directory, exist_ok=True)
+        for _ in range(2):
+            try:
+                fd = os.open(self.path(PID_FILE), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                if self.worker_pid() is not None:
+                    return False
+                # 비정상 종료로 남은 PID 파일
+                try:
+                    os.remove(self.path(PID_FILE))
+                except FileNotFoundError:
+                    pass
+                continue
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(str(os.getpid()))
+            return True
+        return False
+
+    def release(self):
+        """이 프로세스의 PID 파일 삭제 (잠금 안에서 호출, 다른 작업 프로세스의 파일은 그대로 둠)"""
+        try:
+            with open(self.path(PID_FILE), 'r', encoding='utf-8') as f:
+                if f.read().strip() != str(os.getpid()):
+                    return
+            os.remove(self.path(PID_FILE))
+        except FileNotFoundError:
+            pass
+
+    def queue_empty(self):
+        try:
+            return os.path.getsize(self.path(QUEUE_FILE)) == 0
+        except FileNotFoundError:
+            return True
+
+    def retire(self):
+        """대기열이 비었으면 PID 파일을 지우고 True (확인과 삭제를 한 잠금 안에서 처리)
+
+        enqueue는 같은 잠금 안에서 추가하고 ensure_worker도 같은 잠금 안에서 PID를 보므로
+        이 확인 뒤에 들어온 작업은 PID 파일이 없는 것을 보고 새 작업 프로세스를 시작합니다.
+        """
+        with self.locked():
+            if not self.queue_empty():
+                return False
+            self.write_status(state='idle', pending=self.pending_count())
+            self.release()
+            return True
+
+    def run(self, coalesce=COALESCE_SECONDS, linger=LINGER_SECONDS, retries=PUSH_RETRIES):
+        """대기열이 빌 때까지 커밋/푸시 (성공 True, 실패 False, 다른 작업 프로세스가 있으면 None)"""
+        if not self.acquire():
+            return None
+        try:
+            attempts = 0
+            retry_at = 0.0
+            idle_since = time.monotonic()
+            while True:
+                # 연달아 들어오는 결과를 모아서 한 번에 커밋
+                time.sleep(coalesce)
+                jobs = self.claim_jobs()
+                if jobs:
+                    idle_since = time.monotonic()
+                    self.write_status(state='committing', pending=len(jobs))
+                    try:
+                        committed = self.commit_jobs(jobs)
+                    except (RuntimeError, subprocess.TimeoutExpired) as e:
+                        # 커밋 실패는 다시 시도해도 같을 가능성이 높으므로 작업을 남겨 두고 종료
+                        self.write_status(state='failed', last_error=str(e), pending=self.pending_count())
+                        return False
+                    if committed:
+                        self.write_status(last_commit=committed, last_commit_at=now_text(),
+                                          last_commit_jobs=len(jobs))
+
+                if os.path.exists(self.path(PUSH_PENDING_FILE)):
+                    if time.monotonic() < retry_at:
+                        continue
+                    self.write_status(state='pushing', attempts=attempts, pending=self.pending_count())
+                    try:
+                        self.push()
+                    except (RuntimeError, subprocess.TimeoutExpired) as e:
+                        attempts += 1
+                        if attempts > retries:
+                            # 푸시 대기 표시는 남겨 두어 다음 실행에서 다시 시도
+                            self.write_status(state='push_failed', attempts=attempts, last_error=str(e))
+                            return False
+                        delay = backoff_delay(attempts)
+                        retry_at = time.monotonic() + delay
+                        self.write_status(state='retrying', attempts=attempts, last_error=str(e),
+                                          next_retry_in=delay)
+                        continue
+                    os.remove(self.path(PUSH_PENDING_FILE))
+                    attempts = 0
+                    retry_at = 0.0
+                    self.write_status(state='pushed', attempts=0, last_push_at=now_text(),
+                                      last_error=None, pending=self.pending_count())
+                    idle_since = time.monotonic()
+                elif not jobs and time.monotonic() - idle_since >= linger and self.retire():
+                    return True
+        finally:
+            with self.locked():
+                self.release()
+
+
+def print_status(publisher):
+    status = publisher.read_status()
+    worker = publisher.worker_pid()
+    print(f"상태: {status.get('state', 'idle')}  (대기 중인 작업 {publisher.pending_count()}건, "
+          f"작업 프로세스 {'PID ' + str(worker) if worker else '없음'})")
+    if os.path.exists(publisher.path(PUSH_PENDING_FILE)):
+        print("푸시 대기 중인 커밋이 있습니다.")
+    for key, label in (('last_commit', '마지막 커밋'), ('last_commit_at', '커밋 시각'),
+                       ('last_push_at', '마지막 푸시'), ('attempts', '푸시 재시도'),
+                       ('last_error', '마지막 오류'), ('updated_at', '갱신 시각')):
+        if status.get(key):
+            print(f"  {label}: {status[key]}")
+
+def pop_value(argv, flag):
+    if flag not in argv:
+        return None
+    index = argv.index(flag)
+    del argv[index]
+    if index >= len(argv):
+        raise SystemExit(f"{flag} 옵션에는 값이 필요합니다.")
+    return argv.pop(index)
+
+def main():
+    argv = sys.argv[1:]
+    repo_dir = pop_value(argv, '--repo') or '.'
+    remote = pop_value(argv, '--remote')
+    branch = pop_value(argv, '--branch')
+    publisher = Publisher(repo_dir, remote, branch)
+
+    command = argv[0] if argv else 'status'
+    if command == 'status':
+        print_status(publisher)
+    elif command == 'run':
+        result = publisher.run()
+        if result is None:
+            print("이미 다른 작업 프로세스가 실행 중입니다.")
+        elif not result:
+            print(f"❌ 게시 실패: {publisher.read_status().get('last_error')}")
+            sys.exit(1)
+    else:
+        raise SystemExit("사용법: python publisher.py [status|run] [--repo 경로] [--remote 이름 --branch 이름]")
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,18 @@
 import json
+import sys
 from collections import defaultdict
 
-def load_data(predictions_file, results_file):
+import profiling
+from contrarian import contrarian_scores
+from data_cache import load_predictions
+from events import event_from_argv
+from model import RankedParticipant, as_dataset
+
+@profiling.traced('load')
+def load_data(predictions_file, results_file, slots=None):
     """예측 데이터와 경기 결과 데이터를 로드합니다."""
     try:
-        with open(predictions_file, 'r', encoding='utf-8') as f:
-            predictions = json.load(f)
+        predictions = load_predictions(predictions_file, slots)
     except FileNotFoundError:
         print(f"오류: '{predictions_file}' 파일을 찾을 수 없습니다.")
         return None, None
@@ -31,50 +38,42 @@ def load_data(predictions_file, results_file):
 
     return predictions, match_results
 
+@profiling.traced('score')
 def calculate_scores(predictions, match_results):
     """참가자별 점수(틀린 개수)를 계산합니다."""
-    participant_scores = []
-    for participant in predictions:
-        nickname = participant['nickname']
-        prediction_data = participant['prediction']
-        wrong_predictions = 0
-
-        for match_key, actual_winner in match_results.items():
-            user_prediction = prediction_data.get(match_key)
-            if user_prediction and user_prediction != actual_winner:
-                wrong_predictions += 1
-        
-        participant_scores.append({
-            'nickname': nickname,
-            'wrong_predictions': wrong_predictions,
-            'prediction': prediction_data
-        })
+    dataset = as_dataset(predictions)
+    wrong_counts = dataset.wrong_counts(match_results)
+    nicknames = dataset.nicknames
     
     # 점수(틀린 개수)가 낮은 순으로, 같으면 닉네임 가나다순으로 정렬
-    participant_scores.sort(key=lambda x: (x['wrong_predictions'], x['nickname']))
+    order = sorted(range(len(dataset)), key=lambda index: (wrong_counts[index], nicknames[index]))
+    participant_scores = [RankedParticipant(dataset, index, wrong_counts[index]) for index in order]
+    profiling.count('participants_scored', len(participant_scores))
     
     return participant_scores
 
+@profiling.traced('render')
 def display_top_predictors(ranked_scores):
     """가장 높은 점수를 획득한 참가자 정보를 출력합니다."""
     if not ranked_scores:
         print("분석할 참가자 데이터가 없습니다.")
         return
 
-    top_score = ranked_scores[0]['wrong_predictions']
-    top_predictors = [p for p in ranked_scores if p['wrong_predictions'] == top_score]
+    top_score = ranked_scores[0].wrong_predictions
+    top_predictors = [p for p in ranked_scores if p.wrong_predictions == top_score]
 
     print("=" * 50)
     print(f"🏆 현재 1위 (틀린 개수: {top_score}개)")
     print("-" * 50)
 
     for predictor in top_predictors:
-        print(f"닉네임: {predictor['nickname']}")
+        print(f"닉네임: {predictor.nickname}")
         print("  [예측 내용]")
-        for match, winner in predictor['prediction'].items():
+        for match, winner in predictor.prediction.items():
             print(f"    - {match:<15}: {winner}")
         print("-" * 50)
 
+@profiling.traced('render')
 def display_all_ranks(ranked_scores):
     """전체 참가자 순위를 닉네임으로 출력합니다."""
     print("\n" + "=" * 50)
@@ -84,19 +83,63 @@ def display_all_ranks(ranked_scores):
     # 점수별로 그룹화
     scores_by_rank = defaultdict(list)
     for score_data in ranked_scores:
-        scores_by_rank[score_data['wrong_predictions']].append(score_data['nickname'])
+        scores_by_rank[score_data.wrong_predictions].append(score_data.nickname)
 
     for wrong_count, nicknames in sorted(scores_by_rank.items()):
         print(f"[{wrong_count}개 틀림] ({len(nicknames)}명)")
         print(', '.join(nicknames))
         print()
 
+@profiling.traced('render')
+def display_contrarian_ranks(ranked_scores, predictions, match_results, bracket=None):
+    """순위표에 역배 점수 열을 붙여 출력 (역배 적중: 맞힌 선택의 희귀도 합, 역배 점수: 시트 전체)
+
+    ranked_scores는 predictions에 대한 calculate_scores 결과여야 합니다 (행 번호 score.index로
+    점수를 찾으므로 같은 닉네임이 여럿이어도 각자의 점수가 나옴).
+    """
+    dataset = as_dataset(predictions)
+    scores, hits = contrarian_scores(dataset, match_results, bracket)
+    
+    print("\n" + "=" * 50)
+    print("🎲 순위표 (역배 점수 포함, 선택 비율 p의 -ln p 합)")
+    print("-" * 50)
+    print(f"{'순위':>4}  {'닉네임':<20} {'틀림':>4} {'역배 적중':>9} {'역배 점수':>9}")
+    
+    rank = 0
+    previous_wrong = None
+    for position, score_data in enumerate(ranked_scores, 1):
+        if score_data.wrong_predictions != previous_wrong:
+            rank = position
+            previous_wrong = score_data.wrong_predictions
+        hit, score = hits[score_data.index], scores[score_data.index]
+        print(f"{rank:>4}  {score_data.nickname:<20} {score_data.wrong_predictions:>4} {hit:>9.2f} {score:>9.2f}")
+
 def main():
-    predictions, match_results = load_data('predictions.json', 'match_result.txt')
+    event = event_from_argv(sys.argv)
+    show_contrarian = '--contrarian' in sys.argv
+    store = event.open_store()
+    if store is not None:
+        # DB가 있으면 순위 계산을 SQL로 (예측 내용은 1위만 조회)
+        match_results = {slot: winner for slot, winner in store.load_results().items() if winner}
+        if match_results:
+            ranked_scores = store.ranking()
+            display_top_predictors(ranked_scores)
+            display_all_ranks(ranked_scores)
+            if show_contrarian:
+                # SQL 순위 행에는 데이터셋 행 번호가 없으므로 같은 순서로 다시 매김
+                dataset = store.load_dataset(event.bracket.slots)
+                display_contrarian_ranks(calculate_scores(dataset, match_results), dataset,
+                                         match_results, event.bracket)
+        return
+    
+    predictions, match_results = load_data(event.predictions_file, event.results_file, event.bracket.slots)
     if predictions and match_results:
         ranked_scores = calculate_scores(predictions, match_results)
         display_top_predictors(ranked_scores)
         display_all_ranks(ranked_scores)
+        if show_contrarian:
+            display_contrarian_ranks(ranked_scores, predictions, match_results, event.bracket)
 
 if __name__ == "__main__":
+    profiling.install_cli(sys.argv)
     main()
\ No newline at end of file
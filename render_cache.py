@@ -0,0 +1,93 @@
+"""
+결과 버전별 렌더링 캐시
+
+브라켓 카드 HTML과 차트(Plotly 그림 객체)는 경기 결과(또는 예측 파일)가 바뀔 때만 달라지므로
+(이벤트, 결과 버전, 매치 ID) 같은 키로 완성된 조각을 한 번만 만들어 두고 모든 세션이 함께 씁니다.
+rerun은 사전 조회만 하고, 결과가 바뀌면 버전이 달라져 새 키로 다시 만들어집니다.
+오래된 버전의 조각은 LRU로 밀려나므로 메모리는 RENDER_CACHE_SIZE개로 제한됩니다.
+
+만약에 탭의 가상 결과도 results_version으로 버전을 정하므로 같은 조합을 고른 세션끼리 공유됩니다.
+"""
+
+import threading
+
+import profiling
+from bracket import results_version
+from dashboard_render import match_card_html
+from data_cache import LRUCache
+
+# 카드 10개 x 결과 조합 수십 개 + 차트/통계 몇 개를 담을 정도
+RENDER_CACHE_SIZE = 512
+
+
+class RenderCache:
+    """스레드 간 공유되는 크기 제한 LRU (값은 만든 뒤 바꾸지 않는 문자열/dict/그림)"""
+
+    def __init__(self, maxsize=RENDER_CACHE_SIZE):
+        self.entries = LRUCache(maxsize)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key, build):
+        """key에 해당하는 값 반환 (없으면 build()로 만들어 저장)"""
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.hits += 1
+                profiling.count('render_cache_hit')
+                return value
+        # 만드는 동안 다른 세션을 막지 않음 (동시에 같은 키를 만들면 결과가 같으므로 나중 것이 덮어씀)
+        value = build()
+        with self.lock:
+            self.entries.put(key, value)
+            self.misses += 1
+        profiling.count('render_cache_miss')
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'maxsize': self.entries.maxsize,
+                    'hits': self.hits, 'misses': self.misses}
+
+
+_cache = RenderCache()
+
+
+def render_cache():
+    """프로세스 전역 렌더링 캐시"""
+    return _cache
+
+def cached(key, build):
+    """임의의 렌더링 결과(배너 HTML, 통계 dict 등)를 key로 캐시"""
+    return _cache.get_or_build(key, build)
+
+def bracket_cards_html(event_id, match_results, schedule, bracket):
+    """매치 ID → 카드 HTML (결과 버전과 매치 ID별로 캐시, 대진 계산도 캐시에 없을 때만)"""
+    version = results_version(match_results)
+    cards = []
+
+    def build(match_id):
+        if not cards:
+            cards.append(bracket.cards(match_results))
+        card = cards[0][match_id]
+        return match_card_html(match_id, card['team1'], card['team2'], card['winner'], schedule.get(match_id, ''))
+
+    return {
+        match_id: _cache.get_or_build(('card', event_id, version, match_id), lambda match_id=match_id: build(match_id))
+        for match_id in bracket.match_keys
+    }
+
+def cached_figure(key, build_figure):
+    """만든 Plotly 그림 객체를 캐시 (build_figure는 캐시에 없을 때만 호출)
+
+    st.plotly_chart는 그림 객체를 받으면 검증을 건너뛰고 그대로 직렬화하지만, dict나 JSON을 받으면
+    매번 go.Figure를 새로 만들어 검증하므로 JSON이 아닌 객체를 캐시해 그대로 넘깁니다.
+    그림은 만든 뒤 바꾸지 않으므로 세션 간에 공유해도 안전합니다.
+    """
+    return _cache.get_or_build(('figure',) + tuple(key), build_figure)
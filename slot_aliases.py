@@ -0,0 +1,94 @@
+"""
+슬롯 키 오타 보정
+
+"R1M1", "R1-M1", "r3 ub", "그랜드파이널", "R1 M1：T1" 처럼 정확한 키(정규식)로는 찾지 못한 표기를
+브라켓의 슬롯 키로 되돌립니다. 비교 전에 NFKC + 소문자로 바꾸고 공백과 '-', '_', '.'을 지웁니다
+(전각 콜론은 NFKC에서 ':'가 됩니다).
+
+슬롯 키와 별칭을 하나의 트라이로 묶어 두고, 줄의 키 부분을 트라이를 따라가며 편집 거리 표를
+한 줄씩 이어 계산합니다 (Levenshtein). 표의 최솟값이 허용 거리를 넘는 가지는 더 내려가지 않으므로
+키 부분 하나당 트라이의 앞부분 몇 개 노드만 방문합니다. 허용 거리는 키 길이에 따라 0~2이고,
+서로 다른 슬롯이 같은 거리로 맞으면 ("r1m" → R1 M1 / R1 M2) 모호하므로 보정하지 않습니다.
+"""
+
+import re
+import unicodedata
+
+# 기본 슬롯 별칭 (브라켓에 있는 슬롯으로 향하는 것만 사용)
+DEFAULT_SLOT_ALIASES = {
+    'GEN이 고른 팀': ['GEN 선택', '젠지 선택', '젠지가 고른 팀', 'GEN이 고른팀', 'GEN Pick'],
+    # 승자조 결승 별칭이 없으면 패자조 결승(R4 LF) 별칭과 편집 거리 1로 잘못 맞음
+    'R3 UB': ['UB Final', 'WB Final', '승자조 결승'],
+    'R4 LF': ['LB Final', '패자조 결승'],
+    'Grand Final': ['그랜드파이널', '그파', 'GF', '결승', '결승전'],
+}
+
+# 키 비교에서 지우는 문자 (공백과 구분 기호)
+_SEPARATORS = re.compile(r'[\s\-_.]+')
+
+
+def normalize_key(text):
+    """키 비교용 정규화 (NFKC + 소문자, 공백/구분 기호 제거)"""
+    return _SEPARATORS.sub('', unicodedata.normalize('NFKC', text).lower())
+
+def distance_budget(length):
+    """정규화한 키 길이별 허용 편집 거리 (짧은 키일수록 엄격)"""
+    if length < 3:
+        return 0
+    if length < 7:
+        return 1
+    return 2
+
+
+class KeyMatcher:
+    """슬롯 키 + 별칭 트라이 (노드는 dict, 키 끝 노드의 None 키에 (슬롯, 키 길이) 저장)"""
+    __slots__ = ('root', 'slots', 'max_distance')
+
+    def __init__(self, slots, aliases=DEFAULT_SLOT_ALIASES):
+        self.root = {}
+        self.slots = list(slots)
+        self.max_distance = 0
+        for slot in self.slots:
+            self.add(slot, slot)
+            for alias in aliases.get(slot, ()):
+                self.add(alias, slot)
+
+    def add(self, key, slot):
+        normalized = normalize_key(key)
+        node = self.root
+        for char in normalized:
+            node = node.setdefault(char, {})
+        node[None] = (slot, len(normalized))
+        self.max_distance = max(self.max_distance, distance_budget(len(normalized)))
+
+    def match(self, text):
+        """키 표기 → (슬롯, 편집 거리, 정규화한 키 길이), 맞는 슬롯이 없거나 모호하면 None"""
+        key = normalize_key(text)
+        if not key:
+            return None
+        # 슬롯 → (거리, 키 길이) 중 가장 가까운 것
+        best = {}
+        first_row = list(range(len(key) + 1))
+        stack = [(child, char, first_row) for char, child in self.root.items() if char is not None]
+        while stack:
+            node, char, previous = stack.pop()
+            row = [previous[0] + 1]
+            for index in range(1, len(key) + 1):
+                row.append(min(row[index - 1] + 1, previous[index] + 1,
+                               previous[index - 1] + (key[index - 1] != char)))
+            terminal = node.get(None)
+            if terminal is not None:
+                slot, length = terminal
+                distance = row[-1]
+                if distance <= distance_budget(length) and distance < best.get(slot, (distance + 1,))[0]:
+                    best[slot] = (distance, length)
+            if min(row) <= self.max_distance:
+                stack.extend((child, child_char, row) for child_char, child in node.items() if child_char is not None)
+
+        if not best:
+            return None
+        ranked = sorted(best.items(), key=lambda item: item[1][0])
+        if len(ranked) > 1 and ranked[1][1][0] == ranked[0][1][0]:
+            return None
+        slot, (distance, length) = ranked[0]
+        return slot, distance, length
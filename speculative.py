@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+다음 경기 결과 미리 계산 (정적 스냅샷 두 갈래)
+
+다음 경기의 가능한 승자마다 결과가 그렇게 났을 때의 스냅샷 묶음(브라켓 카드, 생존자/점수 통계,
+히스토그램, 차트, 리더보드 페이지)을 경기 전에 만들어 snapshot/.speculative/<버전>/에 둡니다.
+update_match.py가 실제 결과를 기록하면 결과 버전이 같은 묶음 디렉터리를 snapshot/releases/로 옮기고
+current 링크를 바꿔 그대로 게시하므로 결과 입력 순간(접속이 몰리는 때)에 재계산이 일어나지 않습니다.
+
+버전은 export_snapshot.snapshot_version (결과 + 예측 파일 상태)이라 예측 파일이 바뀌었으면
+미리 만든 묶음은 쓰이지 않고 평소처럼 다시 생성됩니다. 일정 문구(get_schedule)는 자유 형식이라
+시각으로 해석하지 않고, 결과가 게시될 때마다 곧바로 그다음 경기를 미리 계산합니다.
+
+사용법:
+    python speculative.py [--event ID] [--output snapshot] [--pages 20]   # 한 번 게시/미리 계산
+    python speculative.py --watch 5       # export_snapshot --watch 대신 사용 (결과가 바뀌면 게시 후 다음 경기 미리 계산)
+"""
+
+import argparse
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+
+from export_snapshot import (
+    LEADERBOARD_PAGES, current_snapshot_version, new_release_path, publish_release,
+    render_snapshot, snapshot_version, write_files, write_snapshot
+)
+from events import default_event, event_from_argv, load_event_data
+
+SNAPSHOT_DIR = 'snapshot'
+SPECULATIVE_DIR = '.speculative'
+BUNDLE_FILE = 'bundle.json'
+
+
+def next_pending_slot(bracket, match_results):
+    """결과가 없는 첫 슬롯과 가능한 승자 목록 (모두 끝났거나 대진 미정이면 (None, None))"""
+    for slot in bracket.slots:
+        if not match_results.get(slot):
+            options = bracket.slot_options(slot, match_results)
+            return (slot, options) if options else (None, None)
+    return None, None
+
+def build_bundle(event, predictions, match_results, pages=LEADERBOARD_PAGES):
+    """결과 조합 하나의 (버전, 스냅샷 파일 dict)"""
+    version = snapshot_version(event.predictions_file, match_results)
+    return version, render_snapshot(predictions, match_results, event.schedule, version, event, pages)
+
+def bundle_path(output_dir, version):
+    return os.path.join(output_dir, SPECULATIVE_DIR, version)
+
+def save_bundle(output_dir, version, files, meta):
+    """임시 디렉터리에 모두 쓴 뒤 이름을 바꿔 완성된 묶음만 보이게 함"""
+    final_path = bundle_path(output_dir, version)
+    if os.path.isdir(final_path):
+        return False
+    tmp_path = f"{final_path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    write_files(files, tmp_path)
+    with open(os.path.join(tmp_path, BUNDLE_FILE), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, final_path)
+    return True
+
+def load_bundle_meta(path):
+    with open(os.path.join(path, BUNDLE_FILE), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def prune_bundles(output_dir, keep):
+    """keep에 없는 버전의 묶음 삭제 (지나간 경기의 갈래)"""
+    directory = os.path.join(output_dir, SPECULATIVE_DIR)
+    if not os.path.isdir(directory):
+        return
+    for name in os.listdir(directory):
+        if name not in keep:
+            shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+
+def load_event_files(event):
+    """대시보드와 같은 데이터 (predictions.sqlite가 있으면 DB)"""
+    data = load_event_data(event)
+    for warning in data.warnings:
+        print(f"⚠️ {warning}")
+    return data.dataset, data.match_results
+
+def precompute(event=None, output_dir=SNAPSHOT_DIR, pages=LEADERBOARD_PAGES):
+    """다음 경기의 가능한 승자마다 스냅샷 묶음을 만들고 [(슬롯, 승자, 버전)] 반환"""
+    event = event or default_event()
+    predictions, match_results = load_event_files(event)
+
+    slot, options = next_pending_slot(event.bracket, match_results)
+    if slot is None:
+        prune_bundles(output_dir, set())
+        return []
+
+    branches = []
+    for winner in options:
+        hypothetical = dict(match_results)
+        hypothetical[slot] = winner
+        version, files = build_bundle(event, predictions, hypothetical, pages)
+        save_bundle(output_dir, version, files, {
+            'event': event.id,
+            'slot': slot,
+            'winner': winner,
+            'version': version,
+            'base_version': snapshot_version(event.predictions_file, match_results),
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+        })
+        branches.append((slot, winner, version))
+    prune_bundles(output_dir, {version for _, _, version in branches})
+    return branches
+
+def publish_precomputed(event=None, output_dir=SNAPSHOT_DIR):
+    """현재 결과에 해당하는 미리 만든 묶음이 있으면 게시하고 버전 반환 (없으면 None)
+
+    묶음 디렉터리를 releases/로 옮긴 뒤 current 링크를 교체하므로 파일을 다시 쓰지 않고,
+    클라이언트는 이전 묶음 또는 새 묶음 전체 중 하나만 보게 됩니다.
+    """
+    event = event or default_event()
+    try:
+        match_results = event.load_results()
+    except FileNotFoundError:
+        return None
+    version = snapshot_version(event.predictions_file, match_results)
+    if current_snapshot_version(output_dir) == version:
+        return None
+    path = bundle_path(output_dir, version)
+    if not os.path.isdir(path) or load_bundle_meta(path).get('event') != event.id:
+        return None
+
+    manifest_file = os.path.join(path, 'manifest.json')
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    manifest['published_at'] = datetime.now().isoformat(timespec='seconds')
+    manifest['precomputed'] = True
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.remove(os.path.join(path, BUNDLE_FILE))
+
+    release_path = new_release_path(output_dir, version)
+    os.makedirs(os.path.dirname(release_path), exist_ok=True)
+    try:
+        os.replace(path, release_path)
+    except FileNotFoundError:
+        # 다른 프로세스(update_match / --watch)가 먼저 게시함
+        return None
+    publish_release(release_path, output_dir)
+    return version
+
+def publish_current(event, output_dir, pages=LEADERBOARD_PAGES, force=False):
+    """미리 만든 묶음이 없을 때 현재 결과로 바로 생성해 게시 (바뀐 게 없으면 False)"""
+    predictions, match_results = load_event_files(event)
+    version = snapshot_version(event.predictions_file, match_results)
+    if not force and current_snapshot_version(output_dir) == version:
+        return False
+    _, files = build_bundle(event, predictions, match_results, pages)
+    write_snapshot(files, output_dir, version)
+    print(f"✅ 스냅샷 생성 완료: {output_dir}/current/ (버전 {version})")
+    return True
+
+def publish(event, output_dir, pages=LEADERBOARD_PAGES, force=False):
+    """결과가 바뀌었으면 게시 (미리 만든 묶음 우선, 없으면 생성) 후 다음 경기 미리 계산"""
+    version = None if force else publish_precomputed(event, output_dir)
+    if version is not None:
+        print(f"⚡ 미리 계산한 스냅샷 게시: {output_dir}/current/ (버전 {version})")
+    elif not publish_current(event, output_dir, pages, force):
+        return False
+
+    started = time.perf_counter()
+    branches = precompute(event, output_dir, pages)
+    for slot, winner, branch_version in branches:
+        print(f"  🔮 {slot} {winner} 승리 시 스냅샷 준비 (버전 {branch_version})")
+    if branches:
+        print(f"  미리 계산 {time.perf_counter() - started:.1f}초")
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description="다음 경기 결과별 스냅샷 미리 계산")
+    parser.add_argument('--output', default=SNAPSHOT_DIR)
+    parser.add_argument('--event', help="이벤트 ID")
+    parser.add_argument('--pages', type=int, default=LEADERBOARD_PAGES, help="미리 만들 리더보드 페이지 수")
+    parser.add_argument('--force', action='store_true', help="버전이 같아도 다시 생성")
+    parser.add_argument('--watch', type=float, metavar='초', help="주기적으로 확인하여 바뀌면 게시 후 미리 계산")
+    args = parser.parse_args()
+    event = event_from_argv(['--event', args.event]) if args.event else default_event()
+
+    if not args.watch:
+        if not publish(event, args.output, args.pages, args.force):
+            print("변경 사항이 없어 스냅샷을 유지합니다.")
+        return
+
+    print(f"{args.watch}초마다 결과 변경을 확인합니다. (종료: Ctrl+C)")
+    try:
+        # 처음에는 현재 스냅샷이 최신이어도 다음 경기 묶음을 준비
+        if not publish(event, args.output, args.pages, args.force):
+            precompute(event, args.output, args.pages)
+        while True:
+            time.sleep(args.watch)
+            publish(event, args.output, args.pages)
+    except KeyboardInterrupt:
+        print("\n미리 계산 감시를 종료합니다.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+SQLite 예측 저장소 (선택)
+
+이벤트 폴더에 predictions.sqlite가 있으면 예측과 경기 결과를 파일 대신 이 DB에서 읽습니다.
+WAL 모드라 여러 대시보드 프로세스가 읽는 동안 업데이터가 결과를 써도 서로 막지 않고,
+집계/순위/생존자 조회는 파이썬으로 전체를 읽지 않고 인덱스를 타는 SQL로 처리합니다.
+
+    participants (id, nickname)                   id는 원본 예측 순서 (1부터)
+    picks        (participant_id, slot, team)      인덱스: (slot, team), 참가자별 (participant_id, slot)
+    results      (slot, winner, scored)           scored: 생존 판정에 쓰는 실제 경기 슬롯이면 1
+    standings    (participant_id, wrong, match_wrong)
+                 결과가 있는 전체 슬롯 / 실제 경기 슬롯 기준 틀린 개수 (쓰기 트랜잭션에서 함께 갱신)
+    meta         (key, value)                      slots, match_keys: 슬롯 순서 (JSON)
+                                                   sources: 가져온 예측/결과 파일의 (이름, mtime_ns, 크기)
+
+예측/결과 파일이 가져온 뒤에 바뀌면 (다시 파싱, match_result.txt 직접 수정) 이벤트가 DB를 열 때
+sync_store가 바뀐 파일을 다시 가져오고 경고를 출력하므로 DB와 파일이 어긋난 채 쓰이지 않습니다.
+
+사용법:
+    python sqlite_store.py import [--event 이벤트ID]          예측/결과 파일을 DB로 가져오기
+    python sqlite_store.py alive "R3 UB" HLE [--event 이벤트ID] R3 UB에서 HLE를 고른 생존자
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+from collections import Counter
+
+from bracket import SLOT_KEYS
+from model import PredictionDataset, as_dataset
+
+STORE_FILE = 'predictions.sqlite'
+BUSY_TIMEOUT = 30.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS participants (
+    id INTEGER PRIMARY KEY,
+    nickname TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS picks (
+    participant_id INTEGER NOT NULL REFERENCES participants(id) ON DELETE CASCADE,
+    slot TEXT NOT NULL,
+    team TEXT NOT NULL,
+    PRIMARY KEY (participant_id, slot)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS results (
+    slot TEXT PRIMARY KEY,
+    winner TEXT,
+    scored INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS standings (
+    participant_id INTEGER PRIMARY KEY REFERENCES participants(id) ON DELETE CASCADE,
+    wrong INTEGER NOT NULL,
+    match_wrong INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS picks_slot_team ON picks (slot, team, participant_id);
+CREATE INDEX IF NOT EXISTS participants_nickname ON participants (nickname);
+CREATE INDEX IF NOT EXISTS standings_match_wrong ON standings (match_wrong, participant_id);
+CREATE INDEX IF NOT EXISTS standings_wrong ON standings (wrong);
+"""
+
+# 참가자별 틀린 개수 다시 계산 (예측을 비운 슬롯은 틀리지 않음)
+REFRESH_STANDINGS_SQL = """
+INSERT INTO standings (participant_id, wrong, match_wrong)
+SELECT p.id, COUNT(r.slot), COALESCE(SUM(r.scored), 0)
+FROM participants p
+LEFT JOIN picks k ON k.participant_id = p.id
+LEFT JOIN results r ON r.slot = k.slot AND r.winner IS NOT NULL AND r.winner != k.team
+GROUP BY p.id
+"""
+
+
+class StoredParticipant:
+    """SQL 순위 결과 한 줄 (예측 내용은 필요할 때만 조회, RankedParticipant와 같은 속성)"""
+    __slots__ = ('store', 'nickname', 'wrong_predictions', '_prediction')
+
+    def __init__(self, store, nickname, wrong_predictions):
+        self.store = store
+        self.nickname = nickname
+        self.wrong_predictions = wrong_predictions
+        self._prediction = None
+
+    @property
+    def prediction(self):
+        if self._prediction is None:
+            self._prediction = self.store.prediction(self.nickname)
+        return self._prediction
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+
+class PredictionStore:
+    """SQLite 예측/결과 저장소 (스레드마다 연결을 따로 엶)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+
+    @property
+    def connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute('PRAGMA foreign_keys=ON')
+            connection.executescript(SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def close(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def query(self, sql, params=()):
+        return self.connection.execute(sql, params).fetchall()
+
+    # --- 쓰기 ---
+
+    def import_predictions(self, predictions, slots=None, match_keys=None):
+        """예측 전체를 교체 (참가자 순서 유지, match_keys: 생존 판정 슬롯, 기본은 전체)"""
+        dataset = as_dataset(predictions)
+        slots = list(slots or dataset.slots)
+        match_keys = list(match_keys or slots)
+        with self.connection as connection:
+            connection.execute('DELETE FROM picks')
+            connection.execute('DELETE FROM participants')
+            connection.executemany(
+                'INSERT INTO participants (id, nickname) VALUES (?, ?)',
+                enumerate(dataset.nicknames, 1)
+            )
+            connection.executemany(
+                'INSERT INTO picks (participant_id, slot, team) VALUES (?, ?, ?)',
+                ((index, slot, team)
+                 for index, participant in enumerate(dataset, 1)
+                 for slot, team in participant.prediction.items() if team and slot in slots)
+            )
+            connection.executemany(
+                'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                [('slots', json.dumps(slots, ensure_ascii=False)),
+                 ('match_keys', json.dumps(match_keys, ensure_ascii=False))]
+            )
+            connection.execute('UPDATE results SET scored = slot IN (SELECT value FROM json_each(?))',
+                               (json.dumps(match_keys),))
+            self._refresh_standings(connection)
+
+    def save_results(self, match_results):
+        """경기 결과 저장 (빈 결과는 NULL) 및 틀린 개수 갱신"""
+        match_keys = set(self.match_keys())
+        with self.connection as connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO results (slot, winner, scored) VALUES (?, ?, ?)',
+                ((slot, winner or None, int(slot in match_keys)) for slot, winner in match_results.items())
+            )
+            self._refresh_standings(connection)
+
+    def _refresh_standings(self, connection):
+        connection.execute('DELETE FROM standings')
+        connection.execute(REFRESH_STANDINGS_SQL)
+
+    # --- 읽기 ---
+
+    def record_sources(self, sources):
+        """가져온 파일 상태 기록 (sync_store가 비교)"""
+        with self.connection as connection:
+            connection.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                               ('sources', json.dumps(sources, ensure_ascii=False)))
+
+    def sources(self):
+        rows = self.query('SELECT value FROM meta WHERE key = ?', ('sources',))
+        return json.loads(rows[0][0]) if rows else {}
+
+    def _meta_list(self, key, default):
+        rows = self.query('SELECT value FROM meta WHERE key = ?', (key,))
+        return json.loads(rows[0][0]) if rows else list(default)
+
+    def slots(self):
+        return self._meta_list('slots', SLOT_KEYS)
+
+    def match_keys(self):
+        """생존 판정에 쓰는 실제 경기 슬롯"""
+        return self._meta_list('match_keys', self.slots())
+
+    def load_results(self, slots=None):
+        """경기 결과 dict (모든 슬롯 포함, 결과가 없으면 None)"""
+        results = {slot: None for slot in slots or self.slots()}
+        for slot, winner in self.query('SELECT slot, winner FROM results'):
+            results[slot] = winner
+        return results
+
+    def load_dataset(self, slots=None):
+        """전체 예측을 데이터셋으로 로드 (참가자 순서 유지)"""
+        dataset = PredictionDataset(slots or self.slots())
+        picks = {}
+        for participant_id, slot, team in self.query(
+                'SELECT participant_id, slot, team FROM picks ORDER BY participant_id'):
+            picks.setdefault(participant_id, {})[slot] = team
+        for participant_id, nickname in self.query('SELECT id, nickname FROM participants ORDER BY id'):
+            dataset.append(nickname, picks.get(participant_id, {}))
+        return dataset
+
+    def nicknames(self):
+        return [nickname for nickname, in self.query('SELECT nickname FROM participants ORDER BY id')]
+
+    def participant_count(self):
+        return self.query('SELECT COUNT(*) FROM participants')[0][0]
+
+    def prediction(self, nickname):
+        """닉네임의 예측 (슬롯 순서, 같은 닉네임이 여럿이면 먼저 들어온 참가자)"""
+        rows = self.query(
+            'SELECT k.slot, k.team FROM picks k WHERE k.participant_id = '
+            '(SELECT MIN(id) FROM participants WHERE nickname = ?)', (nickname,))
+        picks = dict(rows)
+        return {slot: picks.get(slot) for slot in self.slots()}
+
+    def pick_counts(self, slot):
+        """슬롯별 팀 선택 수 (처음 고른 참가자 순서, PredictionDataset.counts와 같은 순서)"""
+        return Counter(dict(self.query(
+            'SELECT team, COUNT(*) FROM picks WHERE slot = ? GROUP BY team ORDER BY MIN(participant_id)',
+            (slot,))))
+
+    def aggregate(self, bracket=None):
+        """분석기용 집계 (aggregates.PickAggregate)를 SQL GROUP BY로 계산"""
+        from aggregates import PickAggregate
+
+        slots = self.slots()
+        aggregate = PickAggregate(bracket, slots)
+        aggregate.participants = self.participant_count()
+        position = {slot: index for index, slot in enumerate(slots)}
+        first_seen = {}
+        for slot, team, count, first_id in self.query(
+                'SELECT slot, team, COUNT(*), MIN(participant_id) FROM picks '
+                'GROUP BY slot, team ORDER BY MIN(participant_id)'):
+            if slot not in position:
+                continue
+            aggregate.slot_counts[slot][team] = count
+            if slot not in aggregate.choices:
+                # 행 단위로 셌을 때 처음 등장하는 위치 (팀 순서 유지용)
+                seen = first_id * len(slots) + position[slot]
+                first_seen[team] = min(first_seen.get(team, seen), seen)
+                aggregate.team_totals[team] += count
+        aggregate.team_totals = Counter({team: aggregate.team_totals[team]
+                                         for team in sorted(aggregate.team_totals, key=first_seen.get)})
+
+        for choice, sources in aggregate.choices.items():
+            joins = ''.join(f' JOIN picks s{index} ON s{index}.participant_id = c.participant_id AND s{index}.slot = ?'
+                            for index in range(len(sources)))
+            columns = ''.join(f's{index}.team, ' for index in range(len(sources)))
+            scenarios = aggregate.scenarios[choice]
+            for row in self.query(
+                    f'SELECT {columns}c.team, COUNT(*) FROM picks c{joins} WHERE c.slot = ? '
+                    f'GROUP BY {columns}c.team ORDER BY MIN(c.participant_id)',
+                    (*sources, choice)):
+                *picks, team, count = row
+                scenarios.setdefault(tuple(picks), Counter())[team] = count
+        return aggregate
+
+    def wrong_counts(self):
+        """참가자 순서대로 (닉네임, 실제 경기 기준 틀린 개수)"""
+        return self.query(
+            'SELECT p.nickname, s.match_wrong FROM participants p JOIN standings s ON s.participant_id = p.id '
+            'ORDER BY p.id')
+
+    def ranking(self, limit=None):
+        """결과가 있는 모든 슬롯 기준 틀린 개수가 적은 순 (같으면 닉네임 순) [StoredParticipant]"""
+        sql = ('SELECT p.nickname, s.wrong FROM standings s JOIN participants p ON p.id = s.participant_id '
+               'ORDER BY s.wrong, p.nickname')
+        params = ()
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params = (limit,)
+        return [StoredParticipant(self, nickname, wrong) for nickname, wrong in self.query(sql, params)]
+
+    def survivors(self, slot=None, team=None):
+        """결과가 나온 경기를 모두 맞힌 참가자 닉네임 (slot/team을 주면 그 팀을 고른 참가자만)"""
+        if slot is None:
+            return [nickname for nickname, in self.query(
+                'SELECT p.nickname FROM standings s JOIN participants p ON p.id = s.participant_id '
+                'WHERE s.match_wrong = 0 ORDER BY p.id')]
+        # (slot, team) 인덱스로 고른 참가자를 찾고 standings 기본 키로 생존 여부 확인
+        return [nickname for nickname, in self.query(
+            'SELECT p.nickname FROM picks k '
+            'JOIN standings s ON s.participant_id = k.participant_id AND s.match_wrong = 0 '
+            'JOIN participants p ON p.id = k.participant_id '
+            'WHERE k.slot = ? AND k.team = ? ORDER BY k.participant_id', (slot, team))]
+
+    def survivor_count(self):
+        return self.query('SELECT COUNT(*) FROM standings WHERE match_wrong = 0')[0][0]
+
+    def fingerprint(self):
+        """변경 감지용 (DB/WAL 파일 상태, 다른 프로세스가 써도 바뀜)"""
+        fingerprint = []
+        for path in (self.path, f"{self.path}-wal"):
+            try:
+                stat = os.stat(path)
+                fingerprint.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                fingerprint.append(None)
+        return tuple(fingerprint)
+
+
+_stores = {}
+
+
+def open_store(path):
+    """DB 파일이 있으면 저장소, 없으면 None (경로마다 하나를 공유해 스레드별 연결을 재사용)"""
+    if not os.path.exists(path):
+        return None
+    key = os.path.abspath(path)
+    store = _stores.get(key)
+    if store is None:
+        store = _stores[key] = PredictionStore(path)
+    return store
+
+def is_store_path(path):
+    return path.endswith('.sqlite') or path.endswith('.db')
+
+def source_state(path):
+    """파일 상태 [이름, mtime_ns, 크기] (없으면 None)"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [os.path.basename(path), stat.st_mtime_ns, stat.st_size]
+
+def sync_store(store, event, force=False):
+    """가져온 뒤 바뀐 예측/결과 파일을 DB에 다시 가져오고 다시 가져온 파일 경로 목록 반환
+
+    파일이 없으면 DB 내용을 그대로 둡니다. 결과 파일은 내용이 DB와 다를 때만 씁니다
+    (업데이터가 파일과 DB에 같은 결과를 쓴 경우). 상태가 그대로면 DB에 쓰지 않으므로
+    DB 변경 감지(fingerprint)에 영향이 없습니다.
+    """
+    from data_cache import load_predictions
+
+    recorded = store.sources()
+    current = {
+        'predictions': source_state(event.predictions_file),
+        'results': source_state(event.results_file),
+    }
+    synced = []
+    if current['predictions'] is not None and (force or current['predictions'] != recorded.get('predictions')):
+        dataset = load_predictions(event.predictions_file, event.bracket.slots)
+        store.import_predictions(dataset, event.bracket.slots, event.bracket.match_keys)
+        synced.append(event.predictions_file)
+    if current['results'] is not None and (force or current['results'] != recorded.get('results')):
+        results = event.load_results()
+        if force or results != store.load_results(event.bracket.slots):
+            store.save_results(results)
+            synced.append(event.results_file)
+    current = {key: value if value is not None else recorded.get(key) for key, value in current.items()}
+    if current != recorded:
+        store.record_sources(current)
+    return synced
+
+
+def main():
+    from events import event_from_argv
+
+    event = event_from_argv(sys.argv)
+    args = sys.argv[1:]
+    if args[:1] == ['import']:
+        if not os.path.exists(event.predictions_file):
+            raise SystemExit(f"{event.predictions_file} 파일을 찾을 수 없습니다.")
+        store = PredictionStore(event.store_file)
+        sync_store(store, event, force=True)
+        print(f"✅ {store.participant_count()}명 예측을 {event.store_file}에 저장했습니다.")
+    elif args[:1] == ['alive'] and len(args) == 3:
+        store = event.open_store()
+        if store is None:
+            raise SystemExit(f"DB 파일이 없습니다: {event.store_file} (먼저 import 실행)")
+        nicknames = store.survivors(args[1], args[2])
+        print(f"{args[1]}에서 {args[2]}를 고른 생존자 ({len(nicknames)}명):")
+        print(', '.join(nicknames))
+    else:
+        print(__doc__.split('사용법:')[1])
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,16 @@
+import os
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import json
 from datetime import datetime
 
+import profiling
+from dashboard_render import (
+    build_histogram_figure, build_pie_figure, compute_dashboard_stats, compute_whatif_stats,
+    find_survivors, gen_choice_message, survivor_banner_html
+)
+from bracket import results_version
+from events import DEFAULT_EVENT_ID, list_events, load_event, load_event_data
+from render_cache import bracket_cards_html, cached, cached_figure
+
 # 페이지 설정
 st.set_page_config(
     page_title="LCK 플레이오프 2025 - 승부예측 대시보드",
@@ -11,150 +18,141 @@ st.set_page_config(
     layout="wide"
 )
 
-def load_all_data():
-    """모든 데이터 로드"""
-    # 예측 데이터 로드
-    predictions = []
-    try:
-        with open('predictions.json', 'r', encoding='utf-8') as f:
-            predictions = json.load(f)
-    except FileNotFoundError:
-        st.warning("predictions.json 파일을 찾을 수 없습니다.")
-    
-    # 경기 결과 로드
-    match_results = {}
-    try:
-        with open('match_result.txt', 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if ':' in line:
-                    parts = line.split(':', 1)
-                    if len(parts) == 2:
-                        key = parts[0].strip()
-                        value = parts[1].strip()
-                        match_results[key] = value if value else None
-    except FileNotFoundError:
-        st.warning("match_result.txt 파일을 찾을 수 없습니다.")
-    
-    return predictions, match_results
+def query_param(name):
+    """URL 쿼리 값 (없으면 None)"""
+    if hasattr(st, 'query_params'):
+        return st.query_params.get(name)
+    values = st.experimental_get_query_params().get(name)
+    return values[0] if values else None
 
-def get_schedule():
-    """경기 일정"""
-    return {
-        'R1 M1': '9월 10일 수요일 오후 5시',
-        'R1 M2': '9월 11일 목요일 오후 5시', 
-        'R2 M1': '9월 13일 토요일 오후 3시',
-        'R2 M2': '9월 14일 일요일 오후 3시',
-        'R1 LB': '9월 17일 수요일 오후 5시',
-        'R2 LB': '9월 18일 목요일 오후 5시',
-        'R3 UB': '9월 20일 토요일 오후 3시',
-        'R3 LB': '9월 21일 일요일 오후 3시',
-        'R4 LF': '9월 27일 토요일 오후 2시',
-        'Grand Final': '9월 28일 일요일 오후 2시'
-    }
+def select_event():
+    """?event= 쿼리 또는 사이드바에서 이벤트 선택"""
+    event_ids = list_events()
+    requested = query_param('event') or DEFAULT_EVENT_ID
+    index = event_ids.index(requested) if requested in event_ids else 0
+    if len(event_ids) == 1:
+        return load_event(event_ids[0])
+    return load_event(st.sidebar.selectbox("이벤트", event_ids, index=index))
 
-def show_match(match_id, team1, team2, winner, schedule_time):
-    """개별 매치 표시"""
-    # 상태 결정
-    if winner:
-        status_color = "#10B981"
-        status_emoji = "✅"
-        result_text = f"승자: {winner}"
-    elif team1 == "미정" or team2 == "미정":
-        status_color = "#6B7280"
-        status_emoji = "⏸️"
-        result_text = "대기 중"
-    else:
-        status_color = "#F59E0B"
-        status_emoji = "⏳"
-        result_text = "경기 예정"
-    
-    st.markdown(f"""
-    <div style='
-        border: 2px solid {status_color}; 
-        border-radius: 10px; 
-        padding: 12px; 
-        margin: 8px 0; 
-        background: white;
-        text-align: center;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    '>
-        <div style='font-weight: bold; color: {status_color}; font-size: 1.1em;'>
-            {status_emoji} {match_id}
-        </div>
-        <div style='font-size: 1.2em; margin: 8px 0; font-weight: bold;'>
-            {team1} vs {team2}
-        </div>
-        <div style='color: #666; font-size: 0.9em; margin: 5px 0;'>
-            {result_text}
-        </div>
-        <div style='color: #888; font-size: 0.8em; font-style: italic;'>
-            {schedule_time}
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+def load_all_data(event):
+    """모든 데이터 로드 (이벤트별 LRU 캐시)"""
+    data = load_event_data(event)
+    for warning in data.warnings:
+        st.warning(warning)
+    return data
 
-def calculate_survivor_stats(predictions, match_results):
-    """생존자 통계 계산"""
-    if not predictions:
-        return 0, 0, 0, "#6B7280", "⏸️", "데이터 없음"
-    
-    actual_matches = ['R1 M1', 'R1 M2', 'R2 M1', 'R2 M2', 'R1 LB', 'R2 LB', 'R3 UB', 'R3 LB', 'R4 LF', 'Grand Final']
-    total_participants = len(predictions)
-    eliminated = 0
+def show_figure(key, build_figure):
+    """결과 버전별로 캐시된 Plotly 그림 표시 (그림은 캐시에 없을 때만 생성, rerun마다 다시 검증하지 않음)"""
+    st.plotly_chart(cached_figure(key, build_figure), use_container_width=True)
+
+@profiling.traced('render')
+def show_bracket(match_results, schedule, bracket, event_id):
+    """브라켓 배치에 따라 섹션/컬럼별 매치 카드 표시 (카드 HTML은 결과 버전별 캐시)"""
+    cards = bracket_cards_html(event_id, match_results, schedule, bracket)
     
-    for participant in predictions:
-        prediction = participant['prediction']
-        is_eliminated = False
+    for index, section in enumerate(bracket.layout):
+        if index > 0:
+            st.markdown("---")
+        st.subheader(section['title'])
+        columns = st.columns(section.get('widths', len(section['columns'])))
         
-        for match_key in actual_matches:
-            actual_result = match_results.get(match_key)
-            if actual_result:
-                predicted = prediction.get(match_key)
-                if predicted and predicted != actual_result:
-                    is_eliminated = True
-                    break
-        
-        if is_eliminated:
-            eliminated += 1
+        for column, column_def in zip(columns, section['columns']):
+            with column:
+                if column_def['title']:
+                    st.markdown(f"**{column_def['title']}**")
+                for position, match_id in enumerate(column_def['matches']):
+                    if position > 0:
+                        st.markdown("")
+                    st.markdown(cards[match_id], unsafe_allow_html=True)
+
+def choose_whatif_results(match_results, bracket, event_id):
+    """남은 슬롯마다 가상 승자 선택 (앞 슬롯 선택에 따라 가능한 팀이 바뀜)"""
+    results = dict(match_results)
+    columns = st.columns(3)
+    for index, slot in enumerate(slot for slot in bracket.slots if not match_results.get(slot)):
+        options = bracket.slot_options(slot, results)
+        with columns[index % 3]:
+            if options is None:
+                st.selectbox(slot, ["대진 미정"], disabled=True, key=f"whatif-{event_id}-{slot}")
+                continue
+            # 가능한 팀이 바뀌면 이전 선택이 남지 않도록 키에 후보를 포함
+            choice = st.selectbox(slot, ["미정"] + options, key=f"whatif-{event_id}-{slot}-{'-'.join(options)}")
+            if choice != "미정":
+                results[slot] = choice
+    return results
+
+@profiling.traced('render')
+def show_whatif(data, bracket, schedule):
+    """가상 결과에 따른 생존자/분포/상위 참가자 (비트맵 인덱스로 토글마다 즉시 계산)"""
+    results = choose_whatif_results(data.match_results, bracket, data.event.id)
+    # 같은 가상 결과 조합을 고른 세션끼리 통계/배너/차트를 공유
+    key = ('whatif', data.event.id, data.fingerprint, results_version(results))
+    stats = cached(key + ('stats',), lambda: compute_whatif_stats(data.bitsets, results, bracket))
     
-    surviving = total_participants - eliminated
-    survival_rate = (surviving / total_participants) * 100 if total_participants > 0 else 0
+    st.markdown(cached(key + ('banner',), lambda: survivor_banner_html(stats)), unsafe_allow_html=True)
     
-    # 생존율에 따른 색상과 상태
-    if survival_rate > 70:
-        color = "#10B981"
-        emoji = "🟢"
-        status = "안전"
-    elif survival_rate > 40:
-        color = "#F59E0B"
-        emoji = "🟡"
-        status = "주의"
-    elif survival_rate > 20:
-        color = "#EF4444"
-        emoji = "🟠"
-        status = "위험"
-    else:
-        color = "#DC2626"
-        emoji = "🔴"
-        status = "극한"
+    col1, col2 = st.columns(2)
+    with col1:
+        if stats['histogram']['x']:
+            show_figure(key + ('histogram',), lambda: build_histogram_figure(stats))
+    with col2:
+        st.markdown("**상위 참가자**")
+        st.table([
+            {'순위': rank, '닉네임': nickname, '틀린 개수': wrong}
+            for rank, nickname, wrong in stats['leaders']
+        ])
     
-    return surviving, eliminated, survival_rate, color, emoji, status
+    st.markdown("---")
+    show_bracket(results, schedule, bracket, data.event.id)
 
-def main():
-    st.title("🏆 LCK 플레이오프 2025 - 승부예측 대시보드")
+def show_survivor_search(data, bracket):
+    """특정 슬롯에서 특정 팀을 고른 생존자 찾기"""
+    with st.expander("🔎 생존자 찾기"):
+        col1, col2 = st.columns(2)
+        with col1:
+            slot = st.selectbox("슬롯", bracket.slots, key="survivor-search-slot")
+        with col2:
+            team = st.selectbox("팀", bracket.teams, key="survivor-search-team")
+        nicknames = find_survivors(data, slot, team)
+        st.markdown(f"**{slot}에서 {team}를 고른 생존자: {len(nicknames)}명**")
+        if nicknames:
+            st.write(', '.join(nicknames))
+
+def profiling_panel_requested():
+    """?profile=1 쿼리 또는 LCK_PROFILE_PANEL=1 환경변수일 때만 계측 패널 표시"""
+    if os.environ.get('LCK_PROFILE_PANEL') == '1':
+        return True
+    return query_param('profile') == '1'
+
+def show_profiling_panel(recorder):
+    """이번 rerun의 단계별 소요 시간 표시 (숨김 패널)"""
+    report = profiling.summary(recorder)
+    with st.expander("⏱️ 계측 (이번 rerun)", expanded=True):
+        st.table([{'단계': stage, '시간(ms)': f"{total:.1f}"} for stage, total in report['stages_ms'].items()])
+        st.table([
+            {'span': name, '단계': entry['stage'], '호출': entry['calls'], '시간(ms)': f"{entry['total_ms']:.1f}"}
+            for name, entry in sorted(report['spans'].items(), key=lambda item: -item[1]['total_ms'])
+        ])
+        if report['counters']:
+            st.json(report['counters'])
+
+def render_dashboard():
+    # 이벤트 선택 및 데이터 로드
+    event = select_event()
+    st.title(f"🏆 {event.title} - 승부예측 대시보드")
     
-    # 데이터 로드
-    predictions, match_results = load_all_data()
-    schedule = get_schedule()
+    data = load_all_data(event)
+    predictions, match_results = data.dataset, data.match_results
+    bracket = event.bracket
+    schedule = event.schedule
     
     # 사이드바
     st.sidebar.header("📊 현재 상황")
     
     # 완료된 경기 수 계산
-    actual_matches = ['R1 M1', 'R1 M2', 'R2 M1', 'R2 M2', 'R1 LB', 'R2 LB', 'R3 UB', 'R3 LB', 'R4 LF', 'Grand Final']
+    actual_matches = bracket.match_keys
     completed = sum(1 for match in actual_matches if match_results.get(match))
-    st.sidebar.metric("완료된 경기", f"{completed}/10")
+    st.sidebar.metric("완료된 경기", f"{completed}/{len(actual_matches)}")
     
     # 다음 경기
     next_match = None
@@ -170,249 +168,60 @@ def main():
         st.sidebar.success("모든 경기 완료!")
     
     # 탭 생성
-    tab1, tab2 = st.tabs(["🏟️ 토너먼트 브라켓", "📈 예측 통계"])
+    tab1, tab2, tab3 = st.tabs(["🏟️ 토너먼트 브라켓", "📈 예측 통계", "🔮 만약에"])
     
     with tab1:
         st.header("토너먼트 브라켓")
         
-        # 경기 결과로부터 팀 결정
-        r1_m1_winner = match_results.get('R1 M1')
-        r1_m2_winner = match_results.get('R1 M2')
-        gen_choice = match_results.get('GEN이 고른 팀')
-        r2_m1_winner = match_results.get('R2 M1')
-        r2_m2_winner = match_results.get('R2 M2')
-        r1_lb_winner = match_results.get('R1 LB')
-        r3_ub_winner = match_results.get('R3 UB')
-        r2_lb_winner = match_results.get('R2 LB')
-        r3_lb_winner = match_results.get('R3 LB')
-        
         # GEN 선택 정보
-        if gen_choice:
-            st.info(f"🎯 GEN이 선택한 팀: {gen_choice}")
-        elif r1_m1_winner and r1_m2_winner:
-            st.info(f"🎯 GEN이 선택 가능한 팀: {r1_m1_winner}, {r1_m2_winner}")
-        else:
-            st.info("🎯 R1 경기 완료 후 GEN이 상대를 선택합니다")
-        
-        # 승자조 브라켓
-        st.subheader("🏆 승자조 대진표")
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("**1라운드**")
-            show_match("R1 M1", "T1", "DK", r1_m1_winner, schedule['R1 M1'])
-            st.markdown("")
-            show_match("R1 M2", "KT", "BFX", r1_m2_winner, schedule['R1 M2'])
-        
-        with col2:
-            st.markdown("**2라운드**")
-            # R2 M1
-            if gen_choice:
-                show_match("R2 M1", "GEN", gen_choice, r2_m1_winner, schedule['R2 M1'])
-            else:
-                show_match("R2 M1", "GEN", "미정", None, schedule['R2 M1'])
-            
-            st.markdown("")
-            
-            # R2 M2
-            if gen_choice and r1_m1_winner and r1_m2_winner:
-                other_team = r1_m2_winner if gen_choice == r1_m1_winner else r1_m1_winner
-                show_match("R2 M2", "HLE", other_team, match_results.get('R2 M2'), schedule['R2 M2'])
-            else:
-                show_match("R2 M2", "HLE", "미정", None, schedule['R2 M2'])
-        
-        with col3:
-            st.markdown("**승자조 결승**")
-            if r2_m1_winner and r2_m2_winner:
-                show_match("R3 UB", r2_m1_winner, r2_m2_winner, match_results.get('R3 UB'), schedule['R3 UB'])
-            else:
-                show_match("R3 UB", "미정", "미정", None, schedule['R3 UB'])
-        
-        st.markdown("---")
-        
-        # 패자조 브라켓
-        st.subheader("⚔️ 패자조 대진표")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown("**패자조 1R**")
-            if r1_m1_winner and r1_m2_winner:
-                loser1 = "DK" if r1_m1_winner == "T1" else "T1"
-                loser2 = "BFX" if r1_m2_winner == "KT" else "KT"
-                show_match("R1 LB", loser1, loser2, match_results.get('R1 LB'), schedule['R1 LB'])
-            else:
-                show_match("R1 LB", "미정", "미정", None, schedule['R1 LB'])
-        
-        with col2:
-            st.markdown("**패자조 2R**")
-            # R2 LB: R2 M2 패자 vs R1 LB 승자
-            r2_m2_loser = None
-            if r2_m2_winner and r1_m1_winner and r1_m2_winner and gen_choice:
-                other_team = r1_m2_winner if gen_choice == r1_m1_winner else r1_m1_winner
-                r2_m2_loser = 'HLE' if r2_m2_winner == other_team else other_team
-            
-            team1_r2lb = r2_m2_loser if r2_m2_loser else "미정"
-            team2_r2lb = r1_lb_winner if r1_lb_winner else "미정"
-            
-            # 둘 중 하나라도 미정이면 승자는 None
-            winner_r2lb = r2_lb_winner if team1_r2lb != "미정" and team2_r2lb != "미정" else None
-            show_match("R2 LB", team1_r2lb, team2_r2lb, winner_r2lb, schedule['R2 LB'])
-        
-        with col3:
-            st.markdown("**패자조 3R**")
-            # R3 LB: R2 M1 패자 vs R2 LB 승자
-            r2_m1_loser = None
-            if r2_m1_winner and gen_choice:
-                r2_m1_loser = 'GEN' if r2_m1_winner == gen_choice else gen_choice
-            
-            team1_r3lb = r2_m1_loser if r2_m1_loser else "미정"
-            team2_r3lb = r2_lb_winner if r2_lb_winner else "미정"
-            
-            winner_r3lb = r3_lb_winner if team1_r3lb != "미정" and team2_r3lb != "미정" else None
-            show_match("R3 LB", team1_r3lb, team2_r3lb, winner_r3lb, schedule['R3 LB'])
+        choice_message = gen_choice_message(match_results, bracket)
+        if choice_message:
+            st.info(choice_message)
         
-        with col4:
-            st.markdown("**패자조 결승**")
-            # R4 LF: R3 UB 패자 vs R3 LB 승자
-            r3_ub_loser = None
-            if r3_ub_winner and r2_m1_winner and r2_m2_winner:
-                r3_ub_loser = r2_m1_winner if r3_ub_winner == r2_m2_winner else r2_m2_winner
-            
-            team1_r4lf = r3_ub_loser if r3_ub_loser else "미정"
-            team2_r4lf = r3_lb_winner if r3_lb_winner else "미정"
-            
-            winner_r4lf = match_results.get('R4 LF') if team1_r4lf != "미정" and team2_r4lf != "미정" else None
-            show_match("R4 LF", team1_r4lf, team2_r4lf, winner_r4lf, schedule['R4 LF'])
-        
-        st.markdown("---")
-        
-        # 그랜드 파이널
-        st.subheader("🏆 GRAND FINAL")
-        col1, col2, col3 = st.columns([1, 2, 1])
-        
-        with col2:
-            r4_lf_winner = match_results.get('R4 LF')
-            
-            team1_gf = r3_ub_winner if r3_ub_winner else "미정"
-            team2_gf = r4_lf_winner if r4_lf_winner else "미정"
-            
-            winner_gf = match_results.get('Grand Final') if team1_gf != "미정" and team2_gf != "미정" else None
-            show_match("Grand Final", team1_gf, team2_gf, winner_gf, schedule['Grand Final'])
+        show_bracket(match_results, schedule, bracket, event.id)
     
     with tab2:
         st.header("예측 통계")
         
         if completed > 0:
             # 생존자 통계
-            surviving, eliminated, survival_rate, color, emoji, status = calculate_survivor_stats(predictions, match_results)
+            # 예측/결과 파일이 그대로면 모든 세션이 같은 통계와 렌더링 결과를 재사용
+            key = ('stats', event.id, data.fingerprint)
+            stats = cached(key, lambda: compute_dashboard_stats(predictions, match_results, bracket, data.wrong_counts))
+            survival_rate = stats['survival_rate']
             
             if predictions:
                 # 대형 생존자 표시
-                st.markdown(f"""
-                <div style='
-                    text-align: center; 
-                    padding: 30px; 
-                    background: linear-gradient(135deg, {color}22, {color}11); 
-                    border-radius: 20px; 
-                    margin: 20px 0;
-                    border: 3px solid {color};
-                '>
-                    <h1 style='color: {color}; margin: 0; font-size: 4em;'>{emoji} {surviving}</h1>
-                    <h2 style='color: {color}; margin: 10px 0; font-size: 2em;'>SURVIVORS REMAINING</h2>
-                    <p style='color: #666; margin: 0; font-size: 1.4em;'>
-                        생존율 {survival_rate:.1f}% - 상태: {status}
-                    </p>
-                    <p style='color: #888; margin: 10px 0; font-size: 1.1em;'>
-                        총 {len(predictions)}명 중 {eliminated}명 탈락
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(cached(key + ('banner',), lambda: survivor_banner_html(stats)), unsafe_allow_html=True)
                 
                 # 메트릭
                 col1, col2, col3, col4 = st.columns(4)
                 
                 with col1:
-                    st.metric("총 참가자", len(predictions))
+                    st.metric("총 참가자", stats['total'])
                 
                 with col2:
-                    st.metric("생존자", surviving, delta=f"-{eliminated}")
+                    st.metric("생존자", stats['surviving'], delta=f"-{stats['eliminated']}")
                 
                 with col3:
-                    # 평균 정확도 계산
-                    participant_stats = []
-                    for participant in predictions:
-                        prediction = participant['prediction']
-                        wrong = 0
-                        total = 0
-                        for match in actual_matches:
-                            actual = match_results.get(match)
-                            if actual:
-                                total += 1
-                                predicted = prediction.get(match)
-                                if predicted and predicted != actual:
-                                    wrong += 1
-                        accuracy = (total - wrong) / total if total > 0 else 1.0
-                        participant_stats.append(accuracy)
-                    
-                    avg_accuracy = sum(participant_stats) / len(participant_stats) if participant_stats else 0
-                    st.metric("평균 정확도", f"{avg_accuracy:.1%}")
+                    st.metric("평균 정확도", f"{stats['avg_accuracy']:.1%}")
                 
                 with col4:
-                    perfect = surviving if completed > 0 else len(predictions)
-                    st.metric("완벽한 예측", perfect)
+                    st.metric("완벽한 예측", stats['perfect'])
                 
                 # 차트
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     # 파이 차트
-                    pie_fig = go.Figure(data=[go.Pie(
-                        labels=['생존자', '탈락자'],
-                        values=[surviving, eliminated],
-                        hole=0.4,
-                        marker_colors=['#10B981', '#EF4444']
-                    )])
-                    pie_fig.update_layout(
-                        title=f"참가자 현황 (총 {len(predictions)}명)",
-                        height=400
-                    )
-                    st.plotly_chart(pie_fig, use_container_width=True)
+                    show_figure(key + ('pie',), lambda: build_pie_figure(stats))
                 
                 with col2:
                     # 히스토그램 - 틀린 예측 수별 분포
-                    wrong_counts = []
-                    for participant in predictions:
-                        prediction = participant['prediction']
-                        wrong = 0
-                        for match in actual_matches:
-                            actual = match_results.get(match)
-                            if actual:
-                                predicted = prediction.get(match)
-                                if predicted and predicted != actual:
-                                    wrong += 1
-                        wrong_counts.append(wrong)
-                    
-                    if wrong_counts:
-                        max_wrong = max(wrong_counts)
-                        hist_data = {}
-                        for count in wrong_counts:
-                            hist_data[count] = hist_data.get(count, 0) + 1
-                        
-                        x_vals = list(range(max_wrong + 1))
-                        y_vals = [hist_data.get(i, 0) for i in x_vals]
-                        
-                        hist_fig = go.Figure(data=[go.Bar(
-                            x=x_vals,
-                            y=y_vals,
-                            marker_color='#3B82F6'
-                        )])
-                        hist_fig.update_layout(
-                            title="틀린 예측 수별 참가자 분포",
-                            xaxis_title="틀린 예측 수",
-                            yaxis_title="참가자 수",
-                            height=400
-                        )
-                        st.plotly_chart(hist_fig, use_container_width=True)
+                    if stats['histogram']['x']:
+                        show_figure(key + ('histogram',), lambda: build_histogram_figure(stats))
+                
+                show_survivor_search(data, bracket)
                 
                 # 경고 메시지
                 if survival_rate < 30:
@@ -424,9 +233,27 @@ def main():
         else:
             st.info("아직 완료된 경기가 없어 통계를 표시할 수 없습니다.")
     
+    with tab3:
+        st.header("만약에 (가상 결과)")
+        st.caption("남은 경기의 승자를 골라 보면 생존자와 순위가 바로 바뀝니다.")
+        
+        if predictions:
+            show_whatif(data, bracket, schedule)
+        else:
+            st.warning("예측 데이터를 불러올 수 없습니다.")
+    
     # 푸터
     st.markdown("---")
     st.markdown(f"📅 마지막 업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
+def main():
+    # 계측은 숨김 패널을 요청한 rerun에서만, 이 rerun의 컨텍스트에만 기록 (다른 세션에 영향 없음)
+    if not profiling_panel_requested():
+        render_dashboard()
+        return
+    with profiling.recording() as recorder:
+        render_dashboard()
+    show_profiling_panel(recorder)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
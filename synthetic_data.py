@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+합성 토너먼트 데이터 생성기
+
+PGR21 댓글 복사본 형식의 comments.txt와 그에 맞는 predictions.json,
+match_result.txt를 시드 고정으로 생성합니다. 참가자마다 자기 브라켓을 따라
+팀 강도에 비례해 예측을 고르므로 실제처럼 인기 팀 쏠림이 생기고,
+잡담 댓글, 일부 필드만 적은 댓글, "(수정됨)" 표시도 섞습니다.
+
+사용법:
+    python synthetic_data.py 10000 --output synthetic_10000 [--seed 42]
+"""
+
+import argparse
+import json
+import os
+import random
+
+from bracket import Bracket
+
+# 팀별 예측 선호도 (실제 예측 데이터의 쏠림을 대략 반영)
+TEAM_WEIGHTS = {'T1': 5.0, 'GEN': 4.5, 'KT': 3.0, 'HLE': 2.5, 'BFX': 1.2, 'DK': 1.0}
+
+NOISE_LINES = [
+    "이벤트 감사합니다!",
+    "티원 화이팅! 도란 화이팅!",
+    "사비를 들여 이런 이벤트를 마련해주시다니.. 정말 감사합니다.",
+    "우아 개발자시군요",
+    "로또갑니다",
+    "올해는 젠지가 우승할 것 같네요",
+    "크크크",
+]
+
+NICKNAME_PARTS = ['고양이', '별빛', '바람', 'Faker', '초코', '라면', '달팽이', 'Zeus', '하늘', '우유']
+
+def simulate_bracket(bracket, rng, weights):
+    """브라켓 순서대로 가능한 팀 중 가중치 비례로 골라 한 장의 예측(또는 실제 결과) 생성"""
+    picks = {}
+    for slot in bracket.slots:
+        options = bracket.slot_options(slot, picks)
+        picks[slot] = rng.choices(options, weights=[weights.get(team, 1.0) for team in options])[0]
+    return picks
+
+def make_nickname(index, rng):
+    """중복 없는 닉네임"""
+    return f"{rng.choice(NICKNAME_PARTS)}{index}"
+
+def comment_block(nickname, minute, body_lines):
+    """PGR21 댓글 한 개의 복사본 텍스트"""
+    hour, minute = 21 + minute // 60 % 3, minute % 60
+    return [
+        nickname,
+        "추천 0",
+        "댓글 아이콘 해시 아이콘 신고 아이콘",
+        "25/",
+        f"09/07 {hour:02d}:{minute:02d}",
+        "수정 아이콘",
+    ] + body_lines
+
+def generate_event(participants, seed=42, noise_rate=0.03, partial_rate=0.01, edit_rate=0.02):
+    """합성 이벤트 생성 (comments 텍스트, 정상 예측 목록, 실제 결과)"""
+    rng = random.Random(seed)
+    bracket = Bracket()
+
+    # 실제 결과는 팀 강도 차이를 줄여 이변이 나오도록 시뮬레이션
+    actual_weights = {team: weight ** 0.5 for team, weight in TEAM_WEIGHTS.items()}
+    match_results = simulate_bracket(bracket, rng, actual_weights)
+
+    # 참가자마다 선호도를 조금씩 흔들어 개인 성향 반영
+    lines = []
+    predictions = []
+    for index in range(participants):
+        nickname = make_nickname(index, rng)
+        roll = rng.random()
+
+        if roll < noise_rate:
+            body = rng.sample(NOISE_LINES, k=rng.randint(1, 2))
+        else:
+            personal = {team: weight * rng.uniform(0.5, 1.5) for team, weight in TEAM_WEIGHTS.items()}
+            picks = simulate_bracket(bracket, rng, personal)
+            body = [f"{slot} : {picks[slot]}" for slot in bracket.slots]
+
+            if roll < noise_rate + partial_rate:
+                body = body[:rng.randint(1, len(body) - 1)]
+            else:
+                predictions.append({'nickname': nickname, 'prediction': picks})
+
+            if rng.random() < edit_rate:
+                body[0] = f"(수정됨) {body[0]}"
+            if rng.random() < 0.2:
+                body = [rng.choice(NOISE_LINES), ""] + body
+            if rng.random() < 0.2:
+                body = body + ["", rng.choice(NOISE_LINES)]
+
+        lines.extend(comment_block(nickname, index, body))
+
+    return '\n'.join(lines), predictions, match_results
+
+def write_event(output_dir, participants, seed=42, completed_matches=None):
+    """합성 이벤트를 파일로 저장 (completed_matches개 슬롯까지만 결과 기록)"""
+    comments, predictions, match_results = generate_event(participants, seed)
+    os.makedirs(output_dir, exist_ok=True)
+
+    with open(os.path.join(output_dir, 'comments.txt'), 'w', encoding='utf-8') as f:
+        f.write(comments)
+    with open(os.path.join(output_dir, 'predictions.json'), 'w', encoding='utf-8') as f:
+        json.dump(predictions, f, ensure_ascii=False)
+
+    slots = Bracket().slots
+    limit = len(slots) if completed_matches is None else completed_matches
+    with open(os.path.join(output_dir, 'match_result.txt'), 'w', encoding='utf-8') as f:
+        for position, slot in enumerate(slots):
+            result = match_results[slot] if position < limit else ''
+            f.write(f"{slot} : {result}\n")
+
+    return comments, predictions, match_results
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 토너먼트 데이터 생성기")
+    parser.add_argument('participants', type=int)
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--completed', type=int, default=None, help="결과를 기록할 슬롯 수 (기본: 전체)")
+    args = parser.parse_args()
+
+    output_dir = args.output or f"synthetic_{args.participants}"
+    _, predictions, _ = write_event(output_dir, args.participants, args.seed, args.completed)
+    print(f"✅ {output_dir}/ 생성 완료: 댓글 {args.participants}개, 정상 예측 {len(predictions)}개")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+팀 별칭 정규화
+
+"티원", "젠지", "t1", "Gen.G", "한화" 같은 표기를 브라켓의 팀 코드(T1, GEN, HLE ...)로 바꿉니다.
+모든 별칭을 하나의 트라이로 묶어 두고, 댓글의 한 위치에서 문자 단위로 한 번만 따라가며
+가장 긴 별칭을 찾으므로 별칭이 늘어나도 정규식을 별칭마다 돌리지 않습니다.
+대소문자와 전각 문자는 무시합니다 (NFKC + 소문자).
+한 글자 별칭("젠")은 바로 뒤에 한글이 이어지면 ("젠장") 다른 단어의 첫 글자로 보고 맞추지 않습니다.
+
+이벤트별 별칭은 event.json의 "aliases" ({"별칭": "팀 코드"})로 추가합니다.
+"""
+
+import re
+import unicodedata
+
+# 기본 별칭 (브라켓에 있는 팀 코드로 향하는 것만 사용)
+DEFAULT_TEAM_ALIASES = {
+    'T1': ['티원', 'SKT', 'SKT T1', '티1'],
+    'GEN': ['젠지', 'Gen.G', 'GenG', '젠'],
+    'HLE': ['한화', '한화생명', 'Hanwha'],
+    'KT': ['케이티', 'kt롤스터', 'KT Rolster', '크트'],
+    'DK': ['디플러스', '디플', 'Dplus', 'Dplus KIA', '담원'],
+    'BFX': ['피어엑스', 'FearX', 'BNK', 'BNK FearX', '피엑'],
+}
+
+# 별칭 바로 뒤에 영문/숫자가 이어지면 다른 단어로 봄 (한글 조사는 허용: "젠지가")
+_ASCII_WORD = re.compile(r'[A-Za-z0-9]')
+# 이 길이보다 짧은 별칭은 뒤에 한글도 이어지면 안 됨 ("젠장"의 "젠", 대신 조사도 붙일 수 없음)
+SHORT_ALIAS_LENGTH = 2
+_HANGUL = re.compile(r'[\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3]')
+# 해석하지 못한 팀명 기록용 (기존 파서의 (\w+) 캡처와 같은 범위)
+_RAW_TOKEN = re.compile(r'\w+')
+
+
+def normalize(text):
+    """비교용 정규화 (NFKC + 소문자)"""
+    return unicodedata.normalize('NFKC', text).lower()
+
+
+class AliasMatcher:
+    """별칭 트라이 (노드는 dict, 별칭 끝 노드의 None 키에 팀 코드 저장)"""
+    __slots__ = ('root', 'teams')
+
+    def __init__(self, teams, aliases=None, defaults=DEFAULT_TEAM_ALIASES):
+        self.root = {}
+        self.teams = list(teams)
+        team_set = set(self.teams)
+        for team in self.teams:
+            self.add(team, team)
+            for alias in defaults.get(team, ()):
+                self.add(alias, team)
+        for alias, team in (aliases or {}).items():
+            if team in team_set:
+                self.add(alias, team)
+
+    def add(self, alias, team):
+        node = self.root
+        for char in normalize(alias):
+            node = node.setdefault(char, {})
+        node[None] = team
+
+    def match_at(self, text, position):
+        """position에서 시작하는 가장 긴 별칭 (팀 코드, 끝 위치) / 없으면 (None, position)"""
+        node = self.root
+        best, best_end = None, position
+        index = position
+        length = len(text)
+        while index < length:
+            char = text[index]
+            if char.isascii():
+                chars = char.lower()
+            else:
+                chars = normalize(char)
+            for normalized in chars:
+                node = node.get(normalized)
+                if node is None:
+                    break
+            if node is None:
+                break
+            index += 1
+            if None in node and not (index < length and self._joined(text, position, index)):
+                best, best_end = node[None], index
+        return best, best_end
+
+    @staticmethod
+    def _joined(text, start, end):
+        """별칭 text[start:end] 뒤의 글자가 같은 단어로 이어지는지"""
+        if _ASCII_WORD.match(text, end):
+            return True
+        return end - start < SHORT_ALIAS_LENGTH and _HANGUL.match(text, end) is not None
+
+    def resolve(self, text, position=0):
+        """position의 팀 표기를 해석 (팀 코드, 원문 토큰)
+
+        별칭이면 (팀 코드, 원문), 알 수 없는 단어면 (None, 원문), 단어가 없으면 (None, None)
+        """
+        team, end = self.match_at(text, position)
+        if team:
+            return team, text[position:end]
+        token = _RAW_TOKEN.match(text, position)
+        return None, token.group(0) if token else None
@@ -0,0 +1,149 @@
+"""
+api_server.PredictionAPI 조회 테스트 (임시 예측/결과 파일로 lookup 호출, 304는 로컬 포트로 확인)
+
+    python -m pytest tests/test_api_server.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import unittest
+from urllib.parse import quote
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_server import PredictionAPI, handle_connection
+
+PREDICTIONS = [
+    ('철수', {'R1 M1': 'T1', 'R1 M2': 'KT'}),
+    ('영희', {'R1 M1': 'T1', 'R1 M2': 'BFX'}),
+    ('민수', {'R1 M1': 'HLE', 'R1 M2': 'KT'}),
+    ('지은', {'R1 M1': 'HLE', 'R1 M2': 'BFX'}),
+    ('현우', {'R1 M1': 'T1', 'R1 M2': 'KT'}),
+]
+
+
+class PredictionAPITest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        # data_cache가 현재 디렉터리의 .cache/에 쓰므로 임시 디렉터리에서 실행
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.predictions_file = os.path.join(self.tmp.name, 'predictions.json')
+        self.results_file = os.path.join(self.tmp.name, 'match_result.txt')
+        with open(self.predictions_file, 'w', encoding='utf-8') as f:
+            json.dump([{'nickname': nickname, 'prediction': prediction} for nickname, prediction in PREDICTIONS],
+                      f, ensure_ascii=False)
+        self.write_results({'R1 M1': 'T1'})
+        self.api = PredictionAPI(self.predictions_file, self.results_file, page_size=2, check_interval=0)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def write_results(self, results):
+        with open(self.results_file, 'w', encoding='utf-8') as f:
+            for slot in ('R1 M1', 'R1 M2'):
+                f.write(f"{slot} : {results.get(slot) or ''}\n")
+        # 같은 크기로 빠르게 다시 써도 변경으로 보이도록 mtime을 옮김
+        stat = os.stat(self.results_file)
+        os.utime(self.results_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def body(self, target):
+        response = self.api.lookup(target)
+        self.assertIsNotNone(response, target)
+        return json.loads(response.body)
+
+    def test_etag_is_stable_until_results_change(self):
+        first = self.api.lookup('/version')
+        again = self.api.lookup('/version')
+        # 같은 버전이면 같은 ETag → 서버는 If-None-Match에 304로 답함
+        self.assertEqual(first.etag, again.etag)
+        self.assertEqual(json.loads(first.body)['completed_matches'], 1)
+
+        self.write_results({'R1 M1': 'T1', 'R1 M2': 'KT'})
+        changed = self.api.lookup('/version')
+        self.assertNotEqual(changed.etag, first.etag)
+        self.assertEqual(json.loads(changed.body)['completed_matches'], 2)
+
+    def test_if_none_match_returns_304(self):
+        async def request(headers):
+            server = await asyncio.start_server(
+                lambda reader, writer: handle_connection(self.api, reader, writer), '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                writer.write(f"GET /survivors HTTP/1.1\r\n{headers}Connection: close\r\n\r\n".encode('latin-1'))
+                await writer.drain()
+                raw = await reader.read()
+                writer.close()
+            head, _, body = raw.partition(b'\r\n\r\n')
+            lines = head.decode('latin-1').split('\r\n')
+            fields = dict(line.split(': ', 1) for line in lines[1:])
+            return int(lines[0].split()[1]), fields, body
+
+        status, fields, body = asyncio.run(request(''))
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)['total'], 5)
+        etag = fields['ETag']
+
+        status, fields, body = asyncio.run(request(f"If-None-Match: {etag}\r\n"))
+        self.assertEqual((status, body), (304, b''))
+        self.assertEqual(fields['ETag'], etag)
+
+        status, _, _ = asyncio.run(request('If-None-Match: "stale"\r\n'))
+        self.assertEqual(status, 200)
+
+    def test_leaderboard_pagination(self):
+        first = self.body('/leaderboard?page=1')
+        self.assertEqual((first['page'], first['page_count'], first['page_size'], first['total']), (1, 3, 2, 5))
+        last = self.body('/leaderboard?page=3')
+        self.assertEqual(len(last['entries']), 1)
+
+        nicknames = [entry['nickname'] for page in (1, 2, 3) for entry in self.body(f'/leaderboard?page={page}')['entries']]
+        self.assertEqual(sorted(nicknames), sorted(nickname for nickname, _ in PREDICTIONS))
+        # 같은 틀린 개수는 같은 순위
+        entries = first['entries'] + self.body('/leaderboard?page=2')['entries']
+        self.assertEqual([entry['wrong_predictions'] for entry in entries], [0, 0, 0, 1])
+        self.assertEqual([entry['rank'] for entry in entries], [1, 1, 1, 4])
+
+        self.assertIsNone(self.api.lookup('/leaderboard?page=4'))
+        self.assertIsNone(self.api.lookup('/leaderboard?page=x'))
+
+    def test_participant_lookup(self):
+        participant = self.body('/participants/' + quote('민수'))
+        self.assertEqual(participant['wrong_predictions'], 1)
+        self.assertEqual(participant['prediction']['R1 M2'], 'KT')
+        self.assertIs(self.api.lookup('/participants/' + quote('민수')),
+                      self.api.lookup('/participants/' + quote('민수')))
+
+        self.assertIsNone(self.api.lookup('/participants/' + quote('없는닉네임')))
+        self.assertIsNone(self.api.lookup('/participants/' + quote('없는닉네임') + '/path'))
+        self.assertIsNone(self.api.lookup('/unknown'))
+
+    def test_background_rebuild_serves_previous_version(self):
+        old_version = self.api.version
+
+        async def scenario():
+            self.write_results({'R1 M1': 'T1', 'R1 M2': 'KT'})
+            self.api.schedule_refresh()
+            self.assertIsNotNone(self.api.rebuilding)
+            # 다시 계산이 끝나기 전에는 이전 버전으로 답함
+            during = json.loads(self.api.lookup('/version', refresh=False).body)
+            await self.api.rebuilding
+            after = json.loads(self.api.lookup('/version', refresh=False).body)
+            return during, after
+
+        during, after = asyncio.run(scenario())
+        self.assertEqual(during['version'], old_version)
+        self.assertEqual(during['completed_matches'], 1)
+        self.assertEqual(after['completed_matches'], 2)
+        self.assertNotEqual(after['version'], old_version)
+        self.assertIsNone(self.api.rebuilding)
+
+
+if __name__ == '__main__':
+    unittest.main()
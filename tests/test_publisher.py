@@ -0,0 +1,139 @@
+"""
+publisher.py 게시 대기열 테스트 (임시 bare 저장소를 원격으로 사용)
+
+    python -m pytest tests/test_publisher.py
+    python -m unittest discover tests
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import publisher
+from publisher import INFLIGHT_FILE, PUSH_PENDING_FILE, Publisher
+
+
+def git(cwd, *args):
+    result = subprocess.run(['git', *args], cwd=cwd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise AssertionError(f"git {' '.join(args)} 실패: {result.stderr}")
+    return result.stdout.strip()
+
+
+class PublisherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.remote = os.path.join(self.tmp.name, 'remote.git')
+        self.repo = os.path.join(self.tmp.name, 'work')
+        git(self.tmp.name, 'init', '--bare', '-q', '-b', 'main', self.remote)
+        git(self.tmp.name, 'init', '-q', '-b', 'main', self.repo)
+        git(self.repo, 'config', 'user.name', 'test')
+        git(self.repo, 'config', 'user.email', 'test@example.com')
+        self.results_file = os.path.join(self.repo, 'match_result.txt')
+        self.write_results('R1 M1 : \n')
+        with open(os.path.join(self.repo, '.gitignore'), 'w', encoding='utf-8') as f:
+            f.write('/.publish/\n')
+        git(self.repo, 'add', '.')
+        git(self.repo, 'commit', '-q', '-m', 'init')
+        git(self.repo, 'remote', 'add', 'origin', self.remote)
+        git(self.repo, 'push', '-q', '-u', 'origin', 'main')
+        self.publisher = Publisher(self.repo)
+        # 재시도 대기를 짧게
+        self.backoff_base = publisher.BACKOFF_BASE
+        publisher.BACKOFF_BASE = 0.01
+
+    def tearDown(self):
+        publisher.BACKOFF_BASE = self.backoff_base
+        self.tmp.cleanup()
+
+    def write_results(self, text):
+        with open(self.results_file, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def update(self, winner):
+        self.write_results(f"R1 M1 : {winner}\n")
+        self.publisher.enqueue([self.results_file], f"Update R1 M1: {winner} 승리")
+
+    def remote_log(self):
+        return git(self.remote, 'log', '--format=%s', 'main').splitlines()
+
+    def break_remote(self):
+        git(self.repo, 'remote', 'set-url', 'origin', os.path.join(self.tmp.name, 'missing.git'))
+
+    def restore_remote(self):
+        git(self.repo, 'remote', 'set-url', 'origin', self.remote)
+
+    def test_coalesces_jobs_into_one_commit(self):
+        for winner in ('T1', 'DK', 'T1'):
+            self.update(winner)
+        self.assertTrue(self.publisher.run(coalesce=0, linger=0, retries=0))
+
+        log = self.remote_log()
+        self.assertEqual(log, ['Update: 3건 결과 반영', 'init'])
+        self.assertEqual(self.publisher.pending_count(), 0)
+        self.assertIsNone(self.publisher.worker_pid())
+        self.assertEqual(self.publisher.read_status()['state'], 'idle')
+
+    def test_retries_push_until_remote_is_reachable(self):
+        self.break_remote()
+        self.update('T1')
+        outcome = []
+        worker = threading.Thread(target=lambda: outcome.append(
+            self.publisher.run(coalesce=0, linger=0, retries=50)))
+        worker.start()
+        deadline = time.monotonic() + 10
+        while self.publisher.read_status().get('state') != 'retrying':
+            self.assertLess(time.monotonic(), deadline, "푸시 재시도 상태가 되지 않음")
+            time.sleep(0.01)
+        self.restore_remote()
+        worker.join(30)
+
+        self.assertEqual(outcome, [True])
+        self.assertEqual(self.remote_log(), ['Update R1 M1: T1 승리', 'init'])
+        self.assertFalse(os.path.exists(self.publisher.path(PUSH_PENDING_FILE)))
+
+    def test_resumes_after_restart(self):
+        # 푸시 재시도를 모두 실패하고 종료 → 커밋은 남고 푸시 대기 표시가 남음
+        self.break_remote()
+        self.update('T1')
+        self.assertFalse(self.publisher.run(coalesce=0, linger=0, retries=1))
+        self.assertTrue(os.path.exists(self.publisher.path(PUSH_PENDING_FILE)))
+
+        # 대기열을 가져간 뒤 커밋 전에 종료된 작업 프로세스 (inflight만 남음)
+        self.update('DK')
+        self.assertEqual(len(self.publisher.claim_jobs()), 1)
+        self.assertTrue(os.path.exists(self.publisher.path(INFLIGHT_FILE)))
+
+        self.restore_remote()
+        restarted = Publisher(self.repo)
+        self.assertTrue(restarted.run(coalesce=0, linger=0, retries=0))
+        self.assertEqual(self.remote_log(), ['Update R1 M1: DK 승리', 'Update R1 M1: T1 승리', 'init'])
+        self.assertEqual(restarted.pending_count(), 0)
+
+        # 이미 커밋된 작업이 다시 들어와도 빈 커밋을 만들지 않음
+        restarted.enqueue([self.results_file], "Update R1 M1: DK 승리")
+        self.assertTrue(restarted.run(coalesce=0, linger=0, retries=0))
+        self.assertEqual(len(self.remote_log()), 3)
+
+    def test_worker_does_not_retire_with_queued_job(self):
+        self.assertTrue(self.publisher.acquire())
+        self.update('T1')
+        # 종료하려는 순간 작업이 들어와 있으면 PID 파일을 지우지 않고 계속 처리
+        self.assertFalse(self.publisher.retire())
+        self.assertEqual(self.publisher.worker_pid(), os.getpid())
+        self.assertFalse(self.publisher.ensure_worker())
+
+        self.publisher.claim_jobs()
+        self.assertTrue(self.publisher.retire())
+        self.assertIsNone(self.publisher.worker_pid())
+
+
+if __name__ == '__main__':
+    unittest.main()
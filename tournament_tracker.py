@@ -1,22 +1,39 @@
-import json
-import plotly.graph_objects as go
+
+import profiling
+from bitsets import survivor_engine
+from bracket import LCK_2025_BRACKET, Bracket
+from data_cache import load_predictions
+from model import as_dataset
+from sqlite_store import is_store_path, open_store
 
 class TournamentTracker:
-    def __init__(self):
-        self.teams = ['T1', 'DK', 'KT', 'BFX', 'GEN', 'HLE']
+    def __init__(self, predictions_file='predictions.json', results_file='match_result.txt', bracket=None):
+        self.predictions_file = predictions_file
+        self.results_file = results_file
+        self.bracket = bracket or Bracket()
+        self.teams = self.bracket.teams
+        self.store = None
+        if is_store_path(predictions_file):
+            # SQLite 저장소 (결과도 DB에서 읽고 채점은 SQL로)
+            self.store = open_store(predictions_file)
         self.predictions = []
         self.match_results = {}
         self.load_data()
         
+    @profiling.traced('load')
     def load_data(self):
         """데이터 로드"""
+        if self.store is not None:
+            self.predictions = self.store.load_dataset(self.bracket.slots)
+            self.match_results = self.store.load_results(self.bracket.slots)
+            print(f"예측 데이터 로드 완료: {len(self.predictions)}개")
+            return
         try:
             # 예측 데이터 로드
-            with open('predictions.json', 'r', encoding='utf-8') as f:
-                self.predictions = json.load(f)
+            self.predictions = load_predictions(self.predictions_file, self.bracket.slots)
             print(f"예측 데이터 로드 완료: {len(self.predictions)}개")
         except FileNotFoundError:
-            print("predictions.json 파일을 찾을 수 없습니다.")
+            print(f"{self.predictions_file} 파일을 찾을 수 없습니다.")
             self.predictions = []
         
         # 경기 결과 로드
@@ -25,11 +42,10 @@ class TournamentTracker:
     def load_match_results(self):
         """경기 결과 파일 로드"""
         results = {}
-        default_matches = ['R1 M1', 'R1 M2', 'GEN이 고른 팀', 'R2 M1', 'R2 M2', 
-                          'R1 LB', 'R2 LB', 'R3 UB', 'R3 LB', 'R4 LF', 'Grand Final']
+        default_matches = self.bracket.slots
         
         try:
-            with open('match_result.txt', 'r', encoding='utf-8') as f:
+            with open(self.results_file, 'r', encoding='utf-8') as f:
                 for line in f:
                     line = line.strip()
                     if ':' in line and line:
@@ -39,7 +55,7 @@ class TournamentTracker:
                             value = parts[1].strip()
                             results[key] = value if value else None
         except FileNotFoundError:
-            print("match_result.txt 파일을 찾을 수 없습니다.")
+            print(f"{self.results_file} 파일을 찾을 수 없습니다.")
         
         # 기본 매치들이 없으면 추가
         for match in default_matches:
@@ -52,6 +68,10 @@ class TournamentTracker:
         """개별 매치 정보 생성"""
         winner = self.match_results.get(match_key)
         
+        # LCK 2025 브라켓이 아니면 모든 매치를 브라켓 정의로 계산
+        if self.bracket.definition is not LCK_2025_BRACKET:
+            return self.bracket_match_info(match_key, winner)
+        
         if match_key == 'R1 M1':
             return {
                 'match_id': 'R1 M1',
@@ -167,20 +187,25 @@ class TournamentTracker:
                     'status': 'R2 완료 대기'
                 }
                 
-        # 다른 매치들도 비슷한 방식으로 처리
+        # 나머지 패자조/결승 매치는 브라켓 정의로 대진 계산
         else:
-            return {
-                'match_id': match_key,
-                'title': match_key,
-                'team1': '미정',
-                'team2': '미정', 
-                'winner': winner,
-                'status': '대기' if not winner else '완료'
-            }
+            return self.bracket_match_info(match_key, winner)
+    
+    def bracket_match_info(self, match_key, winner):
+        """브라켓 정의로 계산한 매치 정보"""
+        team1, team2 = self.bracket.match_teams(match_key, self.match_results)
+        return {
+            'match_id': match_key,
+            'title': self.bracket.matches[match_key]['title'],
+            'team1': team1 or '미정',
+            'team2': team2 or '미정', 
+            'winner': winner if team1 and team2 else None,
+            'status': '대기' if not (team1 and team2) else ('완료' if winner else '예정')
+        }
     
     def get_all_matches(self):
         """모든 매치 정보 반환"""
-        match_order = ['R1 M1', 'R1 M2', 'R2 M1', 'R2 M2', 'R1 LB', 'R2 LB', 'R3 UB', 'R3 LB', 'R4 LF', 'Grand Final']
+        match_order = self.bracket.match_keys
         matches = []
         
         for match_key in match_order:
@@ -190,7 +215,9 @@ class TournamentTracker:
         return matches
     
     def get_gen_choice_status(self):
-        """GEN 선택 상태 반환"""
+        """GEN 선택 상태 반환 (GEN 선택 슬롯이 없는 브라켓이면 None)"""
+        if 'GEN이 고른 팀' not in self.bracket.choices:
+            return None
         r1_m1_winner = self.match_results.get('R1 M1')
         r1_m2_winner = self.match_results.get('R1 M2')
         gen_choice = self.match_results.get('GEN이 고른 팀')
@@ -205,38 +232,44 @@ class TournamentTracker:
         else:
             return "R1 경기 시작 대기"
     
+    @profiling.traced('score')
     def calculate_prediction_stats(self):
         """예측 통계 계산"""
         if not self.predictions:
             return [], 0
             
-        actual_matches = ['R1 M1', 'R1 M2', 'R2 M1', 'R2 M2', 'R1 LB', 'R2 LB', 'R3 UB', 'R3 LB', 'R4 LF', 'Grand Final']
-        participant_stats = []
+        actual_matches = self.bracket.match_keys
+        total_matches = sum(1 for match_key in actual_matches if self.match_results.get(match_key))
+        if self.store is not None:
+            participant_stats = [
+                {
+                    'nickname': nickname,
+                    'wrong_count': wrong_count,
+                    'total_matches': total_matches,
+                    'is_eliminated': wrong_count > 0,
+                    'accuracy': (total_matches - wrong_count) / total_matches if total_matches > 0 else 1.0
+                }
+                for nickname, wrong_count in self.store.wrong_counts()
+            ]
+            profiling.count('participants_scored', len(participant_stats))
+            return participant_stats, len(participant_stats)
         
-        for participant in self.predictions:
-            nickname = participant['nickname']
-            prediction = participant['prediction']
-            wrong_count = 0
-            total_matches = 0
-            
-            for match_key in actual_matches:
-                actual_result = self.match_results.get(match_key)
-                if actual_result:
-                    total_matches += 1
-                    predicted = prediction.get(match_key)
-                    
-                    if predicted and predicted != actual_result:
-                        wrong_count += 1
-            
+        dataset = as_dataset(self.predictions)
+        wrong_counts = dataset.wrong_counts(self.match_results, actual_matches)
+        survivor_flags = survivor_engine(self.predictions, self.bracket).flags(self.match_results)
+        
+        participant_stats = []
+        for nickname, wrong_count, survived in zip(dataset.nicknames, wrong_counts, survivor_flags):
             participant_stats.append({
                 'nickname': nickname,
                 'wrong_count': wrong_count,
                 'total_matches': total_matches,
-                'is_eliminated': wrong_count > 0,
+                'is_eliminated': not survived,
                 'accuracy': (total_matches - wrong_count) / total_matches if total_matches > 0 else 1.0
             })
         
-        return participant_stats, len(self.predictions)
+        profiling.count('participants_scored', len(participant_stats))
+        return participant_stats, len(dataset)
     
     def create_survivor_display(self, participant_stats, total_participants):
         """생존자 표시 정보 생성"""
@@ -263,8 +296,12 @@ class TournamentTracker:
             
         return surviving, eliminated, survival_rate, color, status_emoji, status_text
     
+    @profiling.traced('render')
     def create_stats_charts(self, participant_stats, total_participants):
         """통계 차트 생성"""
+        # plotly는 차트가 필요할 때만 로드 (CLI/비차트 API 시작 시간 단축)
+        import plotly.graph_objects as go
+        
         eliminated = sum(1 for p in participant_stats if p['is_eliminated'])
         surviving = total_participants - eliminated
         
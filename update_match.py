@@ -8,14 +8,17 @@ import subprocess
 import sys
 from datetime import datetime
 
+from events import default_event, event_from_argv
+
 class MatchUpdater:
-    def __init__(self):
-        self.match_file = 'match_result.txt'
-        self.teams = ['T1', 'DK', 'KT', 'BFX', 'GEN', 'HLE']
-        self.matches = [
-            'R1 M1', 'R1 M2', 'GEN이 고른 팀', 'R2 M1', 'R2 M2',
-            'R1 LB', 'R2 LB', 'R3 UB', 'R3 LB', 'R4 LF', 'Grand Final'
-        ]
+    def __init__(self, event=None, background=True):
+        self.event = event or default_event()
+        # True면 커밋/푸시를 publisher 대기열에 넣고 기다리지 않음 (--sync면 기존처럼 바로 실행)
+        self.background = background
+        self.match_file = self.event.results_file
+        self.bracket = self.event.bracket
+        self.teams = self.bracket.teams
+        self.matches = self.bracket.slots
     
     def load_current_results(self):
         """현재 경기 결과 로드"""
@@ -24,7 +27,7 @@ class MatchUpdater:
             with open(self.match_file, 'r', encoding='utf-8') as f:
                 for line in f:
                     if ':' in line:
-                        key, value = line.strip().split(' : ', 1)
+                        key, value = line.strip().split(':', 1)
                         results[key.strip()] = value.strip() if value.strip() else None
         else:
             # 파일이 없으면 생성
@@ -34,11 +37,30 @@ class MatchUpdater:
         return results
     
     def save_results(self, results):
-        """경기 결과 저장"""
-        with open(self.match_file, 'w', encoding='utf-8') as f:
+        """경기 결과 저장 (임시 파일에 쓴 뒤 교체하여 원자적으로 반영)"""
+        tmp_file = f"{self.match_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
             for match in self.matches:
-                result = results.get(match, '')
+                result = results.get(match) or ''
                 f.write(f"{match} : {result}\n")
+        os.replace(tmp_file, self.match_file)
+        
+        # SQLite 저장소가 있으면 같은 결과를 DB에도 기록 (대시보드 프로세스들이 DB에서 읽음)
+        # event.open_store()는 방금 쓴 파일을 외부 변경으로 보고 다시 가져오므로 동기화 없이 열고,
+        # 결과 파일의 새 상태를 기록해 두어 다음 동기화가 이 쓰기를 변경으로 보지 않게 함
+        from sqlite_store import open_store, source_state
+        store = open_store(self.event.store_file)
+        if store is not None:
+            store.save_results({match: results.get(match) for match in self.matches})
+            sources = store.sources()
+            sources['results'] = source_state(self.match_file)
+            store.record_sources(sources)
+        
+        # speculative.py가 이 결과의 스냅샷을 미리 만들어 두었으면 계산 없이 바로 게시
+        from speculative import publish_precomputed
+        version = publish_precomputed(self.event)
+        if version is not None:
+            print(f"⚡ 미리 계산한 스냅샷을 게시했습니다 (버전 {version})")
     
     def display_current_status(self, results):
         """현재 상태 표시"""
@@ -60,7 +82,7 @@ class MatchUpdater:
     
     def update_match_interactive(self):
         """대화형 경기 결과 업데이트"""
-        print("🏆 LCK 플레이오프 경기 결과 업데이트")
+        print(f"🏆 {self.event.title} 경기 결과 업데이트")
         print("=" * 50)
         
         results = self.load_current_results()
@@ -100,7 +122,10 @@ class MatchUpdater:
             commit_msg = f"Update: {next_match} 결과 - {winner} 승리"
             
             if input(f"\nGit에 커밋하시겠습니까? (y/n): ").lower() == 'y':
-                if self.git_commit(commit_msg):
+                if self.background:
+                    push = input("GitHub에 푸시하시겠습니까? (y/n): ").lower() == 'y'
+                    self.publish(commit_msg, push)
+                elif self.git_commit(commit_msg):
                     print("✅ Git 커밋이 완료되었습니다!")
                     
                     if input("GitHub에 푸시하시겠습니까? (y/n): ").lower() == 'y':
@@ -135,6 +160,15 @@ class MatchUpdater:
         except subprocess.CalledProcessError:
             return False
     
+    def publish(self, message, push=False):
+        """커밋(과 푸시)을 백그라운드 게시 대기열에 넣고 바로 반환 (여러 건은 커밋 하나로 합쳐짐)"""
+        from publisher import Publisher
+        
+        publisher = Publisher()
+        publisher.enqueue([self.match_file], message, push=push)
+        publisher.ensure_worker()
+        print(f"📤 Git {'커밋/푸시' if push else '커밋'}를 백그라운드로 예약했습니다 (상태: python publisher.py status)")
+    
     def update_match_direct(self, match_name, winner):
         """직접 경기 결과 업데이트"""
         if match_name not in self.matches:
@@ -153,13 +187,107 @@ class MatchUpdater:
         
         print(f"✅ {match_name}: {winner} 승리로 업데이트되었습니다!")
         return True
+    
+    def parse_batch_updates(self, text):
+        """'경기명 : 승리팀' 형식의 여러 줄을 파싱 (빈 줄과 # 주석은 무시)"""
+        updates = []
+        errors = []
+        for line_number, line in enumerate(text.splitlines(), 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if ':' not in line:
+                errors.append(f"{line_number}번째 줄: 형식 오류 ({line})")
+                continue
+            match_name, winner = (part.strip() for part in line.split(':', 1))
+            if match_name not in self.matches:
+                errors.append(f"{line_number}번째 줄: 올바르지 않은 경기명 ({match_name})")
+            elif winner and winner not in self.teams:
+                errors.append(f"{line_number}번째 줄: 올바르지 않은 팀명 ({winner})")
+            else:
+                updates.append((match_name, winner or None))
+        return updates, errors
+    
+    def update_matches_batch(self, updates, commit=True, push=False):
+        """여러 경기 결과를 검증 후 한 번에 저장하고 하나의 커밋으로 반영"""
+        if not updates:
+            print("반영할 경기 결과가 없습니다.")
+            return False
+        
+        results = self.load_current_results()
+        for match_name, winner in updates:
+            results[match_name] = winner
+        
+        # 전체 대진 일관성 검사 - 하나라도 어긋나면 아무것도 저장하지 않음
+        errors = self.bracket.validate(results)
+        if errors:
+            print("❌ 대진과 일치하지 않는 결과가 있어 반영하지 않았습니다:")
+            for error in errors:
+                print(f"  - {error}")
+            return False
+        
+        self.save_results(results)
+        print(f"✅ {len(updates)}개 경기 결과가 반영되었습니다.")
+        for match_name, winner in updates:
+            print(f"  - {match_name}: {winner if winner else '(초기화)'}")
+        
+        if commit and self.is_git_repo():
+            summary = ', '.join(f"{match_name} {winner or '-'}" for match_name, winner in updates)
+            message = f"Update: {len(updates)}경기 결과 일괄 반영 ({summary})"
+            if self.background:
+                self.publish(message, push)
+            elif self.git_commit(message):
+                print("✅ Git 커밋이 완료되었습니다!")
+                if push:
+                    if self.git_push():
+                        print("✅ GitHub 푸시가 완료되었습니다!")
+                    else:
+                        print("❌ 푸시 실패. 수동으로 푸시해주세요.")
+            else:
+                print("❌ 커밋 실패.")
+        return True
+
+def run_batch(updater, args):
+    """일괄 업데이트 모드 (--batch 파일|-)"""
+    positional = [arg for arg in args[1:] if not arg.startswith('--')]
+    source = positional[0] if positional else '-'
+    if source == '-':
+        text = sys.stdin.read()
+    else:
+        try:
+            with open(source, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except FileNotFoundError:
+            print(f"❌ 파일을 찾을 수 없습니다: {source}")
+            return False
+    
+    updates, errors = updater.parse_batch_updates(text)
+    if errors:
+        print("❌ 입력 형식 오류로 반영하지 않았습니다:")
+        for error in errors:
+            print(f"  - {error}")
+        return False
+    
+    return updater.update_matches_batch(
+        updates,
+        commit='--no-commit' not in args,
+        push='--push' in args
+    )
 
 def main():
-    updater = MatchUpdater()
+    event = event_from_argv(sys.argv)
+    sync = '--sync' in sys.argv
+    if sync:
+        sys.argv.remove('--sync')
+    updater = MatchUpdater(event, background=not sync)
     
     if len(sys.argv) == 1:
         # 대화형 모드
         updater.update_match_interactive()
+    elif sys.argv[1] == '--batch':
+        # 일괄 업데이트 모드
+        if not run_batch(updater, sys.argv[1:]):
+            sys.exit(1)
     elif len(sys.argv) == 3:
         # 직접 업데이트 모드
         match_name = sys.argv[1]
@@ -169,6 +297,10 @@ def main():
         print("사용법:")
         print("  python update_match.py                    # 대화형 모드")
         print("  python update_match.py '경기명' '승리팀'   # 직접 업데이트")
+        print("  python update_match.py --batch 파일|-      # 일괄 업데이트 (- 는 stdin)")
+        print("      [--no-commit] [--push]")
+        print("  (모든 모드에 --event 이벤트ID 를 붙이면 해당 이벤트의 결과 파일을 수정)")
+        print("  (커밋/푸시는 백그라운드 대기열로 처리, --sync 를 붙이면 끝날 때까지 기다림)")
         print()
         print("예시:")
         print("  python update_match.py 'R1 M1' 'T1'")